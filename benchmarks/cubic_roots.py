@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020, Yoel Cortes-Pena <yoelcortes@gmail.com>
+#
+# This module is under the UIUC open-source license. See
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+Benchmark of the real arithmetic solution of cubic equations of state
+(`GCEOS.volume_solutions` with quick=True) against the closed form solution
+with complex arithmetic (quick=False). Reports the cost per call and the
+agreement of liquid and gas molar volumes across a T-P grid for each EOS.
+Run as a script: python benchmarks/cubic_roots.py
+"""
+import numpy as np
+from timeit import repeat
+from thermosteam.properties import eos
+
+EOSs = (eos.PR, eos.PR78, eos.PRSV, eos.PRSV2, eos.VDW, eos.RK,
+        eos.SRK, eos.APISRK, eos.TWUPR, eos.TWUSRK)
+
+#: Critical temperature [K], critical pressure [Pa], and accentric factor
+#: of pentane, water, and methane
+critical_points = ((469.7, 3370000., 0.251),
+                   (647.14, 22048320., 0.344),
+                   (190.56, 4599000., 0.011))
+
+def real_volumes(Vs):
+    Vs = [i.real for i in Vs if abs(i.imag) <= 1e-9 and i.real >= 0.]
+    return min(Vs), max(Vs), len(Vs) == 1
+
+def grid(Tc, Pc, N=40):
+    return [(T, P) for T in np.linspace(0.3 * Tc, 2 * Tc, N).tolist()
+            for P in np.logspace(3, np.log10(3 * Pc), N).tolist()]
+
+def agreement(EOS):
+    matches = total = 0
+    error = 0.
+    for Tc, Pc, omega in critical_points:
+        e = EOS(Tc=Tc, Pc=Pc, omega=omega, T=298.15, P=101325.)
+        for T, P in grid(Tc, Pc):
+            a_alpha = e.a_alpha_and_derivatives(T, full=False)
+            args = (T, P, e.b, e.delta, e.epsilon, a_alpha)
+            V_l, V_g, single = real_volumes(e.volume_solutions(*args, quick=False))
+            V_l_new, V_g_new, single_new = real_volumes(e.volume_solutions(*args))
+            total += 1
+            if single != single_new: continue
+            matches += 1
+            error = max(error, abs(V_l - V_l_new) / V_l, abs(V_g - V_g_new) / V_g)
+    return matches / total, error
+
+def time_per_call(EOS, N=2000):
+    Tc, Pc, omega = critical_points[0]
+    e = EOS(Tc=Tc, Pc=Pc, omega=omega, T=298.15, P=101325.)
+    TP = grid(Tc, Pc, 10)
+    args = [(T, P, e.b, e.delta, e.epsilon, e.a_alpha_and_derivatives(T, full=False))
+            for T, P in TP]
+    f = e.volume_solutions
+    n = N // len(args)
+    real = min(repeat(lambda: [f(*i) for i in args], number=n, repeat=5))
+    closed_form = min(repeat(lambda: [f(*i, quick=False) for i in args], number=n, repeat=5))
+    departures = min(repeat(lambda: [e.departures(*i) for i in TP], number=n, repeat=5))
+    T, P = np.array(grid(Tc, Pc)).T
+    departures_array = min(repeat(lambda: e.departures(T, P), number=5, repeat=5))
+    return [*[1e6 * i / (n * len(args)) for i in (real, closed_form, departures)],
+            1e6 * departures_array / (5 * T.size)]
+
+if __name__ == '__main__':
+    print(f"{'EOS':<7} {'real [us]':>9} {'complex [us]':>12} {'departures [us]':>15} "
+          f"{'array [us]':>10} {'same roots':>10} {'max rel. diff.':>14}")
+    for EOS in EOSs:
+        fraction, error = agreement(EOS)
+        real, closed_form, departures, departures_array = time_per_call(EOS)
+        print(f"{EOS.__name__:<7} {real:>9.2f} {closed_form:>12.2f} {departures:>15.2f} "
+              f"{departures_array:>10.2f} {fraction:>10.2%} {error:>14.1e}")
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020, Yoel Cortes-Pena <yoelcortes@gmail.com>
+#
+# This module is under the UIUC open-source license. See
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+Benchmark of cold `import thermosteam` time with data sources loaded on first
+access (default) vs. preloaded at import (as before lazy loading), with and
+without the binary cache of data tables. Each case runs in a fresh
+interpreter. Run as a script: python benchmarks/import_time.py
+"""
+import os
+import sys
+import subprocess
+import numpy as np
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+code = """
+from time import perf_counter
+start = perf_counter()
+import thermosteam
+{}
+print(perf_counter() - start)
+"""
+
+cases = {
+    'lazy (default)': ('', None),
+    'preloaded': ('thermosteam.properties.preload()', None),
+    'lazy, no binary cache': ('', ''),
+    'preloaded, no binary cache': ('thermosteam.properties.preload()', ''),
+}
+
+def import_time(statement, cache_folder, N=5):
+    env = os.environ.copy()
+    env['PYTHONPATH'] = os.pathsep.join([root, env.get('PYTHONPATH', '')])
+    if cache_folder is not None: env['THERMOSTEAM_DATA_CACHE'] = cache_folder
+    times = [float(subprocess.run([sys.executable, '-c', code.format(statement)],
+                                  env=env, capture_output=True, text=True,
+                                  check=True).stdout)
+             for i in range(N)]
+    return np.median(times)
+
+if __name__ == '__main__':
+    import_time('thermosteam.properties.preload()', None, 1) # Build binary cache
+    for name, (statement, cache_folder) in cases.items():
+        print(f"{name}: {1e3 * import_time(statement, cache_folder):.0f} ms")
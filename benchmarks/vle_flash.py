@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020, Yoel Cortes-Pena <yoelcortes@gmail.com>
+# 
+# This module is under the UIUC open-source license. See 
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+Benchmark of pressure-enthalpy flash methods of VLE objects ('bounded' vs 
+'newton'). Run as a script: python benchmarks/vle_flash.py
+"""
+import thermosteam as tmo
+import numpy as np
+from time import perf_counter
+
+chemicals = ['Water', 'Ethanol', 'Methanol', 'Propanol', 'Acetone', 
+             'Glycerol', 'AceticAcid', 'Butanol', 'Furfural', 'Hexane']
+
+class CountCalls:
+    __slots__ = ('f', 'calls')
+    
+    def __init__(self, f):
+        self.f = f
+        self.calls = 0
+        
+    def __call__(self, *args):
+        self.calls += 1
+        return self.f(*args)
+
+def create_streams(N=30, seed=0):
+    rng = np.random.default_rng(seed)
+    streams = []
+    for i in range(N):
+        s = tmo.Stream(None, T=rng.uniform(300, 420),
+                       **{i: rng.uniform(1, 100) for i in chemicals})
+        s.phases = 'lg'
+        streams.append((s, s.H + rng.uniform(-2e5, 2e6)))
+    return streams
+
+def benchmark(method, streams):
+    results = []
+    gamma_calls = 0
+    time = 0.
+    for s, H in streams:
+        s = s.copy()
+        vle = s.vle
+        vle.method = method
+        vle._setup()
+        bp = vle._bubble_point
+        dp = vle._dew_point
+        vle._gamma = bp.gamma = dp.gamma = gamma = CountCalls(bp.gamma)
+        start = perf_counter()
+        vle(H=H, P=101325)
+        time += perf_counter() - start
+        vle._gamma = bp.gamma = dp.gamma = gamma.f
+        gamma_calls += gamma.calls
+        results.append([s.T, s.imol['g'].sum()])
+    N = len(streams)
+    return time / N, gamma_calls / N, np.array(results)
+
+if __name__ == '__main__':
+    tmo.settings.set_thermo(chemicals)
+    streams = create_streams()
+    benchmark('bounded', streams[:1]) # Compile and warm up caches
+    time_bounded, calls_bounded, results_bounded = benchmark('bounded', streams)
+    time_newton, calls_newton, results_newton = benchmark('newton', streams)
+    print(f"{len(chemicals)} chemicals, {len(streams)} PH flashes")
+    print(f"bounded: {1e3 * time_bounded:.2f} ms/flash, {calls_bounded:.1f} activity coefficient evaluations/flash")
+    print(f"newton: {1e3 * time_newton:.2f} ms/flash, {calls_newton:.1f} activity coefficient evaluations/flash")
+    print(f"max temperature difference: {np.abs(results_bounded[:, 0] - results_newton[:, 0]).max():.2e} K")
+    print(f"max vapor flow difference: {np.abs(results_bounded[:, 1] - results_newton[:, 1]).max():.2e} kmol/hr")
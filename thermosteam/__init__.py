@@ -16,6 +16,7 @@ from . import (base,
 )
 from ._chemical import Chemical
 from ._chemicals import Chemicals, CompiledChemicals
+from ._chemical_cache import ChemicalCache
 from ._thermal_condition import ThermalCondition
 from . import mixture
 from ._thermo import Thermo
@@ -27,11 +28,12 @@ from . import (indexer,
 )
 from ._stream import Stream
 from ._multi_stream import MultiStream
+from ._stream_array import StreamArray
 from .base import functor
 from flexsolve import speed_up
 
-__all__ = ('Chemical', 'Chemicals', 'CompiledChemicals', 'Thermo', 'indexer',
-           'Stream', 'MultiStream', 'ThermalCondition', 'mixture', 'ThermoData',
+__all__ = ('Chemical', 'Chemicals', 'CompiledChemicals', 'ChemicalCache', 'Thermo', 'indexer',
+           'Stream', 'MultiStream', 'StreamArray', 'ThermalCondition', 'mixture', 'ThermoData',
            'settings', 'functor', 'properties', 'base', 'equilibrium',
            'units_of_measure', 'exceptions', 'functional', 'reaction',
            'utils', 'speed_up')
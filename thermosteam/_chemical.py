@@ -9,7 +9,7 @@
 """
 import thermosteam as tmo
 from flexsolve import IQ_interpolation
-from .utils import copy_maybe
+from .utils import copy_maybe, profiled
 from .properties.identifiers import chemical_metadata_from_any, pubchem_db
 from .properties.vapor_pressure import vapor_pressure_handle
 from .properties.phase_change import (normal_boiling_point_temperature,
@@ -70,6 +70,9 @@ def get_chemical_data(chemical):
     getfield = getattr
     return {i:getfield(chemical, i) for i in chemical.__slots__}
 
+def new_chemical(cls):
+    return object.__new__(cls)
+
 def unpickle_chemical(chemical_data):
     chemical = object.__new__(Chemical)
     setfield = setattr
@@ -530,10 +533,18 @@ class Chemical:
             phase = phase[0].lower()
             assert phase in ('s', 'l', 'g'), "phase must be either 's', 'l', or 'g'"
         if search_db:
-            metadata = chemical_metadata_from_any(search_ID)
-            data['metadata'] = metadata
-            self = cls.new(ID, metadata.CASs, eos, phase_ref, phase,
-                           **data)
+            chemical_cache = tmo.settings._chemical_cache
+            if chemical_cache is not None and not data and cls is Chemical:
+                key = chemical_cache.key(search_ID, eos, phase_ref, phase)
+                self = chemical_cache.load(key, ID)
+            else:
+                key = self = None
+            if not self:
+                metadata = chemical_metadata_from_any(search_ID)
+                data['metadata'] = metadata
+                self = cls.new(ID, metadata.CASs, eos, phase_ref, phase,
+                               **data)
+                if key: chemical_cache.save(key, self)
         else:
             self = cls.blank(ID, CAS, phase_ref, phase=phase, **data)
         if phase:
@@ -687,7 +698,9 @@ class Chemical:
                 handle._chemical = self
 
     def __reduce__(self):
-        return unpickle_chemical, (get_chemical_data(self),)
+        # The chemical is created (and memoized) before its data is pickled, 
+        # so that models referencing the chemical do not pickle copies of it
+        return new_chemical, (type(self),), (None, get_chemical_data(self))
     
     @property
     def phase_ref(self):
@@ -1249,6 +1262,7 @@ class Chemical:
         else:
             self._PSRK = PSRKGroupCounts()
 
+    @profiled('Chemical._init_data')
     def _init_data(self, CAS, MW, Tm, Tb, Tc, Pc, Vc, omega, Pt, Tt, Hfus,
                    dipole, atoms, similarity_variable, iscyclic_aliphatic):
         self._MW = MW
@@ -1293,10 +1307,12 @@ class Chemical:
         self._HHV = HHV
         self._combustion = combustion
 
+    @profiled('Chemical._init_eos')
     def _init_eos(self, eos, Tc, Pc, omega):
         self._eos = create_eos(eos, Tc, Pc, omega)
         self._eos_1atm = self._eos.to_TP(298.15, 101325)
 
+    @profiled('Chemical._init_handles')
     def _init_handles(self, CAS, MW, Tm, Tb, Tc, Pc, Zc, Vc, omega,
                       dipole, similarity_variable, iscyclic_aliphatic, eos,
                       has_hydroxyl):
@@ -1343,6 +1359,7 @@ class Chemical:
         # self.delta = SolubilityParameter(self)
         # self.molecular_diameter = MolecularDiameter(self)
 
+    @profiled('Chemical._estimate_missing_properties')
     def _estimate_missing_properties(self):
         # Melting temperature is a week function of pressure,
         # so assume the triple point temperature is the 
@@ -1379,6 +1396,7 @@ class Chemical:
                 omega = estimate_acentric_factor_LK(Tb, Tc, Pc)
             self._omega = omega
 
+    @profiled('Chemical._init_energies')
     def _init_energies(self, Cn, Hvap, Psat, Hfus, Tm, Tb, eos, eos_1atm,
                        phase_ref=None):        
         # Reference
@@ -1668,7 +1686,21 @@ class Chemical:
         return [i for i in (properties or _checked_properties) if not getfield(self, i)]
     
     def copy_models_from(self, other, names=None):
-        """Copy models from other."""
+        """
+        Copy models from other.
+        
+        Examples
+        --------
+        >>> from thermosteam import Chemical
+        >>> Octane = Chemical('Octane')
+        >>> Water = Chemical('Water')
+        >>> round(Octane.Cn.l.integrate_by_T(300., 350.))
+        13339
+        >>> Octane.copy_models_from(Water, ['Cn'])
+        >>> round(Octane.Cn.l.integrate_by_T(300., 350.))
+        3767
+        
+        """
         if names:
             for i in names:
                 if i not in _model_and_phase_properties:
@@ -1700,8 +1732,63 @@ class Chemical:
                     for i, model_handle in handle:
                         models = getfield(other_handle, i)._models.copy()
                         model_handle._models = models
+        ThermoModelHandle.revision += 1
         if {'Cn', 'Hvap'}.intersection(names): self.reset_free_energies()
-    
+
+    def fit_surrogates(self, rtol=1e-6, Tmin=None, Tmax=None):
+        """
+        Add piecewise Chebyshev surrogates (ChebyshevTDependentModel objects)
+        to all temperature dependent model handles for fast evaluation,
+        differentiation, and integration. Return a dictionary of the
+        maximum relative error of the surrogates by property.
+
+        Parameters
+        ----------
+        rtol=1e-6 : float, optional
+            Relative tolerance of the fits.
+        Tmin=None : float, optional
+            Minimum temperature of the fits [K].
+        Tmax=None : float, optional
+            Maximum temperature of the fits [K].
+
+        Examples
+        --------
+        >>> from thermosteam import Chemical
+        >>> Water = Chemical('Water')
+        >>> errors = Water.fit_surrogates(Tmin=273.15, Tmax=600.)
+        >>> sorted(errors)
+        ['Cn.g', 'Cn.l', 'Cn.s', 'Hvap', 'Psat', 'V.l', 'epsilon', 'kappa.g', 'mu.g', 'mu.l', 'sigma']
+        >>> max(errors.values()) < 1e-6
+        True
+        >>> round(Water.Psat(350.))
+        41620
+        >>> Water.remove_surrogates()
+
+        """
+        errors = {}
+        getfield = getattr
+        isa = isinstance
+        for name in _model_and_phase_properties:
+            handle = getfield(self, '_' + name)
+            if isa(handle, PhaseHandle):
+                for phase, phase_handle in handle:
+                    error = phase_handle.fit_surrogates(rtol, Tmin, Tmax)
+                    if error is not None: errors[name + '.' + phase] = error
+            else:
+                error = handle.fit_surrogates(rtol, Tmin, Tmax)
+                if error is not None: errors[name] = error
+        return errors
+
+    def remove_surrogates(self):
+        """Remove all piecewise Chebyshev surrogates."""
+        getfield = getattr
+        for name in _model_and_phase_handles:
+            handle = getfield(self, name)
+            if isinstance(handle, PhaseHandle):
+                for phase, phase_handle in handle: phase_handle.remove_surrogates()
+            else:
+                handle.remove_surrogates()
+
     @property
     def locked_state(self):
         """[str] Constant phase of chemical."""
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020, Yoel Cortes-Pena <yoelcortes@gmail.com>
+#
+# This module is under the UIUC open-source license. See
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+import os
+import pickle
+import hashlib
+from functools import lru_cache
+from .properties.readers import data_cache_version, get_user_cache_folder
+
+__all__ = ('ChemicalCache',)
+
+#: [str] Version of the format of cached chemicals.
+chemical_cache_version = '1'
+
+def get_chemical_cache_folder():
+    """
+    Return the default folder of the chemical cache (the "chemicals" 
+    folder in the user cache directory). The THERMOSTEAM_CHEMICAL_CACHE 
+    environment variable may be set to a custom folder.
+
+    """
+    folder = os.environ.get('THERMOSTEAM_CHEMICAL_CACHE')
+    if folder: return folder
+    return os.path.join(get_user_cache_folder(), 'chemicals')
+
+@lru_cache(maxsize=None)
+def databank_version():
+    """
+    Return a hash of the versions of the cache formats, the fields of
+    Chemical objects, and the names, sizes and modification times
+    of all databank files.
+
+    """
+    from ._chemical import Chemical
+    data_folder = os.path.join(os.path.dirname(__file__), 'properties', 'Data')
+    files = []
+    for root, folders, names in os.walk(data_folder):
+        if '__cache__' in folders: folders.remove('__cache__')
+        for name in names:
+            path = os.path.join(root, name)
+            stat = os.stat(path)
+            files.append((os.path.relpath(path, data_folder), stat.st_size, stat.st_mtime_ns))
+    files.sort()
+    version = repr((chemical_cache_version, data_cache_version, Chemical.__slots__, files))
+    return hashlib.sha256(version.encode()).hexdigest()
+
+def object_name(obj):
+    return f"{obj.__module__}.{obj.__qualname__}"
+
+
+class ChemicalCache:
+    """
+    Create a ChemicalCache object that stores Chemical objects found in the
+    database on disk, so that they can be loaded in following sessions
+    without searching and processing the database. Entries are keyed by
+    search ID, equation of state, phase arguments, and a hash of the
+    databank version (the cache is invalidated when databank files change).
+    Least recently used entries are removed when the cache exceeds its
+    maximum size.
+
+    Parameters
+    ----------
+    folder : str, optional
+        Folder of cached chemicals. Defaults to the THERMOSTEAM_CHEMICAL_CACHE
+        environment variable or "~/.cache/thermosteam/chemicals".
+    max_size : float, optional
+        Maximum size of the cache in bytes. Defaults to 100 MB.
+
+    Notes
+    -----
+    The cache is opt-in; set `thermosteam.settings.chemical_cache` to True
+    (or to a folder, or a ChemicalCache object) to use it when creating
+    Chemical objects.
+
+    Examples
+    --------
+    >>> import thermosteam as tmo
+    >>> import tempfile
+    >>> folder = tempfile.mkdtemp()
+    >>> tmo.settings.chemical_cache = folder
+    >>> Water = tmo.Chemical('Water') # Found in the database and saved
+    >>> cache = tmo.settings.chemical_cache
+    >>> len(cache)
+    1
+    >>> Water = tmo.Chemical('Water') # Loaded from the cache
+    >>> Water.Tb
+    373.124
+    >>> cache.clear()
+    >>> len(cache)
+    0
+    >>> tmo.settings.chemical_cache = None
+
+    """
+    __slots__ = ('folder', 'max_size')
+
+    #: [str] File extension of cached chemicals.
+    extension = '.pkl'
+
+    def __init__(self, folder=None, max_size=100e6):
+        self.folder = folder or get_chemical_cache_folder()
+        self.max_size = max_size
+
+    def key(self, search_ID, eos, phase_ref=None, phase=None):
+        """Return the key of a chemical."""
+        key = repr((search_ID, object_name(eos), phase_ref, phase, databank_version()))
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.folder, key + self.extension)
+
+    def load(self, key, ID):
+        """Return the cached chemical with a new ID, or None if not in the cache."""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f: chemical = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception: # Corrupt or outdated entry
+            self._remove(path)
+            return None
+        chemical._ID = ID
+        chemical._label_handles()
+        try: os.utime(path) # Mark as recently used
+        except OSError: pass
+        return chemical
+
+    def save(self, key, chemical):
+        """Save chemical to the cache. Return whether the chemical was saved."""
+        path = self._path(key)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            with open(temporary_path, 'wb') as f:
+                pickle.dump(chemical, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, path)
+        except Exception: # Read only file system or chemical with unpicklable models
+            self._remove(temporary_path)
+            return False
+        self.limit_size()
+        return True
+
+    def _remove(self, path):
+        try: os.remove(path)
+        except OSError: pass
+
+    def _entries(self):
+        folder = self.folder
+        extension = self.extension
+        try:
+            names = os.listdir(folder)
+        except OSError:
+            return []
+        entries = []
+        for name in names:
+            if not name.endswith(extension): continue
+            path = os.path.join(folder, name)
+            try: stat = os.stat(path)
+            except OSError: continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        return entries
+
+    def limit_size(self):
+        """Remove least recently used chemicals until the cache is within its maximum size."""
+        entries = self._entries()
+        size = sum([i[1] for i in entries])
+        if size <= self.max_size: return
+        entries.sort()
+        for mtime, file_size, path in entries:
+            self._remove(path)
+            size -= file_size
+            if size <= self.max_size: break
+
+    @property
+    def size(self):
+        """[int] Size of the cache in bytes."""
+        return sum([i[1] for i in self._entries()])
+
+    def clear(self):
+        """Remove all cached chemicals."""
+        for *_, path in self._entries(): self._remove(path)
+
+    def __len__(self):
+        return len(self._entries())
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.folder!r}, max_size={self.max_size:.3g})"
@@ -7,7 +7,7 @@
 # for license details.
 """
 """
-from .utils import read_only, repr_listed_values
+from .utils import read_only, repr_listed_values, profiled
 from .exceptions import UndefinedChemical
 from ._chemical import Chemical
 from .indexer import ChemicalIndexer
@@ -23,6 +23,35 @@ def must_compile(*args, **kwargs):
     raise TypeError("method valid only for compiled chemicals; "
                     "run <Chemicals>.compile() to compile")
 
+def build_chemical(ID, chemical_cache):
+    tmo.settings._chemical_cache = chemical_cache
+    return Chemical(ID)
+
+def build_chemicals(chemicals, processes=None):
+    """
+    Return a list of Chemical objects (in the same order) from chemical 
+    identifiers and/or Chemical objects. If `processes` is greater than 1, 
+    chemicals are created in a pool of worker processes and sent back 
+    pickled.
+    
+    """
+    isa = isinstance
+    chemicals = list(chemicals)
+    IDs = [i for i in chemicals if not isa(i, Chemical)]
+    N = len(IDs)
+    if processes and processes > 1 and N > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        processes = min(processes, N)
+        chunksize = max(1, N // (4 * processes))
+        chemical_cache = tmo.settings._chemical_cache
+        with ProcessPoolExecutor(processes) as executor:
+            new = list(executor.map(build_chemical, IDs, [chemical_cache] * N,
+                                    chunksize=chunksize))
+    else:
+        new = [Chemical(i) for i in IDs]
+    new = iter(new)
+    return [i if isa(i, Chemical) else next(new) for i in chemicals]
+
 def chemical_data_array(chemicals, attr):
     getfield = getattr
     data = np.asarray([getfield(i, attr) for i in chemicals], dtype=float)
@@ -46,6 +75,9 @@ class Chemicals:
            * PubChem CID, prefixed by 'PubChem='
            * SMILES (prefix with 'SMILES=' to ensure smiles parsing)
            * CAS number
+    processes : int, optional
+        Number of worker processes to create chemicals from identifiers 
+        in parallel. Chemicals are created sequentially by default.
     
     Examples
     --------
@@ -63,13 +95,9 @@ class Chemicals:
     
         
     """
-    def __init__(self, chemicals):
-        isa = isinstance
-        for chem in chemicals:
-            if isa(chem, Chemical):
-                setattr(self, chem.ID, chem)
-            else:
-                setattr(self, chem, Chemical(chem))
+    def __init__(self, chemicals, processes=None):
+        for chem in build_chemicals(chemicals, processes):
+            setattr(self, chem.ID, chem)
     
     def __getnewargs__(self):
         return (tuple(self),)
@@ -159,8 +187,39 @@ class Chemicals:
         CompiledChemicals._compile(self)
         setattr(self, '__class__', CompiledChemicals)
     
+    def fit_surrogates(self, rtol=1e-6, Tmin=None, Tmax=None):
+        """
+        Add piecewise Chebyshev surrogates to all temperature dependent
+        model handles of each chemical. Return a dictionary of the
+        maximum relative error of the surrogates by property by chemical.
+
+        Parameters
+        ----------
+        rtol=1e-6 : float, optional
+            Relative tolerance of the fits.
+        Tmin=None : float, optional
+            Minimum temperature of the fits [K].
+        Tmax=None : float, optional
+            Maximum temperature of the fits [K].
+
+        Examples
+        --------
+        >>> from thermosteam import CompiledChemicals
+        >>> chemicals = CompiledChemicals(['Water', 'Ethanol'])
+        >>> errors = chemicals.fit_surrogates(Tmin=273.15, Tmax=500.)
+        >>> max([max(i.values()) for i in errors.values()]) < 1e-6
+        True
+        >>> chemicals.remove_surrogates()
+
+        """
+        return {i.ID: i.fit_surrogates(rtol, Tmin, Tmax) for i in self}
+
+    def remove_surrogates(self):
+        """Remove all piecewise Chebyshev surrogates."""
+        for i in self: i.remove_surrogates()
+
     kwarray = array = index = indices = must_compile
-        
+
     def __len__(self):
         return len(self.__dict__)
     
@@ -194,6 +253,9 @@ class CompiledChemicals(Chemicals):
               * PubChem CID, prefixed by 'PubChem='
               * SMILES (prefix with 'SMILES=' to ensure smiles parsing)
               * CAS number
+    processes : int, optional
+        Number of worker processes to create chemicals from identifiers 
+        in parallel. Chemicals are created sequentially by default.
         
     Attributes
     ----------
@@ -234,6 +296,11 @@ class CompiledChemicals(Chemicals):
     >>> chemicals.Water, chemicals.Ethanol
     (Chemical('Water'), Chemical('Ethanol'))
     
+    Chemicals may be created in parallel processes:
+        
+    >>> CompiledChemicals(['Water', 'Ethanol', 'Methanol'], processes=2)
+    CompiledChemicals([Water, Ethanol, Methanol])
+    
     Note that because they are compiled, the append and extend methods do not work:
         
     >>> # Propane = Chemical('Propane')
@@ -244,10 +311,8 @@ class CompiledChemicals(Chemicals):
     """  
     _cache = {}
     
-    def __new__(cls, chemicals):
-        isa = isinstance
-        chemicals = tuple([chem if isa(chem, Chemical) else Chemical(chem)
-                           for chem in chemicals])        
+    def __new__(cls, chemicals, processes=None):
+        chemicals = tuple(build_chemicals(chemicals, processes))
         cache = cls._cache
         if chemicals in cache:
             self = cache[chemicals]
@@ -259,6 +324,9 @@ class CompiledChemicals(Chemicals):
             self._compile()
         return self
     
+    def __init__(self, chemicals, processes=None):
+        pass # Chemicals are set in __new__
+    
     def __dir__(self):
         return ('append', 'array', 'compile', 'extend', 
                 'get_combustion_reactions', 'get_index',
@@ -293,6 +361,7 @@ class CompiledChemicals(Chemicals):
                      for i in self if i.combustion]
         return tmo.reaction.ParallelReaction(reactions)
 
+    @profiled('CompiledChemicals._compile')
     def _compile(self):
         dct = self.__dict__
         tuple_ = tuple
@@ -292,7 +292,7 @@ class MultiStream(Stream):
     def phases(self, phases):
         if len(phases) == 1:
             self.phase = phases[0]
-        phases = sorted(phases)
+        phases = tuple(sorted(phases))
         if phases != self.phases:
             self._imol = self._imol.to_material_indexer(phases)
             self._init_cache()
@@ -19,11 +19,15 @@ class Settings:
     __slots__ = ('_thermo',
                  '_phase_names',
                  '_debug',
+                 '_cache_mixture_properties',
+                 '_chemical_cache',
     )
     
     def __init__(self):
         self._thermo = None
         self._debug = False
+        self._cache_mixture_properties = False
+        self._chemical_cache = None
         self._phase_names = {'s': 'Solid',
                              'l': 'Liquid',
                              'g': 'Gas',
@@ -38,6 +42,44 @@ class Settings:
     def debug(self, debug):
         self._debug = bool(debug)
     
+    @property
+    def cache_mixture_properties(self):
+        """[bool] If True, mixture properties are stored in and retrieved
+        from the mixture's property cache (if any)."""
+        return self._cache_mixture_properties
+    @cache_mixture_properties.setter
+    def cache_mixture_properties(self, cache_mixture_properties):
+        self._cache_mixture_properties = bool(cache_mixture_properties)
+    
+    @property
+    def chemical_cache(self):
+        """[ChemicalCache or None] Cache of chemicals found in the database 
+        that persists across sessions. May be set to True (default folder), 
+        a folder, a ChemicalCache object, or None (no cache; default)."""
+        return self._chemical_cache
+    @chemical_cache.setter
+    def chemical_cache(self, chemical_cache):
+        if chemical_cache is True:
+            chemical_cache = tmo.ChemicalCache()
+        elif isinstance(chemical_cache, str):
+            chemical_cache = tmo.ChemicalCache(chemical_cache)
+        elif not (chemical_cache is None or isinstance(chemical_cache, tmo.ChemicalCache)):
+            raise ValueError("chemical_cache must be a ChemicalCache object, "
+                             "a folder, True, or None")
+        self._chemical_cache = chemical_cache
+    
+    @property
+    def profile(self):
+        """[bool] If True, data table loads, Chemical construction phases, and
+        the compilation of chemicals are recorded by `thermosteam.utils.profiler`
+        (wall time and memory allocated). May also be enabled by setting the 
+        THERMOSTEAM_PROFILE environment variable."""
+        return tmo.utils.profiler.enabled
+    @profile.setter
+    def profile(self, profile):
+        if profile: tmo.utils.profiler.enable()
+        else: tmo.utils.profiler.disable()
+    
     @property
     def phase_names(self):
         """[dict] All phase definitions."""
@@ -9,11 +9,15 @@
 """
 import numpy as np
 import thermosteam as tmo
+from sys import getrefcount
+from contextlib import contextmanager
 from . import indexer
 from . import equilibrium as eq
 from . import functional as fn
 from . import units_of_measure as thermo_units
-from .exceptions import DimensionError
+from .exceptions import DimensionError, DomainError
+from .base import ThermoModelHandle
+from ._phase import Phase
 from .properties.elements import array_to_atoms, atomic_index
 from . import utils
 
@@ -25,6 +29,54 @@ mol_units = indexer.ChemicalMolarFlowIndexer.units
 mass_units = indexer.ChemicalMassFlowIndexer.units
 vol_units = indexer.ChemicalVolumetricFlowIndexer.units
 
+def mixture_enthalpy(streams):
+    """
+    Return the total enthalpy flow rate [kJ/hr] of all streams. Molar
+    flow rates of streams that share the same mixture model and phase 
+    are stacked and evaluated in bulk.
+    
+    """
+    groups = {}
+    isa = isinstance
+    for i in streams:
+        imol = i._imol
+        mixture = i._thermo.mixture
+        T, P = i._thermal_condition
+        if isa(imol, indexer.MaterialIndexer):
+            phase_data = [(j, k) for j, k in zip(imol._phases, imol._data) if k.any()]
+        else:
+            phase_data = [(imol._phase.phase, imol._data)]
+        for phase, data in phase_data:
+            key = (mixture, phase)
+            if key in groups:
+                mol, Ts, Ps = groups[key]
+            else:
+                groups[key] = mol, Ts, Ps = [], [], []
+            mol.append(data)
+            Ts.append(T)
+            Ps.append(P)
+    return sum([mixture.H_array(phase, np.array(mol), np.array(T), np.array(P)).sum()
+                for (mixture, phase), (mol, T, P) in groups.items()])
+
+#: dict[tuple[Chemical, float, int], float] Saturation temperatures by 
+#: chemical, pressure, and revision of thermodynamic models (so that changes 
+#: to vapor pressure models are accounted for).
+saturation_temperature_cache = {}
+
+def saturation_temperature(chemical, P):
+    """
+    Return the saturation temperature of a chemical at given pressure 
+    (nan for chemicals without vapor pressure models).
+    
+    """
+    cache = saturation_temperature_cache
+    key = (chemical, P, ThermoModelHandle.revision)
+    if key in cache: return cache[key]
+    if len(cache) > 1000: cache.clear()
+    Tsat = chemical.Tsat(P) if chemical._Psat else None
+    cache[key] = Tsat = np.nan if Tsat is None else Tsat
+    return Tsat
+
 # %%
 
 @utils.thermo_user
@@ -218,6 +270,12 @@ class Stream:
                                               N=7)
 
     _flow_cache = {}
+    
+    #: [dict] Released streams by Thermo object (class attribute).
+    _pool = {}
+    
+    #: [int] Maximum number of released streams kept for each Thermo object (class attribute).
+    pool_size = 100
 
     def __init__(self, ID= '', flow=(), phase='l', T=298.15, P=101325.,
                  units='kmol/hr', price=0., thermo=None, **chemical_flows):
@@ -780,11 +838,14 @@ class Stream:
     def mix_from(self, others):
         """
         Mix all other streams into this one, ignoring its initial contents.
-        
+        Enthalpies of all streams are evaluated in bulk and the temperature
+        is solved by energy balance starting from the flow weighted
+        temperature of all streams.
+
         Examples
         --------
         >>> import thermosteam as tmo
-        >>> tmo.settings.set_thermo(['Water', 'Ethanol']) 
+        >>> tmo.settings.set_thermo(['Water', 'Ethanol'])
         >>> s1 = tmo.Stream('s1', Water=20, Ethanol=10, units='kg/hr')
         >>> s2 = s1.copy()
         >>> s1.mix_from([s1, s2])
@@ -793,7 +854,18 @@ class Stream:
          phase: 'l', T: 298.15 K, P: 101325 Pa
          flow (kg/hr): Water    40
                        Ethanol  20
-        
+
+        When mixing streams of different phases, the phase is selected
+        given the bounds of the bubble and dew points:
+
+        >>> liquid = tmo.Stream('liquid', Water=1, T=300)
+        >>> vapor = tmo.Stream('vapor', Water=10, phase='g', T=600)
+        >>> s1.mix_from([liquid, vapor])
+        >>> s1.show()
+        Stream: s1
+         phase: 'g', T: 454.63 K, P: 101325 Pa
+         flow (kmol/hr): Water  11
+
         """
         others = [i for i in others if i]
         N_others = len(others)
@@ -802,20 +874,64 @@ class Stream:
         elif N_others == 1:
             self.copy_like(others[0])
         else:
+            H = mixture_enthalpy(others)
+            F_mol = np.array([i.F_mol for i in others])
+            F_mol_total = F_mol.sum()
+            T = (F_mol @ [i.T for i in others]) / F_mol_total if F_mol_total else self.T
+            phase = self.phase
+            check_phase = any([i.phase != phase for i in others])
             self._imol.mix_from([i._imol for i in others])
-            H = sum([i.H for i in others])
-            try: self.H = H
-            except Exception as error:
-                phase = self.phase.lower()
-                if phase == 'g':
-                     # Maybe too much heat, gas must be present
-                    self.phase = 'l'
-                elif phase == 'l':
-                    # Maybe too little heat, liquid must be present
-                    self.phase = 'g'
-                else:
-                    raise error
-                self.H = H
+            self.T = T
+            self._solve_mixture_T(H, check_phase)
+    
+    def _solve_mixture_T(self, H, check_phase=True):
+        """
+        Solve temperature by energy balance given the enthalpy flow rate 
+        [kJ/hr] (the current temperature is used as the initial guess). 
+        If `check_phase` is True, the phase of single phase streams is 
+        first checked against the bounds of the bubble and dew points given 
+        by the saturation temperatures of chemicals in the stream (no 
+        check is needed to mix streams of the same phase).
+        
+        """
+        phase = self.phase
+        if check_phase and phase in ('l', 'g'):
+            mol = self.mol
+            nonzeros = mol != 0
+            index = self.chemicals.get_vle_indices(nonzeros)
+            if index.size and index.size == nonzeros.sum():
+                P = self.P
+                chemicals = self.chemicals.tuple
+                mixture = self.mixture
+                try:
+                    Tsats = np.array([saturation_temperature(chemicals[i], P) for i in index])
+                    Tsats = Tsats[~np.isnan(Tsats)]
+                    if Tsats.size:
+                        if phase == 'l':
+                            # Above the dew point, only vapor may be present
+                            T_dew_max = Tsats.max()
+                            if H > mixture.H('g', mol, T_dew_max, P):
+                                self.phase = 'g'
+                                self.T = max(self.T, T_dew_max)
+                        else:
+                            # Below the bubble point, only liquid may be present
+                            T_bubble_min = Tsats.min()
+                            if H < mixture.H('l', mol, T_bubble_min, P):
+                                self.phase = 'l'
+                                self.T = min(self.T, T_bubble_min)
+                except (DomainError, ArithmeticError, ValueError): pass
+        try: self.H = H
+        except Exception as error:
+            phase = self.phase.lower()
+            if phase == 'g':
+                 # Maybe too much heat, gas must be present
+                self.phase = 'l'
+            elif phase == 'l':
+                # Maybe too little heat, liquid must be present
+                self.phase = 'g'
+            else:
+                raise error
+            self.H = H
             
     def split_to(self, s1, s2, split):
         """
@@ -1031,6 +1147,133 @@ class Stream:
             else:
                 mol[index] = 0
     
+    @classmethod
+    def acquire(cls, phase='l', T=298.15, P=101325., thermo=None):
+        """
+        Return an empty (single phase) stream, reusing a released stream 
+        when available. Release the stream (with `release`) once it is no
+        longer needed.
+        
+        Examples
+        --------
+        >>> import thermosteam as tmo
+        >>> tmo.settings.set_thermo(['Water', 'Ethanol'])
+        >>> s1 = tmo.Stream.acquire(T=350)
+        >>> s1.imol['Water'] = 2
+        >>> s1.release()
+        >>> s2 = tmo.Stream.acquire()
+        >>> s2 is s1, s2.T, s2.F_mol
+        (True, 298.15, 0.0)
+        >>> s2.release()
+        
+        """
+        thermo = tmo.settings.get_default_thermo(thermo)
+        pool = Stream._pool.get(thermo)
+        if not pool: return Stream(None, phase=phase, T=T, P=P, thermo=thermo)
+        self = pool.pop()
+        self._imol._phase.phase = phase
+        thermal_condition = self._thermal_condition
+        thermal_condition.T = T
+        thermal_condition.P = P
+        return self
+    
+    def release(self):
+        """
+        Empty the stream and make it available to `Stream.acquire`. The 
+        stream must not be used afterwards. Streams that share data 
+        with other streams (e.g., through `link_with`, `proxy`, or 
+        `flow_proxy`) are unlinked first, so that other streams are not 
+        affected when the stream is reused. Multi-phase streams and
+        streams connected to unit operations are not reused.
+        
+        Examples
+        --------
+        >>> import thermosteam as tmo
+        >>> tmo.settings.set_thermo(['Water', 'Ethanol'])
+        >>> s1 = tmo.Stream('s1', Water=20, units='kg/hr')
+        >>> s2 = tmo.Stream.acquire()
+        >>> s2.link_with(s1)
+        >>> s2.release()
+        >>> s1.show(flow='kg/hr')
+        Stream: s1
+         phase: 'l', T: 298.15 K, P: 101325 Pa
+         flow (kg/hr): Water  20
+        
+        Proxies keep their data after the stream is released and reused:
+        
+        >>> s3 = tmo.Stream.acquire()
+        >>> s3.imol['Water'] = 1.
+        >>> p = s3.proxy()
+        >>> s3.release()
+        >>> s4 = tmo.Stream.acquire(T=350.)
+        >>> s4 is s3, p.imol is s4.imol, p.T
+        (True, False, 298.15)
+        >>> s4.imol['Ethanol'] = 2.
+        >>> p.mol
+        array([1., 0.])
+        >>> s4.release()
+        
+        """
+        if type(self) is not Stream or self._sink or self._source: return
+        imol = self._imol
+        if type(imol._phase) is not Phase: return
+        pool = Stream._pool
+        thermo = self._thermo
+        if thermo in pool:
+            streams = pool[thermo]
+            if len(streams) >= self.pool_size: return
+        else:
+            pool[thermo] = streams = []
+        imol._data_cache.clear()
+        # Reference counts include the attribute and the argument (and the
+        # local variable for the indexer); additional references are held 
+        # by proxies, linked streams, or views
+        if getrefcount(imol) > 3:
+            self._imol = imol = imol._copy_without_data()
+            imol._data = np.zeros(self.chemicals.size)
+            self._thermal_condition = self._thermal_condition.copy()
+            self._init_cache()
+        elif (getrefcount(imol._data) > 2 
+            or getrefcount(imol._phase) > 2
+            or getrefcount(self._thermal_condition) > 2):
+            self.unlink()
+        else:
+            imol._data[:] = 0.
+        ID = self._ID
+        registry = self.registry
+        if registry.search(ID) is self: delattr(registry, ID)
+        self._ID = self._take_unregistered_ticket()
+        self._price = 0.
+        streams.append(self)
+    
+    @classmethod
+    @contextmanager
+    def scratch(cls, other=None, phase='l', T=298.15, P=101325., thermo=None):
+        """
+        Return a context manager that acquires a stream (like the 
+        `other` stream, if given) and releases it at exit.
+        
+        Examples
+        --------
+        >>> import thermosteam as tmo
+        >>> tmo.settings.set_thermo(['Water', 'Ethanol'])
+        >>> s1 = tmo.Stream('s1', Water=20, Ethanol=10, units='kg/hr')
+        >>> with tmo.Stream.scratch(s1) as s:
+        ...     s.imol['Water'] = 0.
+        ...     round(s.F_mass, 1)
+        10.0
+        
+        """
+        if other is None:
+            stream = cls.acquire(phase, T, P, thermo)
+        else:
+            stream = cls.acquire(thermo=other._thermo)
+            stream.copy_like(other)
+        try: 
+            yield stream
+        finally:
+            stream.release()
+    
     def copy(self, ID=None):
         """
         Return a copy of the stream.
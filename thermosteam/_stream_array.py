@@ -0,0 +1,487 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020, Yoel Cortes-Pena <yoelcortes@gmail.com>
+#
+# This module is under the UIUC open-source license. See
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+import numpy as np
+import thermosteam as tmo
+from . import indexer
+from . import utils
+from ._phase import Phase
+from ._stream import Stream
+from ._thermal_condition import ThermalCondition
+from .exceptions import InfeasibleRegion
+
+__all__ = ('StreamArray',)
+
+# %% Utilities
+
+class ThermalConditionView(ThermalCondition):
+    """
+    Create a ThermalConditionView object that reads and writes temperature
+    and pressure from a 1d array of length 2 (e.g., a row of the
+    thermal conditions of a StreamArray).
+
+    """
+    __slots__ = ('_data',)
+
+    def __init__(self, data):
+        self._data = data
+
+    @property
+    def _T(self):
+        return float(self._data[0])
+    @_T.setter
+    def _T(self, T):
+        self._data[0] = T
+
+    @property
+    def _P(self):
+        return float(self._data[1])
+    @_P.setter
+    def _P(self, P):
+        self._data[1] = P
+
+    def copy(self):
+        """Return a copy (not linked to the data)."""
+        return ThermalCondition(self._T, self._P)
+
+
+class StreamView(Stream):
+    """
+    Create a StreamView object, a Stream object that shares data with a row
+    of a StreamArray. As rows store a single phase, phase equilibrium 
+    (e.g., `vle` and `lle`) and setting multiple phases raise a 
+    RuntimeError; copies are Stream objects with their own data.
+
+    """
+    __slots__ = ()
+
+    @property
+    def phases(self):
+        """tuple[str] All phases present."""
+        return (self.phase,)
+    @phases.setter
+    def phases(self, phases):
+        if len(phases) != 1:
+            raise RuntimeError('a row of a StreamArray can only have one phase; '
+                               'copy the stream to use multiple phases')
+        self.phase = phases[0]
+
+    def copy(self, ID=None):
+        """Return a copy of the stream (with its own data)."""
+        new = Stream.copy(self, ID)
+        new.__class__ = Stream
+        return new
+    __copy__ = copy
+
+
+def row_fractions(values):
+    """Return values divided by row totals (empty rows are left as zeros)."""
+    totals = values.sum(1, keepdims=True)
+    fractions = np.zeros_like(values)
+    np.divide(values, totals, out=fractions, where=totals != 0.)
+    return fractions
+
+def per_flow(values, F):
+    """Return values divided by flow rates (NaN for empty streams)."""
+    ratios = np.full_like(values, np.nan)
+    np.divide(values, F, out=ratios, where=F != 0.)
+    return ratios
+
+def phase_groups(phases):
+    """Return a list of phase-index pairs, where index selects rows of the given phase."""
+    unique = set(phases)
+    if len(unique) == 1: return [(phases[0], slice(None))]
+    phases = np.array(phases, object)
+    return [(i, np.flatnonzero(phases == i)) for i in sorted(unique)]
+
+
+# %% Stream array
+
+@utils.thermo_user
+class StreamArray:
+    """
+    Create a StreamArray object that stores the molar flow rates of many
+    single phase streams as rows of a contiguous 2d array, along with arrays
+    of temperatures, pressures and phases. Net flow rates, compositions,
+    enthalpies, heat capacities, and molar volumes are evaluated for all
+    streams at once through the mixture model. Integer indexing returns a
+    StreamView object, a stream that shares data with the row (zero-copy), 
+    and basic slicing returns a StreamArray that shares data with the 
+    selected rows. As rows are single phase, phase equilibrium on a 
+    StreamView raises a RuntimeError (copy the stream instead). Empty 
+    streams have zero compositions and undefined (NaN) molar properties.
+
+    Parameters
+    ----------
+    mol : int or 2d array
+        Number of (empty) streams or molar flow rates of each stream [kmol/hr].
+    phases : str or Iterable[str], optional
+        Phase of all streams or of each stream. Defaults to 'l'.
+    T : float or 1d array, optional
+        Temperature of all streams or of each stream [K]. Defaults to 298.15.
+    P : float or 1d array, optional
+        Pressure of all streams or of each stream [Pa]. Defaults to 101325.
+    thermo : Thermo, optional
+        Thermo object to estimate thermodynamic properties. Defaults to
+        `thermosteam.settings.get_thermo()`.
+
+    Examples
+    --------
+    Create an array of 3 streams:
+
+    >>> import thermosteam as tmo
+    >>> tmo.settings.set_thermo(['Water', 'Ethanol'])
+    >>> streams = tmo.StreamArray([[10, 2], [5, 5], [0, 3]], T=[300, 320, 340])
+    >>> streams
+    <StreamArray: 3 streams>
+    >>> streams.F_mol
+    array([12., 10.,  3.])
+    >>> streams.F_mass
+    array([272.29 , 320.419, 138.205])
+    >>> streams.z_mol
+    array([[0.833, 0.167],
+           [0.5  , 0.5  ],
+           [0.   , 1.   ]])
+
+    Enthalpy flow rates [kJ/hr], molar heat capacities [J/mol/K], and molar
+    volumes [m^3/mol] of all streams are evaluated at once:
+
+    >>> streams.H
+    array([ 1809.339, 20977.516, 15258.737])
+    >>> streams.Cn
+    array([ 81.556,  98.484, 132.031])
+    >>> streams.V
+    array([2.486e-05, 3.916e-05, 6.160e-05])
+
+    Rows are streams that share data with the array:
+
+    >>> s = streams[1]
+    >>> s.T, s.mol
+    (320.0, array([5., 5.]))
+    >>> s.T = 330
+    >>> s.imol['Water'] = 4
+    >>> streams.T
+    array([300., 330., 340.])
+    >>> streams.mol[1]
+    array([4., 5.])
+
+    Phase equilibrium requires a copy of the row:
+
+    >>> s.vle(T=360, P=101325)
+    Traceback (most recent call last):
+    RuntimeError: a row of a StreamArray can only have one phase; copy the stream to use multiple phases
+    >>> s = s.copy()
+    >>> s.vle(T=360, P=101325)
+    >>> s.phases
+    ('g', 'l')
+
+    Split all streams and mix them:
+
+    >>> top, bottom = streams.split([0.5, 0.2])
+    >>> top.mol
+    array([[5. , 0.4],
+           [2. , 1. ],
+           [0. , 0.6]])
+    >>> mixture = streams.mix()
+    >>> round(mixture.T, 2), mixture.mol
+    (318.72, array([14., 10.]))
+
+    """
+    __slots__ = ('_mol', '_TP', '_phases', '_thermo')
+
+    def __init__(self, mol, phases='l', T=298.15, P=101325., thermo=None):
+        chemicals = self._load_thermo(thermo).chemicals
+        if isinstance(mol, int):
+            mol = np.zeros((mol, chemicals.size))
+        else:
+            mol = np.array(mol, float, order='C', ndmin=2)
+            if mol.ndim != 2 or mol.shape[1] != chemicals.size:
+                raise ValueError(f'molar flow rates must be a 2d array with {chemicals.size} columns')
+        N = mol.shape[0]
+        self._mol = mol
+        self._TP = np.empty((N, 2))
+        if isinstance(phases, str):
+            self._phases = [Phase(phases) for i in range(N)]
+        else:
+            self._phases = [Phase(i) for i in phases]
+            if len(self._phases) != N: raise ValueError('number of phases must be equal to number of streams')
+        self.T = T
+        self.P = P
+
+    @classmethod
+    def from_streams(cls, streams, thermo=None):
+        """
+        Return a StreamArray object with copies of the flow rates and
+        thermal conditions of the given (single phase) streams.
+
+        Examples
+        --------
+        >>> import thermosteam as tmo
+        >>> tmo.settings.set_thermo(['Water', 'Ethanol'])
+        >>> s1 = tmo.Stream('s1', Water=10)
+        >>> s2 = tmo.Stream('s2', Ethanol=10, phase='g', T=360)
+        >>> streams = tmo.StreamArray.from_streams([s1, s2])
+        >>> streams.phases
+        ('l', 'g')
+
+        """
+        streams = list(streams)
+        if any([isinstance(i, tmo.MultiStream) for i in streams]):
+            raise ValueError('multi-phase streams cannot be stored in a StreamArray')
+        if thermo is None and streams: thermo = streams[0]._thermo
+        chemicals = tmo.settings.get_default_thermo(thermo).chemicals
+        mol = np.array([i.mol for i in streams], float).reshape([len(streams), chemicals.size])
+        return cls(mol, [i.phase for i in streams],
+                   [i.T for i in streams], [i.P for i in streams], thermo)
+
+    @classmethod
+    def _from_data(cls, mol, TP, phases, thermo):
+        new = cls.__new__(cls)
+        new._mol = mol
+        new._TP = TP
+        new._phases = phases
+        new._thermo = thermo
+        return new
+
+    def copy(self):
+        """Return a copy of the stream array."""
+        return self._from_data(self._mol.copy(), self._TP.copy(),
+                               [i.copy() for i in self._phases], self._thermo)
+    __copy__ = copy
+
+    def stream(self, index, ID=None):
+        """Return a StreamView object that shares data with the row at the given index."""
+        mol = self._mol[index]
+        if mol.ndim != 1: raise IndexError('index must be an integer')
+        new = StreamView.__new__(StreamView)
+        new._sink = new._source = None
+        new._thermo = thermo = self._thermo
+        new._imol = indexer.ChemicalMolarFlowIndexer.from_data(
+            mol, self._phases[index], thermo.chemicals, False
+        )
+        new._thermal_condition = ThermalConditionView(self._TP[index])
+        new._init_cache()
+        new.price = 0.
+        new.ID = ID
+        return new
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)): return self.stream(index)
+        mol = self._mol[index]
+        if mol.ndim != 2: raise IndexError('only integers, slices, and 1d arrays are valid indices')
+        phases = self._phases
+        if isinstance(index, slice):
+            phases = phases[index]
+        else:
+            phases = [phases[i].copy() for i in np.arange(len(phases))[index]]
+        return self._from_data(mol, self._TP[index], phases, self._thermo)
+
+    def __iter__(self):
+        stream = self.stream
+        for i in range(len(self._phases)): yield stream(i)
+
+    def __len__(self):
+        return len(self._phases)
+
+    @property
+    def mol(self):
+        """[2d array] Molar flow rates of each stream in kmol/hr."""
+        return self._mol
+    @mol.setter
+    def mol(self, value):
+        mol = self._mol
+        if mol is not value: mol[:] = value
+
+    @property
+    def mass(self):
+        """[2d array] Mass flow rates of each stream in kg/hr (a copy)."""
+        return self._mol * self.chemicals.MW
+
+    @property
+    def T(self):
+        """[1d array] Temperature of each stream in Kelvin."""
+        return self._TP[:, 0]
+    @T.setter
+    def T(self, T):
+        T = np.asarray(T, float)
+        if (T < 0.).any(): raise InfeasibleRegion('negative temperature')
+        self._TP[:, 0] = T
+
+    @property
+    def P(self):
+        """[1d array] Pressure of each stream in Pascal."""
+        return self._TP[:, 1]
+    @P.setter
+    def P(self, P):
+        P = np.asarray(P, float)
+        if (P < 0.).any(): raise InfeasibleRegion('negative pressure')
+        self._TP[:, 1] = P
+
+    @property
+    def phases(self):
+        """tuple[str] Phase of each stream."""
+        return tuple([i.phase for i in self._phases])
+    @phases.setter
+    def phases(self, phases):
+        if isinstance(phases, str):
+            for i in self._phases: i.phase = phases
+        else:
+            phases = tuple(phases)
+            if len(phases) != len(self._phases):
+                raise ValueError('number of phases must be equal to number of streams')
+            for i, j in zip(self._phases, phases): i.phase = j
+
+    ### Net flow properties ###
+
+    @property
+    def F_mol(self):
+        """[1d array] Total molar flow rate of each stream in kmol/hr."""
+        return self._mol.sum(1)
+    @property
+    def F_mass(self):
+        """[1d array] Total mass flow rate of each stream in kg/hr."""
+        return self._mol @ self.chemicals.MW
+    @property
+    def F_vol(self):
+        """[1d array] Total volumetric flow rate of each stream in m3/hr."""
+        return 1000. * self._evaluate('V_array', True)
+    @property
+    def H(self):
+        """[1d array] Enthalpy flow rate of each stream in kJ/hr."""
+        return self._evaluate('H_array', True)
+    @property
+    def C(self):
+        """[1d array] Heat capacity flow rate of each stream in kJ/K/hr."""
+        return self._evaluate('Cn_array', False)
+    @property
+    def Hf(self):
+        """[1d array] Enthalpy of formation flow rate of each stream in kJ/hr."""
+        return self._mol @ self.chemicals.Hf
+    @property
+    def Hnet(self):
+        """[1d array] Total enthalpy flow rate (including heats of formation) of each stream in kJ/hr."""
+        return self.H + self.Hf
+
+    def solve_T(self, H, xtol=1e-6, maxiter=20):
+        """
+        Set the temperature of each stream to match the enthalpy flow rates
+        `H` [kJ/hr], solving all streams at once with a vectorized Newton
+        method. Return a boolean array of whether each stream converged
+        (streams that do not converge are left at their initial temperature).
+
+        Examples
+        --------
+        >>> import thermosteam as tmo
+        >>> tmo.settings.set_thermo(['Water', 'Ethanol'])
+        >>> streams = tmo.StreamArray([[10, 2], [5, 5]], T=[300, 320])
+        >>> H = streams.H + [1000., 2000.]
+        >>> streams.solve_T(H)
+        array([ True,  True])
+        >>> streams.T.round(2)
+        array([301.02, 322.03])
+        >>> streams.solve_T([H[0], 1e9])
+        array([ True, False])
+        >>> streams.T.round(2)
+        array([301.02, 322.03])
+
+        """
+        mol = self._mol
+        TP = self._TP
+        N = mol.shape[0]
+        H = np.broadcast_to(np.asarray(H, float), (N,))
+        converged = np.empty(N, bool)
+        solve_T_array = self.mixture.solve_T_array
+        for phase, index in phase_groups(self.phases):
+            TP[index, 0], converged[index] = solve_T_array(
+                phase, mol[index], H[index], TP[index, 0], TP[index, 1], xtol, maxiter
+            )
+        return converged
+
+    ### Composition properties ###
+
+    @property
+    def z_mol(self):
+        """[2d array] Molar composition of each stream."""
+        return row_fractions(self._mol)
+    @property
+    def z_mass(self):
+        """[2d array] Mass composition of each stream."""
+        return row_fractions(self._mol * self.chemicals.MW)
+    @property
+    def MW(self):
+        """[1d array] Overall molecular weight of each stream."""
+        return per_flow(self.F_mass, self.F_mol)
+    @property
+    def Cn(self):
+        """[1d array] Molar heat capacity of each stream [J/mol/K]."""
+        return per_flow(self.C, self.F_mol)
+    @property
+    def V(self):
+        """[1d array] Molar volume of each stream [m^3/mol]."""
+        return per_flow(self._evaluate('V_array', True), self.F_mol)
+
+    def _evaluate(self, name, pass_P):
+        # Evaluate mixture model in bulk for the streams of each phase
+        mixture_model = getattr(self.mixture, name)
+        mol = self._mol
+        TP = self._TP
+        values = np.empty(mol.shape[0])
+        for phase, index in phase_groups(self.phases):
+            T = TP[index, 0]
+            if pass_P:
+                values[index] = mixture_model(phase, mol[index], T, TP[index, 1])
+            else:
+                values[index] = mixture_model(phase, mol[index], T)
+        return values
+
+    ### Mixing and splitting ###
+
+    def mix(self, stream=None):
+        """
+        Mix all streams into the given stream (or a new stream) and
+        return it. The mixture is at the lowest pressure and its temperature
+        is found by energy balance. If no stream is given, the mixture
+        takes the phase of the first stream.
+
+        """
+        if stream is None:
+            stream = Stream(None, phase=self._phases[0].phase if self._phases else 'l',
+                            thermo=self._thermo)
+        if not len(self._phases):
+            stream.empty()
+            return stream
+        F_mol = self.F_mol
+        nonempty = F_mol != 0.
+        stream.mol[:] = self._mol.sum(0)
+        if not nonempty.any(): return stream
+        TP = self._TP[nonempty]
+        H = self.H.sum()
+        stream.P = TP[:, 1].min()
+        stream.T = (F_mol[nonempty] @ TP[:, 0]) / F_mol[nonempty].sum()
+        phase = stream.phase
+        stream._solve_mixture_T(H, any([i.phase != phase for i in self._phases]))
+        return stream
+
+    def split(self, split):
+        """
+        Return two new StreamArray objects with the split molar flow rates
+        (given split fractions broadcasted against the 2d array of
+        molar flow rates) and the remainder.
+
+        """
+        mol = self._mol
+        top = self.copy()
+        bottom = self.copy()
+        top._mol[:] = dummy = mol * split
+        bottom._mol[:] = mol - dummy
+        return top, bottom
+
+    def __repr__(self):
+        return f"<{type(self).__name__}: {len(self._phases)} streams>"
+
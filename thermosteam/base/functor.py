@@ -10,13 +10,29 @@
 from ..units_of_measure import chemical_units_of_measure
 from .. import utils
 from inspect import signature
+from types import FunctionType
+import numpy as np
+import math
 
 __all__ = ("functor", "Functor",  "TFunctor", "TPFunctor", "TIntegralFunctor",
            'display_asfunctor', 'functor_lookalike',
-           'functor_matching_params')
+           'functor_matching_params', 'evaluate_array')
 
 REGISTERED_ARGS = set()
 REGISTERED_FUNCTORS = []
+ARRAY_FUNCTIONS = {}
+MATH_TO_NUMPY = {math.exp: np.exp,
+                 math.log: np.log,
+                 math.log10: np.log10,
+                 math.sqrt: np.sqrt,
+                 math.sin: np.sin,
+                 math.cos: np.cos,
+                 math.tan: np.tan,
+                 math.sinh: np.sinh,
+                 math.cosh: np.cosh,
+                 math.tanh: np.tanh,
+                 math.atan: np.arctan,
+                 math.atanh: np.arctanh}
 
 # %% Utilities
 
@@ -52,6 +68,57 @@ def functor_arguments(params):
     base = functor_matching_params(params)
     return base, params[base._N_args:]
 
+def array_function(function):
+    """
+    Return a version of `function` that accepts NumPy arrays by rebinding 
+    math functions in its global namespace to NumPy universal functions, or
+    None if the function is known not to support arrays.
+    
+    """
+    if function in ARRAY_FUNCTIONS: return ARRAY_FUNCTIONS[function]
+    globals = function.__globals__
+    replacements = {}
+    for name, value in globals.items():
+        try: 
+            if value in MATH_TO_NUMPY: replacements[name] = MATH_TO_NUMPY[value]
+        except TypeError: # Unhashable
+            continue
+    if replacements:
+        new = FunctionType(function.__code__, {**globals, **replacements},
+                           function.__name__, function.__defaults__,
+                           function.__closure__)
+        new.__kwdefaults__ = function.__kwdefaults__
+    else:
+        new = function
+    ARRAY_FUNCTIONS[function] = new
+    return new
+
+def evaluate_array(function, args, kwargs):
+    """
+    Return an array of function values evaluated element-wise at the 
+    array arguments given. Functions that do not support arrays (e.g., 
+    because they branch on the value of an argument) are evaluated 
+    element by element.
+    
+    """
+    args = np.broadcast_arrays(*[np.asarray(i, float) for i in args])
+    if isinstance(function, FunctionType):
+        vectorized_function = array_function(function)
+    else:
+        vectorized_function = None
+    if vectorized_function:
+        try:
+            with np.errstate(divide='raise', over='raise', invalid='raise'):
+                values = vectorized_function(*args, **kwargs)
+        except FloatingPointError:
+            pass # Let scalar function deal with singularities
+        except (TypeError, ValueError):
+            ARRAY_FUNCTIONS[function] = None
+        else:
+            return np.array(np.broadcast_to(values, args[0].shape), float)
+    return np.array([function(*i, **kwargs) for i in zip(*[i.ravel().tolist() for i in args])],
+                    float).reshape(args[0].shape)
+
 
 # %% Decorator
   
@@ -193,12 +260,21 @@ class TFunctor(Functor, args=('T',)):
     kind = "functor of temperature (T; in K)"
     def __call__(self, T, P=None):
         return self.function(T, **self.__dict__)
+    
+    def evaluate_array(self, T, P=None):
+        """Return an array of values evaluated at each temperature in `T`."""
+        return evaluate_array(self.function, (T,), self.__dict__)
 
 class TPFunctor(Functor, args=('T', 'P')):
     __slots__ = ()
     kind = "functor of temperature (T; in K) and pressure (P; in Pa)"
     def __call__(self, T, P):
         return self.function(T, P, **self.__dict__)
+    
+    def evaluate_array(self, T, P):
+        """Return an array of values evaluated at each temperature in `T` and 
+        pressure in `P`."""
+        return evaluate_array(self.function, (T, P), self.__dict__)
 
 class TIntegralFunctor(Functor, args=('Ta', 'Tb')):
     __slots__ = ()
@@ -22,6 +22,15 @@ __all__ = ('PhaseHandle', #'PhaseHandleBuilder',
 
 # %% Abstract class    
 
+def unpickle_phase_handle(cls, var, s, l, g):
+    new = cls.__new__(cls)
+    setattr = object.__setattr__
+    setattr(new, 'var', var)
+    setattr(new, 's', s)
+    setattr(new, 'l', l)
+    setattr(new, 'g', g)
+    return new
+
 @read_only
 @functor_lookalike
 class PhaseHandle:
@@ -44,6 +53,9 @@ class PhaseHandle:
         setattr(new, 'g', None)
         return new
     
+    def __reduce__(self):
+        return unpickle_phase_handle, (type(self), self.var, self.s, self.l, self.g)
+    
     @property
     def S(self): return self.s
     @property
@@ -8,7 +8,7 @@
 """
 """
 from math import log
-from .functor import TFunctor, TPFunctor, Functor, \
+from .functor import TFunctor, TPFunctor, Functor, evaluate_array, \
                      display_asfunctor, functor_matching_params, functor_name
 from ..units_of_measure import chemical_units_of_measure, definitions, format_plot_units, convert
 from numpy import inf as infinity
@@ -20,7 +20,8 @@ from scipy.interpolate import interp1d
 __all__ = ('thermo_model', 'create_axis_labels', 
            'ThermoModel', 'TDependentModel', 'TPDependentModel', 
            'ConstantThermoModel', 'ConstantTDependentModel',
-           'ConstantTPDependentModel', 'InterpolatedTDependentModel')
+           'ConstantTPDependentModel', 'InterpolatedTDependentModel',
+           'ChebyshevTDependentModel')
 
 REGISTERED_MODELS = []
 
@@ -144,14 +145,15 @@ class ThermoModel:
 
 class TDependentModel(ThermoModel, Functor=TFunctor):
     __slots__ = ('name', 'var', 'evaluate', 'Pmin', 'Pmax', 'Tmin', 'Tmax',
-                 'integrate_by_T', 'integrate_by_T_over_T')
+                 'integrate_by_T', 'integrate_by_T_over_T', 'derivative_by_T')
     
     def __init__(self, evaluate,
                  Tmin=None, Tmax=None,
                  Pmin=None, Pmax=None,
                  name=None, var=None,
                  integrate_by_T=None,
-                 integrate_by_T_over_T=None):
+                 integrate_by_T_over_T=None,
+                 derivative_by_T=None):
         self.name = name or functor_name(evaluate).replace('_', ' ')
         self.var = var or evaluate.var
         self.evaluate = evaluate
@@ -161,16 +163,18 @@ class TDependentModel(ThermoModel, Functor=TFunctor):
         self.Tmax = Tmax or infinity
         self.integrate_by_T = integrate_by_T or self.numerically_integrate_by_T
         self.integrate_by_T_over_T = integrate_by_T_over_T or self.numerically_integrate_by_T_over_T
+        self.derivative_by_T = derivative_by_T
     
     def set_value(self, var, value):
         isa = isinstance
-        for f in (self.evaluate, self.integrate_by_T, self.integrate_by_T_over_T):
+        for f in (self.evaluate, self.integrate_by_T, self.integrate_by_T_over_T,
+                  self.derivative_by_T):
             if isa(f, Functor): f.set_value(var, value)
     
     def tabulate_vs_T(self, T_range=None, T_units=None, units=None, P=101325):
         if not T_range: T_range = (self.Tmin, self.Tmax)
         Ts = T_linspace(*T_range)
-        Ys = np.array([self(T) for T in Ts])
+        Ys = self.evaluate_array(Ts)
         if T_units: Ts = convert_var(Ts, 'T', T_units)
         if units: Ys = convert_var(Ys, self.var, units)
         return Ts, Ys
@@ -186,6 +190,14 @@ class TDependentModel(ThermoModel, Functor=TFunctor):
     
     def indomain(self, T, P=None):
         return self.Tmin < T < self.Tmax
+    
+    def evaluate_array(self, T, P=None):
+        """Return an array of values evaluated at each temperature in `T`."""
+        evaluate = self.evaluate
+        if isinstance(evaluate, Functor):
+            return evaluate.evaluate_array(T)
+        else:
+            return evaluate_array(evaluate, (T,), {})
      
     def numerically_integrate_by_T(self, Ta, Tb, P=None):
         return self.evaluate((Tb+Ta)/2.)*(Tb - Ta)
@@ -194,6 +206,8 @@ class TDependentModel(ThermoModel, Functor=TFunctor):
         return self.evaluate((Tb+Ta)/2.)*log(Tb/Ta)
 
     def differentiate_by_T(self, T, P=None, dT=1e-12):
+        derivative_by_T = self.derivative_by_T
+        if derivative_by_T: return derivative_by_T(T)
         return (self.evaluate(T+dT) - self.evaluate(T))/dT
     
     def differentiate_by_P(self, T, P=None, dP=1e-12):
@@ -219,7 +233,7 @@ class TPDependentModel(ThermoModel, Functor=TPFunctor):
     def tabulate_vs_T(self, T_range=None, T_units=None, units=None, P=101325):
         if not T_range: T_range = (self.Tmin, self.Tmax)
         Ts = T_linspace(*T_range)
-        Ys = np.array([self(T, P) for T in Ts])
+        Ys = self.evaluate_array(Ts, P)
         if T_units: Ts = convert_var(Ts, 'T', T_units)
         if units: Ys = convert_var(Ys, self.var, units)
         return Ts, Ys
@@ -227,7 +241,7 @@ class TPDependentModel(ThermoModel, Functor=TPFunctor):
     def tabulate_vs_P(self, P_range=None, P_units=None, units=None, T=298.15):
         if not P_range: P_range = (self.Pmin, self.Pmax)
         Ps = P_linspace(*P_range)
-        Ys = np.array([self(T, P) for P in Ps])
+        Ys = self.evaluate_array(T, Ps)
         if P_units: Ps = convert_var(Ps, 'P', P_units)
         if units: Ys = convert_var(Ys, self.var, units)
         return Ps, Ys
@@ -235,6 +249,15 @@ class TPDependentModel(ThermoModel, Functor=TPFunctor):
     def indomain(self, T, P):
         return self.Tmin < T < self.Tmax and self.Pmin < P < self.Pmax
     
+    def evaluate_array(self, T, P):
+        """Return an array of values evaluated at each temperature in `T` and 
+        pressure in `P`."""
+        evaluate = self.evaluate
+        if isinstance(evaluate, Functor):
+            return evaluate.evaluate_array(T, P)
+        else:
+            return evaluate_array(evaluate, (T, P), {})
+    
     def numerically_integrate_by_T(self, Ta, Tb, P):
         return self.evaluate((Tb+Ta)/2, P)*(Tb - Ta)
     
@@ -299,6 +322,9 @@ class ConstantThermoModel(ThermoModel):
     def evaluate(self, T=None, P=None):
         return self.value
     
+    def evaluate_array(self, T=None, P=None):
+        return np.full(np.broadcast(T, P).shape, self.value, float)
+    
     def integrate_by_T(self, Ta, Tb, P=None):
         return self.value*(Tb - Ta)
     
@@ -356,6 +382,12 @@ class InterpolatedTDependentModel(ThermoModel):
     def evaluate(self, T, P=None):
         return self.spline(T) if (self.T_lb <= T <= self.T_ub) else self.extrapolator(T)
     
+    def evaluate_array(self, T, P=None):
+        T = np.asarray(T, float)
+        return np.where((self.T_lb <= T) & (T <= self.T_ub),
+                        self.spline(T.clip(self.T_lb, self.T_ub)),
+                        self.extrapolator(T))
+    
     set_value = ConstantThermoModel.set_value
     tabulate_vs_T = TDependentModel.tabulate_vs_T
     tabulate_vs_P = TDependentModel.tabulate_vs_P
@@ -372,4 +404,148 @@ class InterpolatedTDependentModel(ThermoModel):
               f" Tmin: {self.Tmin:.2f}\n"
               f" Tmax: {self.Tmax:.2f}")
 
-    _ipython_display_ = show
\ No newline at end of file
+    _ipython_display_ = show
+
+class ChebyshevTDependentModel(ThermoModel):
+    """
+    Create a ChebyshevTDependentModel object that approximates a 
+    temperature dependent model with piecewise Chebyshev polynomials 
+    for fast evaluation, analytic differentiation, and analytic integration.
+    
+    Parameters
+    ----------
+    model : TDependentModel or InterpolatedTDependentModel
+        Model to approximate.
+    Tmin=None : float, optional
+        Minimum temperature of the fit [K]. Defaults to the minimum 
+        temperature of the model or 150 K, whichever is higher.
+    Tmax=None : float, optional
+        Maximum temperature of the fit [K]. Defaults to the maximum 
+        temperature of the model or 1500 K, whichever is lower.
+    rtol=1e-6 : float, optional
+        Relative tolerance of the fit.
+    
+    Examples
+    --------
+    >>> import thermosteam as tmo
+    >>> from thermosteam.base import ChebyshevTDependentModel
+    >>> Water = tmo.Chemical('Water')
+    >>> model = Water.Psat[0]
+    >>> surrogate = ChebyshevTDependentModel(model, Tmin=273.15, Tmax=600.)
+    >>> surrogate.max_relative_error < 1e-6
+    True
+    >>> round(surrogate(350.)), round(model(350.))
+    (41620, 41620)
+    
+    """
+    __slots__ = ('name', 'var', 'model', 'rtol',
+                 'Pmin', 'Pmax', 'Tmin', 'Tmax',
+                 'function', 'derivative', 'antiderivative', 
+                 'antiderivative_over_T', 'max_relative_error')
+    
+    #: [float] Default minimum temperature of fits [K].
+    Tmin_default = 150.
+    
+    #: [float] Default maximum temperature of fits [K].
+    Tmax_default = 1500.
+    
+    #: tuple[float] Fractions of the temperature range trimmed from the 
+    #: upper end on successive attempts to fit the model.
+    trims = (0., 0.005, 0.02)
+    
+    def __init__(self, model, Tmin=None, Tmax=None, rtol=1e-6):
+        self.name = 'Chebyshev ' + model.name
+        self.var = model.var
+        self.model = model
+        self.rtol = rtol
+        self.Pmin = getattr(model, 'Pmin', 0.)
+        self.Pmax = getattr(model, 'Pmax', infinity)
+        self.Tmin = max(model.Tmin, self.Tmin_default if Tmin is None else Tmin)
+        self.Tmax = min(model.Tmax, self.Tmax_default if Tmax is None else Tmax)
+        self.fit()
+    
+    def fit(self):
+        """
+        Fit piecewise Chebyshev polynomials to the model. If the tolerance 
+        cannot be met or the model cannot be evaluated (e.g. near a 
+        singularity at the critical point), the upper end of the fitted 
+        temperature range is trimmed.
+        
+        """
+        from ..properties.multi_cheb_1d import MultiCheb1D
+        model = self.model
+        def f(T):
+            try:
+                values = model.evaluate_array(T)
+            except TypeError:
+                evaluate = model.evaluate
+                values = [evaluate(i) for i in T]
+            return np.asarray(values, float) * np.ones_like(T)
+        Tmin = self.Tmin
+        Tmax = self.Tmax
+        if not Tmin < Tmax: 
+            raise ValueError('model domain does not overlap fit domain')
+        rtol = self.rtol
+        for trim in self.trims:
+            Tmax_fit = Tmax - trim * (Tmax - Tmin)
+            try:
+                function = MultiCheb1D.fit(f, Tmin, Tmax_fit, rtol)
+                if function.max_relative_error > rtol: continue
+                function_over_T = MultiCheb1D.fit(lambda T: f(T) / T, Tmin, Tmax_fit, rtol)
+            except (ArithmeticError, ValueError):
+                continue
+            if function_over_T.max_relative_error <= rtol: break
+        else:
+            raise RuntimeError(f'could not fit {model.name} model within '
+                               f'a relative tolerance of {rtol:.3g}')
+        self.Tmax = Tmax_fit
+        self.function = function
+        self.derivative = function.derivative()
+        self.antiderivative = function.antiderivative()
+        self.antiderivative_over_T = function_over_T.antiderivative()
+        self.max_relative_error = max(function.max_relative_error,
+                                      function_over_T.max_relative_error)
+    
+    def set_value(self, var, value):
+        model = self.model
+        model.set_value(var, value)
+        self.fit()
+    
+    def indomain(self, T, P=None):
+        return self.Tmin < T < self.Tmax
+    
+    def evaluate(self, T, P=None):
+        return self.function(T)
+    
+    def evaluate_array(self, T, P=None):
+        """Return an array of values evaluated at each temperature in `T`."""
+        return self.function.evaluate_array(T)
+    
+    def differentiate_by_T(self, T, P=None, dT=None):
+        return self.derivative(T)
+    
+    def differentiate_by_P(self, T, P=None, dP=None):
+        return 0
+    
+    def integrate_by_T(self, Ta, Tb, P=None):
+        F = self.antiderivative
+        return F(Tb) - F(Ta)
+    
+    def integrate_by_T_over_T(self, Ta, Tb, P=None):
+        F = self.antiderivative_over_T
+        return F(Tb) - F(Ta)
+    
+    def integrate_by_P(self, Pa, Pb, T):
+        return (Pb - Pa) * self.function(T)
+    
+    tabulate_vs_T = TDependentModel.tabulate_vs_T
+    tabulate_vs_P = TDependentModel.tabulate_vs_P
+    
+    def show(self):
+        print(f"{self}\n"
+              f" name: {self.name}\n"
+              f" Tmin: {self.Tmin:.5g} K\n"
+              f" Tmax: {self.Tmax:.5g} K\n"
+              f" max relative error: {self.max_relative_error:.3g}")
+        
+    _ipython_display_ = show
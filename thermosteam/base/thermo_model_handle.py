@@ -8,15 +8,20 @@
 """
 """
 from collections import deque
+from bisect import bisect_left
+from math import isfinite
 from numpy import inf as infinity
+import numpy as np
 from .thermo_model import (ThermoModel,
                            TDependentModel,
                            TPDependentModel,
+                           InterpolatedTDependentModel,
+                           ChebyshevTDependentModel,
                            thermo_model,
                            create_axis_labels)
 from ..exceptions import DomainError
 from ..units_of_measure import definitions
-from .functor import functor_lookalike
+from .functor import functor_lookalike, Functor, evaluate_array
 import matplotlib.pyplot as plt
 
 __all__ = ('ThermoModelHandle',
@@ -41,6 +46,60 @@ def no_valid_model(chemical, var):
     msg += f"{definition.lower()} model" if definition else "model"
     return msg
 
+def no_valid_model_at_points(chemical, var, T, P=None):
+    msg = no_valid_model(chemical, var)
+    N = T.size
+    if N == 1:
+        msg += f" at T={T[0]:.2f} K"
+        if P is not None: msg += f" and P={P[0]:.0f} Pa"
+    else:
+        msg += f" at {N} points between T={T.min():.2f} and {T.max():.2f} K"
+        if P is not None: msg += f" and P={P.min():.0f} and {P.max():.0f} Pa"
+    return msg
+
+def evaluate_models_array(handle, T, P, TP_dependent):
+    T, P = np.broadcast_arrays(np.asarray(T, float), np.asarray(P, float))
+    shape = T.shape
+    T = T.ravel()
+    P = P.ravel()
+    values = np.empty(T.size)
+    undefined = np.ones(T.size, bool)
+    for model in handle._models:
+        mask = undefined & (model.Tmin < T) & (T < model.Tmax)
+        if TP_dependent and type(model).indomain is TPDependentModel.indomain:
+            mask &= (model.Pmin < P) & (P < model.Pmax)
+        if mask.any():
+            undefined[mask] = False
+            values[mask] = model.evaluate_array(T[mask], P[mask])
+            if not undefined.any(): return values.reshape(shape)
+    if undefined.any():
+        raise DomainError(no_valid_model_at_points(handle._chemical, handle._var, 
+                                                   T[undefined],
+                                                   P[undefined] if TP_dependent else None),
+                          chemical=handle._chemical)
+    return values.reshape(shape)
+
+def uncovered_bounds(intervals, Tmin, Tmax):
+    """
+    Return the bounds of the region from `Tmin` to `Tmax` not covered by 
+    the union of `intervals` (or None if fully covered).
+    
+    """
+    lb = ub = None
+    T = Tmin
+    for a, b in sorted(intervals):
+        if b <= T: continue
+        if a >= Tmax: break
+        if a > T:
+            if lb is None: lb = T
+            ub = a
+        T = b
+        if T >= Tmax: break
+    if T < Tmax:
+        if lb is None: lb = T
+        ub = Tmax
+    if lb is not None: return lb, ub
+
 def as_model_index(models, key):
     isa = isinstance
     if isa(key, int):
@@ -75,12 +134,205 @@ def as_model(models, key):
     return model
 
 
+# %% Piecewise integrals
+
+array_like = (np.ndarray, list, tuple)
+
+def integrate_array(model, Ta, Tb, over_T):
+    # Integrate model from each temperature in `Ta` to the corresponding one in `Tb`
+    f = model.integrate_by_T_over_T if over_T else model.integrate_by_T
+    if isinstance(f, Functor):
+        return evaluate_array(f.function, (Ta, Tb), f.__dict__)
+    method = getattr(f, '__func__', None)
+    if method is TDependentModel.numerically_integrate_by_T:
+        return model.evaluate_array(0.5 * (Ta + Tb)) * (Tb - Ta)
+    elif method is TDependentModel.numerically_integrate_by_T_over_T:
+        return model.evaluate_array(0.5 * (Ta + Tb)) * np.log(Tb / Ta)
+    return np.array([f(i, j) for i, j in zip(Ta.tolist(), Tb.tolist())], float)
+
+class IntegralTable:
+    """
+    Create an IntegralTable object that splits the temperature domain of a
+    TDependentModelHandle object into segments in which the active model
+    (the first model in the domain) does not change, and tabulates
+    cumulative integrals (by T and by T over T) at the boundaries of the
+    segments. Integrals are computed with the analytical integrals of at
+    most two models (those of the segments of the limits of integration)
+    plus a difference of tabulated values.
+
+    Parameters
+    ----------
+    handle : TDependentModelHandle
+        Models to tabulate.
+
+    """
+    __slots__ = ('handle', 'boundaries', 'models', 'defined', 'gaps',
+                 'cumulative', 'revision')
+
+    def __init__(self, handle):
+        self.handle = handle
+        self.revision = ThermoModelHandle.revision
+        models = [i for i in handle._models if hasattr(i, 'integrate_by_T')]
+        breakpoints = set()
+        for model in models:
+            breakpoints.add(model.Tmin)
+            breakpoints.add(model.Tmax)
+        breakpoints = sorted([i for i in breakpoints if isfinite(i)])
+        N = len(breakpoints)
+        if N:
+            T_first = breakpoints[0]
+            Ts = [0.5 * T_first if T_first > 0. else T_first - 1.,
+                  *[0.5 * (breakpoints[i - 1] + breakpoints[i]) for i in range(1, N)],
+                  2. * breakpoints[-1] + 1.]
+        else:
+            Ts = [298.15]
+        segment_models = []
+        for T in Ts:
+            for model in models:
+                if model.Tmin < T < model.Tmax: break
+            else:
+                model = None
+            segment_models.append(model)
+        # Merge segments with the same active model
+        boundaries = []
+        self.models = [segment_models[0]]
+        for T, model in zip(breakpoints, segment_models[1:]):
+            if model is self.models[-1]: continue
+            boundaries.append(T)
+            self.models.append(model)
+        self.boundaries = boundaries
+        self.defined = defined = [i is not None for i in self.models]
+        self.gaps = np.cumsum(np.logical_not(defined)).tolist()
+        N = len(boundaries)
+        H = np.zeros(N)
+        S = np.zeros(N)
+        for i in range(1, N):
+            model = self.models[i]
+            Ta = boundaries[i - 1]
+            Tb = boundaries[i]
+            if model is None or Ta <= 0.: continue
+            H[i] = model.integrate_by_T(Ta, Tb)
+            S[i] = model.integrate_by_T_over_T(Ta, Tb)
+        self.cumulative = (H.cumsum().tolist(), S.cumsum().tolist())
+
+    def segment(self, T):
+        """Return the index of the segment of temperature `T`."""
+        boundaries = self.boundaries
+        index = bisect_left(boundaries, T)
+        if index < len(boundaries) and boundaries[index] == T and not self.defined[index]:
+            index += 1
+        return index
+
+    def domain_error(self, Ta, Tb):
+        handle = self.handle
+        return DomainError(f"{no_valid_model(handle._chemical, handle._var)} "
+                           f"between T={Ta:.2f} to {Tb:.2f} K", chemical=handle._chemical)
+
+    def integrate(self, Ta, Tb, over_T):
+        """Return the integral of the models from `Ta` to `Tb` (divided by
+        temperature if `over_T` is True)."""
+        if isinstance(Ta, array_like) or isinstance(Tb, array_like):
+            return self.integrate_array(Ta, Tb, over_T)
+        segment = self.segment
+        i = segment(Ta)
+        j = segment(Tb)
+        models = self.models
+        model_a = models[i]
+        if i == j:
+            if model_a is None: raise self.domain_error(Ta, Tb)
+            if over_T:
+                return model_a.integrate_by_T_over_T(Ta, Tb)
+            else:
+                return model_a.integrate_by_T(Ta, Tb)
+        model_b = models[j]
+        gaps = self.gaps
+        if model_a is None or model_b is None or gaps[i] != gaps[j]:
+            raise self.domain_error(Ta, Tb)
+        boundaries = self.boundaries
+        cumulative = self.cumulative[over_T]
+        if i < j:
+            ka = i
+            kb = j - 1
+        else:
+            ka = i - 1
+            kb = j
+        Ba = boundaries[ka]
+        Bb = boundaries[kb]
+        if over_T:
+            integrate_a = model_a.integrate_by_T_over_T
+            integrate_b = model_b.integrate_by_T_over_T
+        else:
+            integrate_a = model_a.integrate_by_T
+            integrate_b = model_b.integrate_by_T
+        value = cumulative[kb] - cumulative[ka]
+        # Skip pieces of zero length (limits at boundaries), as models
+        # may be singular at the ends of their domain (e.g., at Tc)
+        if Ta != Ba: value += integrate_a(Ta, Ba)
+        if Bb != Tb: value += integrate_b(Bb, Tb)
+        return value
+
+    def integrate_array(self, Ta, Tb, over_T):
+        """Return an array of integrals of the models from each temperature
+        in `Ta` to the corresponding one in `Tb` (divided by temperature if
+        `over_T` is True)."""
+        Ta, Tb = np.broadcast_arrays(np.asarray(Ta, float), np.asarray(Tb, float))
+        shape = Ta.shape
+        Ta = Ta.ravel()
+        Tb = Tb.ravel()
+        boundaries = np.array(self.boundaries, float)
+        defined = np.array(self.defined)
+        N_boundaries = boundaries.size
+        def segments(T):
+            index = np.searchsorted(boundaries, T, 'left')
+            inside = index < N_boundaries
+            index[inside & ~defined[index] & (boundaries[np.minimum(index, N_boundaries - 1)] == T)] += 1
+            return index
+        i = segments(Ta)
+        j = segments(Tb)
+        gaps = np.array(self.gaps)
+        undefined = ~defined[i] | ~defined[j] | (gaps[i] != gaps[j])
+        if undefined.any():
+            index = np.flatnonzero(undefined)[0]
+            raise self.domain_error(Ta[index], Tb[index])
+        same = i == j
+        cross = ~same
+        forward = i < j
+        ka = np.where(forward, i, i - 1)
+        kb = np.where(forward, j - 1, j)
+        Ta_end = Tb.copy()
+        Tb_start = Tb.copy()
+        values = np.zeros(Ta.size)
+        if cross.any():
+            cumulative = np.array(self.cumulative[over_T], float)
+            ka = ka[cross]
+            kb = kb[cross]
+            Ta_end[cross] = boundaries[ka]
+            Tb_start[cross] = boundaries[kb]
+            values[cross] = cumulative[kb] - cumulative[ka]
+        models = self.models
+        # Skip pieces of zero length (see `integrate`)
+        start = Ta != Ta_end
+        end = cross & (Tb_start != Tb)
+        for segment in np.unique(i[start]).tolist():
+            mask = start & (i == segment)
+            values[mask] += integrate_array(models[segment], Ta[mask], Ta_end[mask], over_T)
+        for segment in np.unique(j[end]).tolist():
+            mask = end & (j == segment)
+            values[mask] += integrate_array(models[segment], Tb_start[mask], Tb[mask], over_T)
+        return values.reshape(shape)
+
+
 # %% Handles
 
 @functor_lookalike
 class ThermoModelHandle:
     __slots__ = ('_chemical', '_var', '_models',)
     
+    #: [int] Incremented whenever models of any handle are added, removed, 
+    #: reprioritized, or have their values set (for invalidating compiled 
+    #: and cached results that depend on active models).
+    revision = 0
+    
     @property
     def chemical(self):
         """[Chemical] Parent chemical."""
@@ -96,6 +348,7 @@ class ThermoModelHandle:
     
     def set_value(self, var, value):
         for model in self._models: model.set_value(var, value)
+        ThermoModelHandle.revision += 1
     
     def plot_vs_T(self, T_range=None, T_units=None, units=None, 
                   P=101325, label_axis=True, **plot_kwargs):
@@ -136,6 +389,7 @@ class ThermoModelHandle:
             "a 'ThermoModelHandle' object may only "
             "contain 'ThermoModel' objects")
         self._models[index] = model
+        ThermoModelHandle.revision += 1
 	
     def __iter__(self):
         return iter(self._models)
@@ -163,6 +417,7 @@ class ThermoModelHandle:
         model = as_model(models, key)
         models.remove(model)
         models.insert(priority, model)
+        ThermoModelHandle.revision += 1
     
     def move_up_model_priority(self, key, priority=0):
         """
@@ -178,6 +433,7 @@ class ThermoModelHandle:
         """
         index = as_model_index(self._models, key)
         self._models.rotate(priority - index)
+        ThermoModelHandle.revision += 1
     
     def add_model(self, evaluate=None,
                   Tmin=None, Tmax=None,
@@ -210,6 +466,8 @@ class ThermoModelHandle:
             Analytical integration function (to replace numerical integration).
         integrate_by_T_over_T : function(Ta, Tb, ...)
             Analytical integration function (to replace numerical integration).
+        derivative_by_T : function(T, ...)
+            Analytical derivative function (to replace numerical differentiation).
         
         Notes
         -----
@@ -236,6 +494,7 @@ class ThermoModelHandle:
             self._models.appendleft(model)
         else:
             self._models.append(model)    
+        ThermoModelHandle.revision += 1
         return evaluate
        
     def remove(self, key):
@@ -250,7 +509,85 @@ class ThermoModelHandle:
         """
         model = as_model(self._models, key)
         self._models.remove(model)
+        ThermoModelHandle.revision += 1
        
+    def fit_surrogates(self, rtol=1e-6, Tmin=None, Tmax=None):
+        """
+        Add a ChebyshevTDependentModel object in front of each temperature 
+        dependent (or interpolated) model that is reachable (in order of 
+        priority) within the temperature range. Each surrogate is only fitted 
+        where its model is not superseded by models of higher priority. Models that cannot be fitted within the 
+        relative tolerance are left as is. Return the maximum relative error 
+        of the fitted surrogates (or None if no surrogates were added).
+        
+        Parameters
+        ----------
+        rtol=1e-6 : float, optional
+            Relative tolerance of the fits.
+        Tmin=None : float, optional
+            Minimum temperature of the fits [K]. Defaults to
+            ChebyshevTDependentModel.Tmin_default.
+        Tmax=None : float, optional
+            Maximum temperature of the fits [K]. Defaults to
+            ChebyshevTDependentModel.Tmax_default.
+        
+        Examples
+        --------
+        >>> import thermosteam as tmo
+        >>> Water = tmo.Chemical('Water')
+        >>> Water.Psat.fit_surrogates(Tmin=280., Tmax=600.) < 1e-6
+        True
+        >>> Water.Psat.show()
+        TDependentModelHandle(T, P=None) -> Psat [Pa]
+        [0] Chebyshev Wagner McGraw
+        [1] Wagner McGraw
+        [2] Antoine
+        [3] DIPPR EQ101
+        [4] Wagner
+        [5] Boiling Critical Relation
+        [6] Lee Kesler
+        [7] Ambrose Walton
+        [8] Sanjari
+        [9] Edalat
+        >>> Water.Psat.remove_surrogates()
+        >>> Water.Psat[0].name
+        'Wagner McGraw'
+        
+        """
+        self.remove_surrogates()
+        if Tmin is None: Tmin = ChebyshevTDependentModel.Tmin_default
+        if Tmax is None: Tmax = ChebyshevTDependentModel.Tmax_default
+        models = self._models
+        intervals = []
+        errors = []
+        for model in tuple(models):
+            lb = max(model.Tmin, Tmin)
+            ub = min(model.Tmax, Tmax)
+            if lb >= ub: continue
+            bounds = uncovered_bounds(intervals, lb, ub)
+            if bounds is None: continue
+            if isinstance(model, (TDependentModel, InterpolatedTDependentModel)):
+                try:
+                    surrogate = ChebyshevTDependentModel(model, *bounds, rtol)
+                except (ValueError, RuntimeError):
+                    pass
+                else:
+                    models.insert(models.index(model), surrogate)
+                    errors.append(surrogate.max_relative_error)
+            if getattr(model, 'Pmin', 0.) <= 0. and getattr(model, 'Pmax', infinity) == infinity:
+                intervals.append((lb, ub))
+        if errors:
+            ThermoModelHandle.revision += 1
+            return max(errors)
+    
+    def remove_surrogates(self):
+        """Remove all ChebyshevTDependentModel objects."""
+        models = self._models
+        surrogates = [i for i in models if isinstance(i, ChebyshevTDependentModel)]
+        if surrogates:
+            for i in surrogates: models.remove(i)
+            ThermoModelHandle.revision += 1
+    
     def show(self):
         info = f"{self}\n"
         if self._models:
@@ -264,11 +601,20 @@ class ThermoModelHandle:
 
     
 class TDependentModelHandle(ThermoModelHandle):
-    __slots__ = ()
+    __slots__ = ('_integral_table',)
     Pmin = 0
     Pmax = infinity
     tabulate_vs_T = TDependentModel.tabulate_vs_T
     tabulate_vs_P = TDependentModel.tabulate_vs_P
+    
+    def __init__(self, var, models=None):
+        super().__init__(var, models)
+        self._integral_table = None
+    
+    def __reduce__(self):
+        # Integral tables are compiled again after unpickling
+        return type(self), (self._var,), (None, {'_chemical': self._chemical,
+                                                 '_models': self._models})
         
     @property
     def Tmin(self):
@@ -285,6 +631,22 @@ class TDependentModelHandle(ThermoModelHandle):
     
     at_T = __call__
     
+    def evaluate_array(self, T, P=None):
+        """
+        Return an array of values evaluated at each temperature in `T`.
+        Temperatures are split by the domain of each model and evaluated 
+        in bulk.
+        
+        Examples
+        --------
+        >>> import thermosteam as tmo
+        >>> Water = tmo.Chemical('Water')
+        >>> Water.Psat.evaluate_array([300., 350., 400.])
+        array([  3533.918,  41619.817, 245575.374])
+        
+        """
+        return evaluate_models_array(self, T, np.nan, False)
+    
     def try_out(self, T, P=None):
         for model in self._models:
             if model.indomain(T): return model.evaluate(T)
@@ -298,50 +660,48 @@ class TDependentModelHandle(ThermoModelHandle):
     def differentiate_by_P(self, T, P=None, dP=1e-12):
         return 0
         
+    def get_integral_table(self):
+        """
+        Return an IntegralTable object with cumulative integrals of active
+        models tabulated at their domain boundaries. The table is compiled
+        once and recompiled only after models of any handle are modified.
+        
+        """
+        table = self._integral_table
+        if table is None or table.revision != ThermoModelHandle.revision:
+            self._integral_table = table = IntegralTable(self)
+        return table
+    
     def integrate_by_T(self, Ta, Tb, P=None):
-        integral = 0.
-        defined = hasattr
-        for model in self._models:
-            if not defined(model, 'integrate_by_T'): continue
-            Tmax = model.Tmax
-            Tmin = model.Tmin
-            lb_satisfied = Ta > Tmin
-            ub_satisfied = Tb < Tmax
-            if lb_satisfied:
-                if ub_satisfied:
-                    return integral + model.integrate_by_T(Ta, Tb)
-                elif Ta < Tmax:
-                    integral += model.integrate_by_T(Ta, Tmax)
-                    Ta = Tmax
-            elif ub_satisfied and Tmin < Tb:
-                integral += model.integrate_by_T(Tmin, Tb)
-                Tb = Tmin
-        raise DomainError(f"{no_valid_model(self._chemical, self._var)} "
-                         f"between T={Ta:.2f} to {Tb:.2f} K", chemical=self._chemical)
+        """
+        Return the integral of the active models from `Ta` to `Tb`. Arrays 
+        of temperatures are integrated in bulk.
+        
+        Examples
+        --------
+        >>> import thermosteam as tmo
+        >>> Water = tmo.Chemical('Water')
+        >>> round(Water.Cn.l.integrate_by_T(298.15, 400.), 2)
+        7710.75
+        >>> Water.Cn.l.integrate_by_T(298.15, [350., 400.])
+        array([3906.682, 7710.749])
+        
+        """
+        table = self._integral_table
+        if table is None or table.revision != ThermoModelHandle.revision:
+            self._integral_table = table = IntegralTable(self)
+        return table.integrate(Ta, Tb, False)
     
     def integrate_by_P(self, Pa, Pb, T):
         return (Pb - Pa) * self(T)
     
     def integrate_by_T_over_T(self, Ta, Tb, P=None):
-        integral = 0.
-        defined = hasattr
-        for model in self._models:
-            if not defined(model, 'integrate_by_T_over_T'): continue
-            Tmax = model.Tmax
-            Tmin = model.Tmin
-            lb_satisfied = Ta > Tmin
-            ub_satisfied = Tb < Tmax
-            if lb_satisfied:
-                if ub_satisfied:
-                    return integral + model.integrate_by_T_over_T(Ta, Tb)
-                elif Ta < Tmax:
-                    integral += model.integrate_by_T_over_T(Ta, Tmax)
-                    Ta = Tmax
-            elif ub_satisfied and Tmin < Tb:
-                integral += model.integrate_by_T_over_T(Tmin, Tb)
-                Tb = Tmin
-        raise DomainError(f"{no_valid_model(self._chemical, self._var)} "
-                         f"between T={Ta:.2f} to {Tb:.2f} K", chemical=self._chemical)
+        """Return the integral of the active models divided by temperature 
+        from `Ta` to `Tb`. Arrays of temperatures are integrated in bulk."""
+        table = self._integral_table
+        if table is None or table.revision != ThermoModelHandle.revision:
+            self._integral_table = table = IntegralTable(self)
+        return table.integrate(Ta, Tb, True)
     
     
 class TPDependentModelHandle(ThermoModelHandle):
@@ -366,6 +726,22 @@ class TPDependentModelHandle(ThermoModelHandle):
         raise DomainError(f"{no_valid_model(self._chemical, self._var)} "
                           f"at T={T:.2f} K and P={P:.0f} Pa", chemical=self._chemical)
 
+    def evaluate_array(self, T, P):
+        """
+        Return an array of values evaluated at each temperature in `T` and 
+        pressure in `P`. Points are split by the domain of each model and 
+        evaluated in bulk.
+        
+        Examples
+        --------
+        >>> import thermosteam as tmo
+        >>> Water = tmo.Chemical('Water')
+        >>> Water.V.l.evaluate_array([300., 320., 340.], 101325)
+        array([1.808e-05, 1.824e-05, 1.844e-05])
+        
+        """
+        return evaluate_models_array(self, T, P, True)
+
     def at_T(self, T):
         isa = isinstance
         for model in self._models:
@@ -13,6 +13,7 @@ __all__ = []
 from . import activity_coefficients
 from . import fugacity_coefficients
 from . import vle
+from . import batch_vle
 from . import dew_point
 from . import bubble_point
 from . import poyinting_correction_factors
@@ -22,6 +23,7 @@ from . import plot_equilibrium
 
 __all__ = (*activity_coefficients.__all__,
            *vle.__all__,
+           *batch_vle.__all__,
            *lle.__all__,
            *dew_point.__all__,
            *bubble_point.__all__,
@@ -31,6 +33,7 @@ __all__ = (*activity_coefficients.__all__,
            *plot_equilibrium.__all__)
 
 from .vle import *
+from .batch_vle import *
 from .lle import *
 from .activity_coefficients import *
 from .fugacity_coefficients import *
@@ -37,23 +37,40 @@ def chemgroup_array(chemgroups, index):
     return array
 
 @njitable(cache=True)
-def group_activity_coefficients(x, chemgroups, loggammacs,
-                                Qs, psis, cQfs, gpsis):
+def mixture_group_loggammas(x, chemgroups, Qs, psis):
     weighted_counts = chemgroups.transpose() @ x
     Q_fractions = Qs * weighted_counts 
     Q_fractions /= Q_fractions.sum()
     Q_psis = psis * Q_fractions
     sum1 = Q_psis.sum(1)
     sum2 = -(psis.transpose() / sum1) @ Q_fractions
-    loggamma_groups = Qs * (1. - np.log(sum1) + sum2)
+    return Qs * (1. - np.log(sum1) + sum2)
+
+@njitable(cache=True)
+def chemical_group_loggammas(Qs, cQfs, gpsis):
     sum1 = cQfs @ gpsis.transpose()
     sum1 = np.where(sum1==0, 1., sum1)
     fracs = - cQfs / sum1
     sum2 = fracs @ gpsis
-    chem_loggamma_groups = Qs*(1. - np.log(sum1) + sum2)
+    return Qs*(1. - np.log(sum1) + sum2)
+
+@njitable(cache=True)
+def group_activity_coefficients(x, chemgroups, loggammacs,
+                                Qs, psis, cQfs, gpsis):
+    loggamma_groups = mixture_group_loggammas(x, chemgroups, Qs, psis)
+    chem_loggamma_groups = chemical_group_loggammas(Qs, cQfs, gpsis)
     loggammars = ((loggamma_groups - chem_loggamma_groups) * chemgroups).sum(1)
     return np.exp(loggammacs + loggammars)
 
+def batch_mixture_group_loggammas(X, chemgroups, Qs, psis):
+    # Same as `mixture_group_loggammas`, but with one row (and one psis 
+    # matrix) for each composition.
+    Q_fractions = Qs * (X @ chemgroups)
+    Q_fractions /= Q_fractions.sum(1, keepdims=True)
+    sum1 = (psis * Q_fractions[:, np.newaxis, :]).sum(2)
+    sum2 = -np.einsum('nba,nb->na', psis, Q_fractions / sum1)
+    return Qs * (1. - np.log(sum1) + sum2)
+
 def get_interaction(all_interactions, i, j, no_interaction):
     if i==j:
         return no_interaction
@@ -81,6 +98,12 @@ def loggammacs_UNIFAC(qs, rs, x):
     Vs_over_Fs = Vs/Fs
     return 1. - Vs - np.log(Vs) - 5.*qs*(1. - Vs_over_Fs + np.log(Vs_over_Fs))
 
+def batch_loggammacs_UNIFAC(qs, rs, X):
+    Vs = rs / (X @ rs)[:, np.newaxis]
+    Fs = qs / (X @ qs)[:, np.newaxis]
+    Vs_over_Fs = Vs/Fs
+    return 1. - Vs - np.log(Vs) - 5.*qs*(1. - Vs_over_Fs + np.log(Vs_over_Fs))
+
 @njitable(cache=True)
 def loggammacs_Dortmund(qs, rs, x):
     r_net = (x*rs).sum()
@@ -93,15 +116,23 @@ def loggammacs_Dortmund(qs, rs, x):
     Vs_p = rs_p/r_pnet
     return 1. - Vs_p + np.log(Vs_p) - 5.*qs*(1. - Vs_over_Fs + np.log(Vs_over_Fs))
 
+def batch_loggammacs_Dortmund(qs, rs, X):
+    rs_p = rs**0.75
+    Vs = rs / (X @ rs)[:, np.newaxis]
+    Fs = qs / (X @ qs)[:, np.newaxis]
+    Vs_over_Fs = Vs/Fs
+    Vs_p = rs_p / (X @ rs_p)[:, np.newaxis]
+    return 1. - Vs_p + np.log(Vs_p) - 5.*qs*(1. - Vs_over_Fs + np.log(Vs_over_Fs))
+
 @njitable(cache=True)
-def psi_Dortmund(T, abc):
-    abc[:, :, 0] /= T
-    abc[:, :, 2] *= T
-    return np.exp(-abc.sum(2)) 
+def psi_Dortmund(T, abc, out):
+    out[:] = np.exp(-(abc[:, :, 0] / T + abc[:, :, 1] + abc[:, :, 2] * T))
+    return out
 
 @njitable(cache=True)
-def psi_UNIFAC(T, a):
-    return np.exp(-a/T)
+def psi_UNIFAC(T, a, out):
+    out[:] = np.exp(-a/T)
+    return out
 
 
 # %% Activity Coefficients
@@ -144,6 +175,9 @@ class IdealActivityCoefficients(ActivityCoefficients):
     def __call__(self, xs, T):
         return 1.
     
+    def batch(self, X, Ts):
+        return np.ones(np.shape(X))
+    
 
 class GroupActivityCoefficients(ActivityCoefficients):
     """Abstract class for the estimation of activity coefficients using group contribution methods.
@@ -153,11 +187,18 @@ class GroupActivityCoefficients(ActivityCoefficients):
     
     chemicals : Iterable[Chemical]
     
+    Notes
+    -----
+    Interaction parameters (psis) and pure chemical group activity 
+    coefficients at the last temperature evaluated are stored in 
+    preallocated arrays and reused on subsequent calls at the same 
+    temperature.
+    
     """
     __slots__ = ('_rs', '_qs', '_Qs','_chemgroups',
                  '_group_psis',  '_chem_Qfractions',
                  '_group_mask', '_interactions',
-                 '_chemicals')
+                 '_chemicals', '_psis', '_chem_loggamma_groups', '_T')
     
     def __new__(cls, chemicals):
         chemicals = tuple(chemicals)
@@ -190,6 +231,9 @@ class GroupActivityCoefficients(ActivityCoefficients):
              for j in main_group_ids])
         # Psis array with only symmetrically available groups
         self._group_psis = np.zeros(group_shape, dtype=float)
+        self._psis = np.zeros(group_shape, dtype=float)
+        self._chem_loggamma_groups = None
+        self._T = None
         # Make mask for retrieving symmetrically available groups
         rowindex = np.arange(N_groups, dtype=int)
         indices = [rowindex[rowmask] for rowmask in cQfs != 0]
@@ -215,17 +259,74 @@ class GroupActivityCoefficients(ActivityCoefficients):
             Temperature (K)
         
         """
-        x = np.asarray(x)
-        psis = self.psi(T, self._interactions.copy())
-        self._group_psis[self._group_mask] =  psis[self._group_mask]
-        gamma =  group_activity_coefficients(x, self._chemgroups,
-                                             self.loggammacs(self._qs, self._rs, x),
-                                             self._Qs, psis,
-                                             self._chem_Qfractions,
-                                             self._group_psis)
+        x = np.asarray(x, dtype=float)
+        if T != self._T: self._load_psis(T)
+        chemgroups = self._chemgroups
+        loggamma_groups = mixture_group_loggammas(x, chemgroups, self._Qs, self._psis)
+        loggammars = ((loggamma_groups - self._chem_loggamma_groups) * chemgroups).sum(1)
+        gamma = np.exp(self.loggammacs(self._qs, self._rs, x) + loggammars)
         gamma[np.isnan(gamma)] = 1
         return gamma
     
+    def _load_psis(self, T):
+        psis = self.psi(T, self._interactions, self._psis)
+        np.copyto(self._group_psis, psis, where=self._group_mask)
+        self._chem_loggamma_groups = chemical_group_loggammas(
+            self._Qs, self._chem_Qfractions, self._group_psis
+        )
+        self._T = T
+    
+    def batch(self, X, Ts):
+        """Return UNIFAC coefficients for many compositions.
+        
+        Parameters
+        ----------
+        X : array_like
+            Molar fractions, one row for each composition.
+        Ts : float or array_like
+            Temperatures (K), one for each composition.
+        
+        Notes
+        -----
+        Interaction parameters are computed only once for each unique 
+        temperature and all compositions are evaluated together with
+        array operations.
+        
+        Examples
+        --------
+        >>> import thermosteam as tmo
+        >>> chemicals = tmo.Chemicals(['Water', 'Ethanol'])
+        >>> gamma = tmo.equilibrium.DortmundActivityCoefficients(chemicals)
+        >>> gamma.batch([[0.5, 0.5], [0.9, 0.1]], [350., 350.])
+        array([[1.475, 1.242],
+               [1.029, 3.258]])
+        >>> gamma([0.9, 0.1], 350.)
+        array([1.029, 3.258])
+        
+        """
+        X = np.asarray(X, dtype=float)
+        N = X.shape[0]
+        Ts = np.broadcast_to(np.asarray(Ts, dtype=float), (N,))
+        Ts_unique, index = np.unique(Ts, return_inverse=True)
+        interactions = self._interactions
+        shape = self._psis.shape
+        Qs = self._Qs
+        cQfs = self._chem_Qfractions
+        group_mask = self._group_mask
+        psi = self.psi
+        psis = np.array([psi(T, interactions, np.empty(shape)) for T in Ts_unique])
+        chem_loggamma_groups = np.array([
+            chemical_group_loggammas(Qs, cQfs, np.where(group_mask, i, 0.))
+            for i in psis
+        ])
+        chemgroups = self._chemgroups
+        loggamma_groups = batch_mixture_group_loggammas(X, chemgroups, Qs, psis[index])
+        loggammars = ((loggamma_groups[:, np.newaxis, :] 
+                       - chem_loggamma_groups[index]) * chemgroups).sum(2)
+        gammas = np.exp(self.batch_loggammacs(self._qs, self._rs, X) + loggammars)
+        gammas[np.isnan(gammas)] = 1
+        return gammas
+    
     
 class UNIFACActivityCoefficients(GroupActivityCoefficients):
     """Create a UNIFACActivityCoefficients that estimates activity coefficients using the UNIFAC group contribution method when called with a composition and a temperature (K).
@@ -246,8 +347,12 @@ class UNIFACActivityCoefficients(GroupActivityCoefficients):
         return loggammacs_UNIFAC(qs, rs, x)
     
     @staticmethod
-    def psi(T, a):
-        return psi_UNIFAC(T, a)
+    def batch_loggammacs(qs, rs, X):
+        return batch_loggammacs_UNIFAC(qs, rs, X)
+    
+    @staticmethod
+    def psi(T, a, out):
+        return psi_UNIFAC(T, a, out)
 
 
 class DortmundActivityCoefficients(GroupActivityCoefficients):
@@ -271,8 +376,12 @@ class DortmundActivityCoefficients(GroupActivityCoefficients):
         return loggammacs_Dortmund(qs, rs, x)
     
     @staticmethod
-    def psi(T, abc):
-        return psi_Dortmund(T, abc)
+    def batch_loggammacs(qs, rs, X):
+        return batch_loggammacs_Dortmund(qs, rs, X)
+    
+    @staticmethod
+    def psi(T, abc, out):
+        return psi_Dortmund(T, abc, out)
     
     
 
@@ -0,0 +1,350 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020, Yoel Cortes-Pena <yoelcortes@gmail.com>
+#
+# This module is under the UIUC open-source license. See
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+import numpy as np
+from ..utils.decorators import thermo_user
+from .. import indexer
+from .bubble_point import BubblePoint
+from .activity_coefficients import IdealActivityCoefficients
+from .fugacity_coefficients import IdealFugacityCoefficients
+from .poyinting_correction_factors import IdealPoyintingCorrectionFactors
+from .binary_phase_fraction import phase_fractions
+
+__all__ = ('BatchVLE', 'BatchVLEValues', 'solve_bounded')
+
+# %% Vectorized tools
+
+def solve_bounded(f, xa, xb, ya, yb, xtol, ytol, maxiter=100):
+    """
+    Return the roots of many bounded univariate problems at once using a
+    vectorized Illinois (modified false position) method.
+
+    Parameters
+    ----------
+    f : function(x, index) -> 1d array
+        Objective function evaluated at `x` for the problems given by `index`.
+    xa, xb : 1d array
+        Lower and upper bounds.
+    ya, yb : 1d array
+        Objective function values at the bounds.
+    xtol, ytol : float
+        Solver tolerances.
+    maxiter=100 : int, optional
+        Maximum number of iterations.
+
+    Notes
+    -----
+    Problems without a sign change between bounds return the bound with the
+    smallest absolute objective value.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from thermosteam.equilibrium import solve_bounded
+    >>> c = np.array([2., 3., 10.])
+    >>> f = lambda x, index: x * x - c[index]
+    >>> xa = np.zeros(3); xb = np.full(3, 2.)
+    >>> solve_bounded(f, xa, xb, f(xa, ...), f(xb, ...), 1e-12, 1e-12)
+    array([1.414, 1.732, 2.   ])
+
+    """
+    xa = np.asarray(xa, float)
+    xb = np.asarray(xb, float)
+    ya = np.asarray(ya, float)
+    yb = np.asarray(yb, float)
+    x = np.where(np.abs(ya) < np.abs(yb), xa, xb)
+    index = np.flatnonzero(ya * yb < 0.)
+    xa = xa[index]; xb = xb[index]
+    ya = ya[index]; yb = yb[index]
+    for i in range(maxiter):
+        if not index.size: break
+        xc = (xa * yb - xb * ya) / (yb - ya)
+        yc = f(xc, index)
+        x[index] = xc
+        flip = yc * yb < 0.
+        xa = np.where(flip, xb, xa)
+        ya = np.where(flip, yb, 0.5 * ya)
+        xb = xc
+        yb = yc
+        unconverged = (np.abs(xb - xa) > xtol) & (np.abs(yc) > ytol)
+        index = index[unconverged]
+        xa = xa[unconverged]; xb = xb[unconverged]
+        ya = ya[unconverged]; yb = yb[unconverged]
+    return x
+
+def vapor_pressures(Psats, T):
+    """Return a 2d array of vapor pressures, one row for each temperature."""
+    return np.array([Psat.evaluate_array(T) for Psat in Psats]).T
+
+def rowwise(f, X, *args):
+    """Return a 2d array of `f(x, *arg)` for each row `x` in `X`."""
+    return np.array([f(x, *arg) for x, *arg in zip(X, *args)])
+
+def normalize_rows(X):
+    X = X / X.sum(1, keepdims=True)
+    X[X < 1e-32] = 1e-32
+    return X
+
+
+# %% Batch VLE values container
+
+class BatchVLEValues:
+    __slots__ = ('T', 'P', 'V', 'IDs', 'x', 'y', 'vapor_mol', 'liquid_mol')
+
+    def __init__(self, T, P, V, IDs, x, y, vapor_mol, liquid_mol):
+        self.T = T
+        self.P = P
+        self.V = V
+        self.IDs = IDs
+        self.x = x
+        self.y = y
+        self.vapor_mol = vapor_mol
+        self.liquid_mol = liquid_mol
+
+    def __repr__(self):
+        return f"{type(self).__name__}(T={self.T}, P={self.P}, V={self.V}, IDs={self.IDs})"
+
+
+# %% Batch vapor-liquid equilibrium
+
+@thermo_user
+class BatchVLE:
+    """
+    Create a BatchVLE object that performs vapor-liquid equilibrium on many
+    material flows at once when called. Each equilibrium specification
+    (T, P, V) may be either a scalar or a 1d array with one value for each
+    material flow. Inner loops (e.g., Rachford-Rice and bubble/dew point
+    bracketing) are solved for all rows simultaneously using array
+    operations.
+
+    Parameters
+    ----------
+    thermo=None : Thermo, optional
+        Themodynamic property package for equilibrium calculations.
+        Defaults to `thermosteam.settings.get_thermo()`.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from thermosteam import indexer, equilibrium, settings
+    >>> settings.set_thermo(['Water', 'Ethanol'])
+    >>> imols = [indexer.MolarFlowIndexer(phases='lg', l=[('Water', 1), ('Ethanol', i)])
+    ...          for i in (0.1, 0.5, 2.)]
+    >>> batch_vle = equilibrium.BatchVLE()
+    >>> values = batch_vle(imols, V=0.5, P=101325)
+    >>> values.T.round(2)
+    array([368.61, 357.2 , 352.16])
+    >>> imols[0]
+    MolarFlowIndexer(
+        g=[('Water', 0.4591), ('Ethanol', 0.09086)],
+        l=[('Water', 0.5409), ('Ethanol', 0.009138)])
+    >>> # Results are consistent with the VLE object
+    >>> vle = equilibrium.VLE(imols[0])
+    >>> vle(V=0.5, P=101325)
+    >>> round(vle.thermal_condition.T, 2)
+    368.61
+    >>> # Material flow rates may also be passed as a 2d array
+    >>> mol = np.array([[1., 0.1], [1., 0.5], [1., 2.]])
+    >>> values = batch_vle(mol, T=360, P=101325)
+    >>> values.V.round(3)
+    array([0.   , 0.717, 1.   ])
+    >>> # Empty material flows remain empty
+    >>> values = batch_vle(np.array([[1., 0.5], [0., 0.]]), T=360, P=101325)
+    >>> values.V.round(3)
+    array([0.717, 0.   ])
+
+    """
+    __slots__ = ('_thermo',)
+    T_tol = 1e-6
+    P_tol = 1e-3
+    x_tol = 1e-9
+    maxiter = 100
+
+    def __init__(self, thermo=None):
+        self._load_thermo(thermo)
+
+    def __call__(self, mol, T=None, P=None, V=None):
+        """
+        Perform vapor-liquid equilibrium on all material flows and return a
+        BatchVLEValues object.
+
+        Parameters
+        ----------
+        mol : 2d array or Iterable[MaterialIndexer]
+            Molar flow rates (one row per material flow). If material
+            indexers are passed, results are also stored in them.
+        T=None : float or 1d array
+            Operating temperature [K].
+        P=None : float or 1d array
+            Operating pressure [Pa].
+        V=None : float or 1d array
+            Molar vapor fraction.
+
+        Notes
+        -----
+        You may only specify two of the following parameters: P, T, and V.
+
+        """
+        T_spec = T is not None
+        P_spec = P is not None
+        V_spec = V is not None
+        assert (T_spec + P_spec + V_spec) == 2, ("must pass two and only two "
+                                                 "of the following "
+                                                 "specifications: T, P, V")
+        if isinstance(mol, np.ndarray):
+            imols = None
+            mol = np.array(mol, float, ndmin=2)
+        else:
+            imols = mol if isinstance(mol, list) else list(mol)
+            chemicals = self.chemicals
+            for i in imols:
+                if not isinstance(i, indexer.MaterialIndexer):
+                    raise ValueError('mol must be either a 2d array or an '
+                                     'iterable of material indexers')
+                if i.chemicals is not chemicals:
+                    raise ValueError('material indexers must share the same '
+                                     'chemicals as the thermodynamic property '
+                                     'package')
+            mol = np.array([i.sum_across_phases() for i in imols], ndmin=2)
+        N_rows = mol.shape[0]
+        chemicals = self.chemicals
+        index = chemicals.get_vle_indices((mol > 0.).any(0))
+        mol_vle = mol[:, index]
+        F_mol_vle = mol_vle.sum(1)
+        empty = F_mol_vle == 0.
+        if empty.any():
+            if V_spec: raise RuntimeError('no chemicals present to perform VLE')
+            F_mol_vle[empty] = 1.
+        z = mol_vle / F_mol_vle[:, np.newaxis]
+        if T_spec: T = np.array(np.broadcast_to(T, N_rows), float)
+        if P_spec: P = np.array(np.broadcast_to(P, N_rows), float)
+        if V_spec: V = np.array(np.broadcast_to(V, N_rows), float)
+        if index.size:
+            bp = BubblePoint([chemicals.tuple[i] for i in index], self._thermo)
+            if T_spec and P_spec:
+                # Empty rows are left out of the solve (all liquid by convention)
+                V = np.zeros(N_rows)
+                x = z.copy()
+                y = z.copy()
+                filled = np.flatnonzero(~empty)
+                if filled.size:
+                    V[filled], x[filled], y[filled] = self._solve_TP(
+                        bp, z[filled], T[filled], P[filled]
+                    )
+            elif V_spec and P_spec:
+                T, x, y = self._solve_PV(bp, z, P, V)
+            else:
+                P, x, y = self._solve_TV(bp, z, T, V)
+        else:
+            V = np.zeros(N_rows)
+            x = y = z
+        V[empty] = 0.
+        vapor_mol = np.zeros_like(mol)
+        vapor_mol[:, chemicals._light_indices] = mol[:, chemicals._light_indices]
+        v = (V * F_mol_vle)[:, np.newaxis] * y
+        vapor_mol[:, index] = np.where(v > mol_vle, mol_vle, v)
+        vapor_mol[:, chemicals._heavy_indices] = 0.
+        liquid_mol = mol - vapor_mol
+        if imols:
+            for imol, vapor, liquid in zip(imols, vapor_mol, liquid_mol):
+                imol.empty()
+                imol['g'] = vapor
+                imol['l'] = liquid
+        IDs = tuple([chemicals.IDs[i] for i in index])
+        return BatchVLEValues(T, P, V, IDs, x, y, vapor_mol, liquid_mol)
+
+    def _correction_factors(self, bp, x, y, T, P):
+        """Return the product of activity coefficients and Poyinting correction
+        factors over fugacity coefficients for each row."""
+        gamma = bp.gamma
+        if isinstance(gamma, IdealActivityCoefficients):
+            factors = 1.
+        elif hasattr(gamma, 'batch'):
+            factors = gamma.batch(x, T)
+        else:
+            factors = rowwise(gamma, x, T)
+        pcf = bp.pcf
+        if not isinstance(pcf, IdealPoyintingCorrectionFactors):
+            factors = factors * rowwise(pcf, x, T)
+        phi = bp.phi
+        if not isinstance(phi, IdealFugacityCoefficients):
+            factors = factors / rowwise(phi, y, T, P)
+        return np.ones_like(x) * factors
+
+    def _compositions(self, z, Ks, V):
+        x = z / (1. + V[:, np.newaxis] * (Ks - 1.))
+        y = Ks * x
+        return normalize_rows(x), normalize_rows(y)
+
+    def _iterate(self, bp, z, T, P, solve):
+        x = y = z
+        factors = self._correction_factors(bp, x, y, T, P)
+        for i in range(self.maxiter):
+            T, P, V, Ks = solve(factors, T, P)
+            x_new, y_new = self._compositions(z, Ks, V)
+            converged = (np.abs(x_new - x).max() < self.x_tol
+                         and np.abs(y_new - y).max() < self.x_tol)
+            x = x_new
+            y = y_new
+            if converged: break
+            factors = self._correction_factors(bp, x, y, T, P)
+        return T, P, V, x, y
+
+    def _solve_TP(self, bp, z, T, P):
+        Psats_over_P = vapor_pressures(bp.Psats, T) / P[:, np.newaxis]
+        V_guess = None
+        def solve(factors, T, P):
+            nonlocal V_guess
+            Ks = factors * Psats_over_P
+            V_guess = V = phase_fractions(z, Ks, V_guess)
+            return T, P, V, Ks
+        T, P, V, x, y = self._iterate(bp, z, T, P, solve)
+        return V, x, y
+
+    def _solve_PV(self, bp, z, P, V):
+        N_rows = z.shape[0]
+        Psats = bp.Psats
+        Tmin = np.full(N_rows, bp.Tmin)
+        Tmax = np.full(N_rows, bp.Tmax)
+        Kterms = None
+        def f(T, index):
+            Ks = factors[index] * vapor_pressures(Psats, T) / P[index, np.newaxis]
+            Kterm = Ks - 1.
+            Kterms[index] = Kterm
+            return (z[index] * Kterm / (1. + V[index, np.newaxis] * Kterm)).sum(1)
+        def solve(factors_, T, P):
+            nonlocal factors, Kterms
+            factors = np.ones_like(z) * factors_
+            Kterms = np.empty_like(z)
+            f_min = f(Tmin, ...)
+            f_max = f(Tmax, ...)
+            T = solve_bounded(f, Tmin, Tmax, f_min, f_max, self.T_tol, 1e-12)
+            return T, P, V, factors * vapor_pressures(Psats, T) / P[:, np.newaxis]
+        factors = None
+        T = 0.5 * (Tmin + Tmax)
+        T, P, V, x, y = self._iterate(bp, z, T, P, solve)
+        return T, x, y
+
+    def _solve_TV(self, bp, z, T, V):
+        Psats = vapor_pressures(bp.Psats, T)
+        def solve(factors, T, P):
+            Ps = factors * Psats
+            P_bubble = (z * Ps).sum(1)
+            P_dew = 1. / (z / Ps).sum(1)
+            Vc = V[:, np.newaxis]
+            def f(P, index):
+                Kterm = Ps[index] / P[:, np.newaxis] - 1.
+                return (z[index] * Kterm / (1. + Vc[index] * Kterm)).sum(1)
+            P = solve_bounded(f, P_dew, P_bubble,
+                              f(P_dew, ...), f(P_bubble, ...),
+                              self.P_tol, 1e-12)
+            return T, P, V, Ps / P[:, np.newaxis]
+        P = (z * Psats).sum(1)
+        T, P, V, x, y = self._iterate(bp, z, T, P, solve)
+        return P, x, y
@@ -16,8 +16,9 @@
 """
 """
 import flexsolve as flx
+import numpy as np
 
-__all__ = ('phase_fraction', 'solve_phase_fraction',
+__all__ = ('phase_fraction', 'solve_phase_fraction', 'phase_fractions',
            'compute_phase_fraction_2N', 'compute_phase_fraction_3N')
 
 @flx.njitable(cache=True)
@@ -223,4 +224,66 @@ def compute_phase_fraction_3N(zs, Ks):
                 / (K1K2K3*z1 + K1K2K3*z2 + K1K2K3*z3 - K1K2*z1 - K1K2*z2
                    - K1K2*z3 - K1K3*z1 - K1K3*z2 - K1K3*z3 + K1z1 + K1z2
                    + K1z3 - K2K3*z1 - K2K3*z2 - K2K3*z3 + K2z1 + K2z2 + K2z3
-                   + K3z1 + K3z2 + K3z3 - z1_z2_z3))
\ No newline at end of file
+                   + K3z1 + K3z2 + K3z3 - z1_z2_z3))
+
+def phase_fractions(zs, Ks, guess=None, tol=1e-12, maxiter=100):
+    """
+    Return phase fractions for many binary equilibrium problems at once
+    (one for each row of `zs` and `Ks`) by solving the Rachford-Rice 
+    objective function with a vectorized, bounded Newton method.
+    
+    Parameters
+    ----------
+    zs : 2d array
+        Overall molar compositions.
+    Ks : 2d array
+        Partition coefficients.
+    guess=None : 1d array, optional
+        Phase fractions to start Newton iterations from.
+    tol=1e-12 : float, optional
+        Phase fraction tolerance.
+    maxiter=100 : int, optional
+        Maximum number of iterations.
+    
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from thermosteam.equilibrium.binary_phase_fraction import phase_fractions
+    >>> zs = np.array([[0.5, 0.5], [0.2, 0.8], [0.6, 0.4]])
+    >>> Ks = np.array([[2.0, 0.5], [2.0, 0.5], [0.5, 0.2]])
+    >>> phase_fractions(zs, Ks)
+    array([0.5, 0. , 0. ])
+    
+    """
+    zs = np.asarray(zs, float)
+    Ks = np.asarray(Ks, float)
+    Kterm = Ks - 1.
+    numerator = zs * Kterm
+    f_min = numerator.sum(1)
+    f_max = (numerator / Ks).sum(1)
+    Vs = np.where(f_max >= 0., 1., 0.)
+    two_phase = (f_min > 0.) & (f_max < 0.)
+    if not two_phase.any(): return Vs
+    numerator = numerator[two_phase]
+    Kterm = Kterm[two_phase]
+    V_min = np.zeros(numerator.shape[0])
+    V_max = np.ones(numerator.shape[0])
+    if guess is None:
+        V = 0.5 * V_max
+    else:
+        V = np.broadcast_to(guess, Vs.shape)[two_phase].clip(1e-6, 1. - 1e-6)
+    for i in range(maxiter):
+        denominator = 1. + V[:, np.newaxis] * Kterm
+        f = (numerator / denominator).sum(1)
+        df = -(numerator * Kterm / (denominator * denominator)).sum(1)
+        positive = f > 0.
+        V_min = np.where(positive, V, V_min)
+        V_max = np.where(positive, V_max, V)
+        V_new = V - f / df
+        out_of_bounds = (V_new <= V_min) | (V_new >= V_max)
+        V_new[out_of_bounds] = 0.5 * (V_min + V_max)[out_of_bounds]
+        converged = np.abs(V_new - V).max() < tol
+        V = V_new
+        if converged: break
+    Vs[two_phase] = V
+    return Vs
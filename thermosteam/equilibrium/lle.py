@@ -10,11 +10,17 @@
 from flexsolve import njitable
 from ..utils import Cache
 from scipy.optimize import differential_evolution
+from inspect import signature
 from .equilibrium import Equilibrium
+from . import binary_phase_fraction as binary
 import numpy as np
 
 __all__ = ('LLE', 'LLECache')
 
+#: [bool] Whether differential evolution can evaluate a whole population at
+#: once (requires SciPy 1.9 or later).
+vectorized_differential_evolution = 'vectorized' in signature(differential_evolution).parameters
+
 def liquid_activities(mol_L, T, f_gamma):
     total_mol_L = mol_L.sum()
     if total_mol_L:
@@ -40,19 +46,150 @@ def lle_objective_function(mol_L, mol, T, f_gamma):
     g_mix = g_mix_l + g_mix_L
     return g_mix
 
+def batch_liquid_activities(mol_L, T, f_gamma):
+    total_mol_L = mol_L.sum(1, keepdims=True)
+    mask = total_mol_L[:, 0] != 0.
+    xgamma = np.ones_like(mol_L)
+    if mask.any():
+        x = mol_L[mask] / total_mol_L[mask]
+        if hasattr(f_gamma, 'batch'):
+            gamma = f_gamma.batch(x, T)
+        else:
+            gamma = np.array([f_gamma(i, T) for i in x])
+        xgamma[mask] = x * gamma
+    return xgamma
+
+def batch_gibbs_free_energy_of_liquid(mol_L, xgamma):
+    xgamma[xgamma <= 0] = 1
+    return (mol_L * np.log(xgamma)).sum(1)
+
+def batch_lle_objective_function(mol_Ls, mol, T, f_gamma):
+    """
+    Return the gibb's free energy of mixing of each liquid-liquid split in 
+    `mol_Ls`, an array of molar flow rates with one column for each split 
+    (as given by differential evolution with `vectorized=True`).
+    """
+    mol_L = np.atleast_2d(mol_Ls.transpose())
+    mol_l = mol - mol_L
+    xgamma_l = batch_liquid_activities(mol_l, T, f_gamma)
+    xgamma_L = batch_liquid_activities(mol_L, T, f_gamma)
+    g_mix_l = batch_gibbs_free_energy_of_liquid(mol_l, xgamma_l)
+    g_mix_L = batch_gibbs_free_energy_of_liquid(mol_L, xgamma_L)
+    return g_mix_l + g_mix_L
+
 def solve_lle_liquid_mol(mol, T, f_gamma, **differential_evolution_options):
     args = (mol, T, f_gamma)
     bounds = np.zeros([mol.size, 2])
     bounds[:, 1] = mol
-    result = differential_evolution(lle_objective_function, bounds, args,
+    if differential_evolution_options.get('vectorized'):
+        f = batch_lle_objective_function
+        differential_evolution_options.setdefault('updating', 'deferred')
+    else:
+        f = lle_objective_function
+    result = differential_evolution(f, bounds, args,
                                     **differential_evolution_options)
     return result.x
 
+def lle_stability_test(z, T, f_gamma, maxiter=50):
+    """
+    Return the partition coefficients to the most promising trial phase 
+    if a liquid of composition `z` is unstable (i.e. the tangent plane 
+    distance is negative); return None otherwise.
+    """
+    N = z.size
+    d = np.log(z * f_gamma(z, T))
+    for i in range(N):
+        w = np.full(N, 1e-3)
+        w[i] = 1.
+        w /= w.sum()
+        for j in range(maxiter):
+            W = np.exp(d - np.log(f_gamma(w, T)))
+            w_new = W / W.sum()
+            converged = np.abs(w_new - w).max() < 1e-8
+            w = w_new
+            if converged: break
+        if W.sum() > 1. + 1e-8 and np.abs(w - z).max() > 1e-4:
+            return W / z
+
+def lle_K_iter(logKs, z, T, f_gamma, phase_fraction):
+    Ks = np.exp(logKs)
+    phase_fraction[0] = beta = binary.phase_fraction(z, Ks, phase_fraction[0])
+    x_l = z / (1. + beta * (Ks - 1.))
+    x_L = Ks * x_l
+    return np.log(f_gamma(x_l / x_l.sum(), T) / f_gamma(x_L / x_L.sum(), T))
+
+def solve_lle_K_values(z, Ks, T, f_gamma, beta=0.5, xtol=1e-9, maxiter=200):
+    """
+    Return the liquid phase fraction and partition coefficients of a 
+    liquid-liquid split of composition `z` by successive substitution of 
+    partition coefficients. Every fifth iteration is accelerated by 
+    extrapolating with the dominant eigenvalue of the iteration. Return 
+    None if the iteration does not converge or converges to a single phase.
+    """
+    phase_fraction = np.array([beta])
+    args = (z, T, f_gamma, phase_fraction)
+    logKs = np.log(Ks)
+    dlogKs_last = None
+    for i in range(maxiter):
+        logKs_new = lle_K_iter(logKs, *args)
+        dlogKs = logKs_new - logKs
+        if np.abs(dlogKs).max() < xtol: break
+        if i % 5 == 4:
+            eigenvalue = (dlogKs @ dlogKs_last) / (dlogKs_last @ dlogKs_last)
+            if 0. < eigenvalue < 1.:
+                logKs_new += dlogKs * eigenvalue / (1. - eigenvalue)
+        dlogKs_last = dlogKs
+        logKs = logKs_new
+    else:
+        return None
+    beta = phase_fraction[0]
+    if 0. < beta < 1. and np.abs(logKs).max() > 1e-3:
+        return beta, np.exp(logKs)
+
+def solve_lle_liquid_mol_fast(mol, T, f_gamma, Ks=None, beta=0.5):
+    """
+    Return the molar flow rates of one liquid phase, the partition 
+    coefficients, and the phase fraction of a liquid-liquid split computed 
+    by a stability test and successive substitution of partition 
+    coefficients. Previous partition coefficients, `Ks`, and phase 
+    fraction, `beta`, may be given to skip the stability test. If the 
+    liquid is stable, all flow rates are returned (with no partition 
+    coefficients nor phase fraction). Return None if the iteration fails 
+    or the split does not reduce the gibb's free energy of mixing (or is
+    not stable by the tangent plane test, as when the iteration converges 
+    to a local minimum).
+    """
+    F_mol = mol.sum()
+    z = mol / F_mol
+    result = None
+    try:
+        if Ks is not None: result = solve_lle_K_values(z, Ks, T, f_gamma, beta)
+        if result is None:
+            Ks = lle_stability_test(z, T, f_gamma)
+            if Ks is None: return mol, None, None
+            result = solve_lle_K_values(z, Ks, T, f_gamma)
+            if result is None: return None
+    except ArithmeticError: 
+        return None
+    beta, Ks = result
+    x_l = z / (1. + beta * (Ks - 1.))
+    mol_L = beta * F_mol * Ks * x_l
+    mol_L[mol_L > mol] = mol[mol_L > mol]
+    args = (mol, T, f_gamma)
+    if lle_objective_function(mol_L, *args) >= lle_objective_function(mol, *args):
+        return None
+    mol_l = mol - mol_L
+    try:
+        if lle_stability_test(mol_l / mol_l.sum(), T, f_gamma) is not None: return None
+    except ArithmeticError:
+        return None
+    return mol_L, Ks, beta
+
 class LLE(Equilibrium, phases='lL'):
     """
     Create a LLE object that performs liquid-liquid equilibrium when called.
-    Differential evolution is used to find the solution that globally minimizes
-    the gibb's free energy of both phases.
+    By default, differential evolution is used to find the solution that 
+    globally minimizes the gibb's free energy of both phases.
         
     Parameters
     ----------
@@ -63,6 +200,23 @@ class LLE(Equilibrium, phases='lL'):
     thermo=None : Thermo, optional
         Themodynamic property package for equilibrium calculations.
         Defaults to `thermosteam.settings.get_thermo()`.
+    method='differential evolution' : str, optional
+        Either 'differential evolution' or 'successive substitution'. The 
+        latter performs a tangent plane stability test followed by
+        successive substitution of partition coefficients (warm started 
+        from the previous split) and falls back to differential evolution
+        if the solution does not reduce the gibb's free energy of mixing
+        or does not pass the stability test.
+    
+    Notes
+    -----
+    With SciPy 1.9 or later, each generation of differential evolution is 
+    evaluated at once through batched activity coefficients by default 
+    (i.e. 'vectorized' is True in `differential_evolution_options`). 
+    For many chemicals, the 
+    population may be evaluated in a process pool instead by setting 
+    'workers' and removing 'vectorized'. Results are reproducible with the
+    'seed' option in either case.
     
     Examples
     --------
@@ -79,11 +233,44 @@ class LLE(Equilibrium, phases='lL'):
             l=[('Water', 301.3), ('Ethanol', 27.72), ('Octane', 0.07884), ('Hexane', 0.01154)]),
         thermal_condition=ThermalCondition(T=360.00, P=101325))
     
+    The faster successive substitution method yields the same split:
+    
+    >>> lle.method = 'successive substitution'
+    >>> lle(T=360)
+    >>> lle
+    LLE(imol=MolarFlowIndexer(
+            L=[('Water', 2.671), ('Ethanol', 2.284), ('Octane', 39.92), ('Hexane', 0.9885)],
+            l=[('Water', 301.3), ('Ethanol', 27.72), ('Octane', 0.07884), ('Hexane', 0.01154)]),
+        thermal_condition=ThermalCondition(T=360.00, P=101325))
+    
     """
-    __slots__ = ()
+    __slots__ = ('_method', 
+                 '_Ks', # [1d array] Partition coefficients of last split.
+                 '_phase_fraction', # [float] Phase fraction of last split.
+                 '_lle_index') # [1d array] Index of chemicals in last split.
     differential_evolution_options = {'seed': 0,
                                       'popsize': 12,
                                       'tol': 0.002}
+    if vectorized_differential_evolution:
+        differential_evolution_options['vectorized'] = True
+        differential_evolution_options['updating'] = 'deferred'
+    
+    def __init__(self, imol=None, thermal_condition=None, thermo=None,
+                 method='differential evolution'):
+        super().__init__(imol, thermal_condition, thermo)
+        self.method = method
+        self._Ks = self._phase_fraction = self._lle_index = None
+    
+    @property
+    def method(self):
+        """[str] Either 'differential evolution' or 'successive substitution'."""
+        return self._method
+    @method.setter
+    def method(self, method):
+        if method not in ('differential evolution', 'successive substitution'):
+            raise ValueError("method must be either 'differential evolution' "
+                            f"or 'successive substitution', not {repr(method)}")
+        self._method = method
     
     def __call__(self, T, P=None, top_chemical=None):
         """
@@ -97,6 +284,9 @@ class LLE(Equilibrium, phases='lL'):
             Operating pressure [Pa].
         top_chemical : str, optional
             Identifier of chemical that will be favored in the "liquid" phase.
+            Otherwise, the phase with the lower molar flow rate is the 
+            "LIQUID" phase when using successive substitution (phases of 
+            differential evolution solutions are not relabeled).
             
         """
         thermal_condition = self._thermal_condition
@@ -107,8 +297,12 @@ class LLE(Equilibrium, phases='lL'):
         total_mol = mol.sum()
         if total_mol:
             gamma = self.thermo.Gamma(lle_chemicals)
-            mol_L = solve_lle_liquid_mol(mol, T, gamma,
-                                         **self.differential_evolution_options)
+            successive_substitution = self._method == 'successive substitution'
+            if successive_substitution:
+                mol_L = self._solve_lle_liquid_mol_fast(mol, index, T, gamma)
+            else:
+                mol_L = solve_lle_liquid_mol(mol, T, gamma,
+                                             **self.differential_evolution_options)
             mol_l = mol - mol_L
             if top_chemical:
                 MW = self.chemicals.MW[index]
@@ -119,9 +313,28 @@ class LLE(Equilibrium, phases='lL'):
                 C_l = mass_l[top_chemical_index] / mass_l.sum()
                 top_L = C_L > C_l
                 if top_L: mol_l, mol_L = mol_L, mol_l
+            elif successive_substitution and mol_L.sum() > mol_l.sum():
+                mol_l, mol_L = mol_L, mol_l
             imol['l'][index] = mol_l
             imol['L'][index] = mol_L
     
+    def _solve_lle_liquid_mol_fast(self, mol, index, T, gamma):
+        lle_index = self._lle_index
+        if lle_index is not None and np.array_equal(lle_index, index):
+            Ks = self._Ks
+            phase_fraction = self._phase_fraction
+        else:
+            Ks = None
+            phase_fraction = 0.5
+        result = solve_lle_liquid_mol_fast(mol, T, gamma, Ks, phase_fraction)
+        if result is None:
+            self._lle_index = None
+            return solve_lle_liquid_mol(mol, T, gamma,
+                                        **self.differential_evolution_options)
+        mol_L, self._Ks, self._phase_fraction = result
+        self._lle_index = None if self._Ks is None else index
+        return mol_L
+    
     def get_liquid_mol_data(self):
         # Get flow rates
         imol = self._imol
@@ -17,9 +17,135 @@ from .bubble_point import BubblePointCache
 from .fugacity_coefficients import IdealFugacityCoefficients
 from .. import functional as fn
 from ..utils import Cache
+from collections import OrderedDict
 import numpy as np
 
-__all__ = ('VLE', 'VLECache')
+__all__ = ('VLE', 'VLECache', 'VLEWarmStart', 'VLEWarmStartValues')
+
+# %% Warm start store
+
+class VLEWarmStartValues:
+    __slots__ = ('T', 'P', 'V', 'y', 'bubble_point', 'dew_point')
+    
+    def __init__(self, T, P, V, y, bubble_point, dew_point):
+        self.T = T
+        self.P = P
+        self.V = V
+        self.y = y
+        self.bubble_point = bubble_point
+        self.dew_point = dew_point
+    
+    def __repr__(self):
+        return (f"{type(self).__name__}(T={self.T}, P={self.P}, V={self.V}, y={self.y}, "
+                f"bubble_point={self.bubble_point}, dew_point={self.dew_point})")
+
+
+class VLEWarmStart:
+    """
+    Create a VLEWarmStart object that stores recently converged vapor-liquid
+    equilibrium results to seed solvers in subsequent calls with similar
+    specifications. Entries are keyed by the kind of specification, the 
+    specification values (to 3 significant figures), the chemicals in 
+    equilibrium, and the molar composition quantized to the given 
+    `resolution`. When no entry matches the quantized composition, the 
+    entry with the nearest composition (by the maximum difference in molar 
+    fractions, up to `radius`) and the same remaining key is used. The 
+    least recently used entry is discarded when more than `size` entries 
+    are stored.
+    
+    Parameters
+    ----------
+    size=100 : int, optional
+        Maximum number of entries.
+    resolution=1e-3 : float, optional
+        Molar composition resolution of keys.
+    radius=0.05 : float, optional
+        Maximum difference in molar fractions of nearest entries.
+    
+    Examples
+    --------
+    >>> from thermosteam import indexer, equilibrium, settings
+    >>> settings.set_thermo(['Water', 'Ethanol', 'Methanol', 'Propanol'])
+    >>> imol = indexer.MolarFlowIndexer(
+    ...             l=[('Water', 304), ('Ethanol', 30)],
+    ...             g=[('Methanol', 40), ('Propanol', 1)])
+    >>> warm_start = equilibrium.VLEWarmStart(size=10)
+    >>> vle = equilibrium.VLE(imol, warm_start=warm_start)
+    >>> vle(V=0.5, P=101325)
+    >>> imol['l', 'Water'] += 0.01 # Slight perturbation
+    >>> vle(V=0.5, P=101325)
+    >>> warm_start
+    VLEWarmStart(size=10, resolution=0.001, hits=1, misses=1)
+    >>> imol['l', 'Water'] += 1 # Nearest entry is used
+    >>> vle(V=0.5, P=101325)
+    >>> warm_start
+    VLEWarmStart(size=10, resolution=0.001, hits=2, misses=1)
+    >>> warm_start.clear()
+    >>> warm_start
+    VLEWarmStart(size=10, resolution=0.001, hits=0, misses=0)
+    
+    """
+    __slots__ = ('size', 'resolution', 'radius', 'entries', 'hits', 'misses')
+    
+    def __init__(self, size=100, resolution=1e-3, radius=0.05):
+        self.size = size
+        self.resolution = resolution
+        self.radius = radius
+        self.entries = OrderedDict()
+        self.hits = self.misses = 0
+    
+    def key(self, spec, values, index, z):
+        """Return a key for the given specification and composition."""
+        return (spec,
+                tuple([float(format(i, '.3g')) for i in values]),
+                tuple(index),
+                tuple((z / self.resolution).round().astype(int)))
+    
+    def get(self, key):
+        """Return VLEWarmStartValues object associated to key, or None if 
+        no entry is available."""
+        entries = self.entries
+        if key not in entries: key = self.nearest_key(key)
+        if key is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            entries.move_to_end(key)
+            return entries[key]
+    
+    def nearest_key(self, key):
+        """Return the key of the stored entry with the same specification 
+        and chemicals and the nearest composition within `radius` (or None 
+        if no entry is available)."""
+        *other, composition = key
+        max_distance = self.radius / self.resolution
+        nearest = None
+        for i in self.entries:
+            if i[:-1] != tuple(other): continue
+            distance = max([abs(a - b) for a, b in zip(i[-1], composition)])
+            if distance <= max_distance:
+                max_distance = distance
+                nearest = i
+        return nearest
+    
+    def set(self, key, values):
+        """Store VLEWarmStartValues object."""
+        entries = self.entries
+        entries[key] = values
+        entries.move_to_end(key)
+        if len(entries) > self.size: entries.popitem(last=False)
+    
+    def clear(self):
+        """Remove all entries and reset hit/miss counters."""
+        self.entries.clear()
+        self.hits = self.misses = 0
+    
+    def __repr__(self):
+        return (f"{type(self).__name__}(size={self.size}, resolution={self.resolution}, "
+                f"hits={self.hits}, misses={self.misses})")
+
+
+# %% Vapor-liquid equilibrium
 
 @thermo_user
 class VLE(Equilibrium, phases='lg'):
@@ -39,6 +165,12 @@ class VLE(Equilibrium, phases='lg'):
         Cache to retrieve bubble point object.
     dew_point_cache=None : thermosteam.utils.Cache, optional
         Cache to retrieve dew point object
+    warm_start=None : VLEWarmStart, optional
+        Store of recently converged results used to seed solvers.
+    method='bounded' : str, optional
+        Flash method for enthalpy specifications. Either 'bounded' (nested
+        bounded solver between the bubble and dew points) or 'newton' 
+        (simultaneous Newton flash using analytic derivatives).
     
     Examples
     --------
@@ -60,6 +192,17 @@ class VLE(Equilibrium, phases='lg'):
             l=[('Water', 177.3), ('Ethanol', 3.598), ('Methanol', 6.509), ('Propanol', 0.104)]),
         thermal_condition=ThermalCondition(T=363.88, P=101325))
     
+    Enthalpy specifications may be solved by Newton's method instead:
+    
+    >>> H = vle.mixture.xH(imol, 363.88, 101325)
+    >>> vle.method = 'newton'
+    >>> vle(H=1.2*H, P=101325)
+    >>> vle
+    VLE(imol=MolarFlowIndexer(
+            g=[('Water', 167.7), ('Ethanol', 27.9), ('Methanol', 36.03), ('Propanol', 0.9409)],
+            l=[('Water', 136.3), ('Ethanol', 2.098), ('Methanol', 3.968), ('Propanol', 0.0591)]),
+        thermal_condition=ThermalCondition(T=365.33, P=101325))
+    
     """
     __slots__ = ('_T', # [float] Temperature [K].
                  '_P', # [float] Pressure [Pa].
@@ -86,15 +229,25 @@ class VLE(Equilibrium, phases='lg'):
                  '_nonzero', # [1d array(bool)] Chemicals present in the mixture
                  '_F_mol_vle', # [float] Total moles in equilibrium.
                  '_dew_point_cache', # [Cache] Retrieves the DewPoint object if arguments are the same.
-                 '_bubble_point_cache') # [Cache] Retrieves the BubblePoint object if arguments are the same.
+                 '_bubble_point_cache', # [Cache] Retrieves the BubblePoint object if arguments are the same.
+                 '_warm_start', # [VLEWarmStart] Stores recently converged results to seed solvers.
+                 '_warm_start_key', # [tuple] Key of current specification in warm start store.
+                 '_method', # [str] Flash method for enthalpy specifications.
+                 '_newton_state') # [1d array] Converged variable and phase compositions of Newton flash.
     T_tol = 1e-6
     P_tol = 1.
     H_hat_tol = 1e-3
     V_tol = 1e-6
+    newton_maxiter = 50
+    newton_max_step = 10.
     
     def __init__(self, imol=None, thermal_condition=None,
-                 thermo=None, bubble_point_cache=None, dew_point_cache=None):
+                 thermo=None, bubble_point_cache=None, dew_point_cache=None,
+                 warm_start=None, method='bounded'):
+        self.method = method
         self._T = self._P = self._H_hat = self._V = 0
+        self._warm_start = warm_start
+        self._warm_start_key = None
         self._dew_point_cache = dew_point_cache or DewPointCache()
         self._bubble_point_cache = bubble_point_cache or BubblePointCache()
         super().__init__(imol, thermal_condition, thermo)
@@ -104,7 +257,7 @@ class VLE(Equilibrium, phases='lg'):
         self._vapor_mol = imol['g']
         self._nonzero = np.zeros(liquid_mol.shape, dtype=bool)
         self._index = ()
-        self._y = None
+        self._x = self._y = None
     
     def __call__(self, P=None, H=None, T=None, V=None, x=None, y=None):
         """
@@ -232,6 +385,50 @@ class VLE(Equilibrium, phases='lg'):
     @property
     def thermal_condition(self):
         return self._thermal_condition
+    @property
+    def warm_start(self):
+        """[VLEWarmStart] Store of recently converged results used to seed solvers."""
+        return self._warm_start
+    
+    @property
+    def method(self):
+        """[str] Flash method for enthalpy specifications; either 'bounded' 
+        or 'newton'."""
+        return self._method
+    @method.setter
+    def method(self, method):
+        if method not in ('bounded', 'newton'):
+            raise ValueError(f"method must be either 'bounded' or 'newton', not {repr(method)}")
+        self._method = method
+
+    ### Warm start ###
+
+    def _load_warm_start(self, spec, *values):
+        warm_start = self._warm_start
+        if warm_start is None: return
+        self._warm_start_key = key = warm_start.key(spec, values, self._index, self._z)
+        entry = warm_start.get(key)
+        if entry is None: return
+        self._T = entry.T
+        self._P = entry.P
+        self._V = entry.V
+        self._y = entry.y.copy()
+        if 'T' in spec:
+            self._bubble_point.P = entry.bubble_point
+            self._dew_point.P = entry.dew_point
+        else:
+            self._bubble_point.T = entry.bubble_point
+            self._dew_point.T = entry.dew_point
+    
+    def _save_warm_start(self, bubble_point, dew_point):
+        key = self._warm_start_key
+        if key is None or self._y is None: return
+        thermal_condition = self._thermal_condition
+        self._warm_start.set(key, VLEWarmStartValues(thermal_condition.T,
+                                                     thermal_condition.P,
+                                                     self._V, self._y.copy(),
+                                                     bubble_point, dew_point))
+        self._warm_start_key = None
 
     ### Single component equilibrium case ###
         
@@ -363,6 +560,7 @@ class VLE(Equilibrium, phases='lg'):
         self._P = thermal_condition.P = P
         if self._N == 0: return
         if self._N == 1: return self._set_thermal_condition_chemical(T, P)
+        self._load_warm_start('TP', T, P)
         # Check if there is equilibrium
         P_dew, x_dew = self._dew_point.solve_Px(self._z, T)
         if P <= P_dew:
@@ -387,6 +585,7 @@ class VLE(Equilibrium, phases='lg'):
         self._vapor_mol[self._index] = v
         self._liquid_mol[self._index] = self._mol - v
         self._H_hat = self.mixture.xH(self._phase_data, T, P)/self._F_mass
+        self._save_warm_start(P_bubble, P_dew)
         
     def set_TV(self, T, V):
         self._setup()
@@ -406,6 +605,7 @@ class VLE(Equilibrium, phases='lg'):
             self._liquid_mol[self._index] = self._mol
             thermal_condition.P = P_bubble
         else:
+            self._load_warm_start('TV', T, V)
             P_dew, x_dew = self._dew_point.solve_Px(self._z, T)
             P_bubble, y_bubble = self._bubble_point.solve_Py(self._z, T)
             self._V = V 
@@ -438,6 +638,7 @@ class VLE(Equilibrium, phases='lg'):
             self._vapor_mol[self._index] = v
             self._liquid_mol[self._index] = mol - v
             self._H_hat = self.mixture.xH(self._phase_data, T, P) / self._F_mass
+            self._save_warm_start(P_bubble, P_dew)
 
     def set_TH(self, T, H):
         self._setup()
@@ -449,6 +650,8 @@ class VLE(Equilibrium, phases='lg'):
         vapor_mol = self._vapor_mol
         liquid_mol = self._liquid_mol
         phase_data = self._phase_data
+        self._load_warm_start('TH', T, H)
+        if self._method == 'newton' and self._set_TH_newton(T, H): return
         
         # Check if super heated vapor
         P_dew, x_dew = self._dew_point.solve_Px(self._z, T)
@@ -486,6 +689,7 @@ class VLE(Equilibrium, phases='lg'):
                         (H_hat,), checkiter=False, checkbounds=False)
         self._P = self._thermal_condition.P = P   
         self._thermal_condition.T = T
+        self._save_warm_start(P_bubble, P_dew)
     
     def set_PV(self, P, V):
         self._setup()
@@ -510,6 +714,7 @@ class VLE(Equilibrium, phases='lg'):
             liquid_mol[index] = mol
             thermal_condition.T = T_bubble
         else:
+            self._load_warm_start('PV', P, V)
             T_dew, x_dew = self._dew_point.solve_Tx(self._z, P)
             T_bubble, y_bubble = self._bubble_point.solve_Ty(self._z, P)
             self._refresh_v(V, y_bubble)
@@ -541,6 +746,7 @@ class VLE(Equilibrium, phases='lg'):
             vapor_mol[index] = v
             liquid_mol[index] = mol - v
             self._H_hat = self.mixture.xH(self._phase_data, T, P)/self._F_mass
+            self._save_warm_start(T_bubble, T_dew)
     
     def set_PH(self, P, H):
         self._setup()
@@ -558,6 +764,8 @@ class VLE(Equilibrium, phases='lg'):
         mol = self._mol
         vapor_mol = self._vapor_mol
         liquid_mol = self._liquid_mol
+        self._load_warm_start('PH', P, H)
+        if self._method == 'newton' and self._set_PH_newton(P, H): return
         
         # Check if subcooled liquid
         T_bubble, y_bubble = self._bubble_point.solve_Ty(self._z, P)
@@ -598,6 +806,142 @@ class VLE(Equilibrium, phases='lg'):
             self._phase_data, H, T, P
         )
         self._H_hat = H_hat
+        self._save_warm_start(T_bubble, T_dew)
+    
+    ### Newton flash ###
+    
+    def _newton_guess(self):
+        x = self._x
+        y = self._y
+        z = self._z
+        if y is None or x is None or x.size != z.size: x = y = z
+        if not 0. < self._V < 1.: self._V = 0.5
+        return x, y
+    
+    def _newton_unpack(self, state):
+        N = self._N
+        x = state[1:N+1]
+        y = state[N+1:]
+        x[x < 1e-32] = 1e-32
+        y[y < 1e-32] = 1e-32
+        return state[0], x / x.sum(), y / y.sum()
+    
+    def _newton_partition(self, x, y, T, P, Psats):
+        Ks = (self._gamma(x, T) * self._pcf(x, T) * Psats 
+              / (P * self._phi(y, T, P)))
+        z = self._z
+        Km1 = Ks - 1.
+        # Rachford-Rice signs at V=0 and V=1 tell whether both phases exist
+        if (z * Km1).sum() <= 0.: V = 0. # Subcooled liquid
+        elif (z * Km1 / Ks).sum() >= 0.: V = 1. # Superheated vapor
+        else: V = binary.phase_fraction(z, Ks, self._V)
+        self._V = V
+        D = 1. + V * Km1
+        x = z / D
+        y = Ks * x
+        # Set phase split and specific enthalpy
+        index = self._index
+        mol = self._mol
+        self._v = v = self._F_mol_vle * V * fn.normalize(y)
+        mask = v > mol
+        v[mask] = mol[mask]
+        self._vapor_mol[index] = v
+        self._liquid_mol[index] = mol - v
+        self._H_hat = self.mixture.xH(self._phase_data, T, P) / self._F_mass
+        return Ks, V, D, fn.normalize(x), fn.normalize(y)
+        
+    def _newton_dv(self, Ks, dKs, V, D):
+        # Derivative of vapor flow rates assuming constant activity and 
+        # fugacity coefficients (Rachford-Rice sensitivity).
+        if V <= 0. or V >= 1.: return 0.
+        z = self._z
+        D2 = D * D
+        dV = (z * dKs / D2).sum() / (z * (Ks - 1.)**2 / D2).sum()
+        return self._F_mol_vle * z * (Ks * dV + V * (1. - V) * dKs) / D2
+    
+    def _newton_Hvaps(self, T):
+        return np.array([i.Hvap.try_out(T) or 0. for i in self._bubble_point.chemicals])
+    
+    def _PH_newton_iter(self, state, P, H_hat, Tmin, Tmax):
+        T, x, y = self._newton_unpack(state)
+        if T < Tmin: T = Tmin
+        elif T > Tmax: T = Tmax
+        dT = 1e-6 * T # Only used by models without analytic derivatives
+        Psat_handles = self._bubble_point.Psats
+        Psats = np.array([i(T) for i in Psat_handles])
+        dPsats = np.array([i.differentiate_by_T(T, None, dT) for i in Psat_handles])
+        Ks, V, D, x, y = self._newton_partition(x, y, T, P, Psats)
+        dv = self._newton_dv(Ks, Ks * dPsats / Psats, V, D)
+        dHdT = (self.mixture.xCn(self._phase_data, T) 
+                + (dv * self._newton_Hvaps(T)).sum()) / self._F_mass
+        dT = (self._H_hat - H_hat) / dHdT
+        max_step = self.newton_max_step
+        if dT > max_step: dT = max_step
+        elif dT < -max_step: dT = -max_step
+        return np.concatenate([(T - dT,), x, y])
+    
+    def _TH_newton_iter(self, state, T, H_hat, Psats, Hvaps):
+        logP, x, y = self._newton_unpack(state)
+        P = np.exp(logP)
+        Ks, V, D, x, y = self._newton_partition(x, y, T, P, Psats)
+        dv = self._newton_dv(Ks, -Ks, V, D)
+        dHdlogP = (dv * Hvaps).sum() / self._F_mass
+        if dHdlogP: logP -= (self._H_hat - H_hat) / dHdlogP
+        return np.concatenate([(logP,), x, y])
+    
+    def _newton_iterate(self, f, state, args, H_hat):
+        H_hat_tol = self.H_hat_tol
+        for i in range(self.newton_maxiter):
+            new_state = f(state, *args)
+            if (abs(self._H_hat - H_hat) < H_hat_tol 
+                and np.abs(new_state[1:] - state[1:]).max() < 1e-9):
+                self._newton_state = new_state
+                return True
+            state = new_state
+        return False
+    
+    def _set_PH_newton(self, P, H):
+        # Newton iteration on temperature with successive substitution of
+        # phase compositions. Partition coefficients are evaluated with activity 
+        # coefficients of the last iteration and dH/dT is computed from the 
+        # heat capacity and the sensitivity of the phase split to temperature
+        # (through analytic dK/dT). Single phase solutions are left to the 
+        # bounded method.
+        bp = self._bubble_point
+        x, y = self._newton_guess()
+        T = self._T or self._thermal_condition.T
+        H_hat = H / self._F_mass
+        state = np.concatenate([(T,), x, y])
+        args = (P, H_hat, bp.Tmin, bp.Tmax)
+        if (not self._newton_iterate(self._PH_newton_iter, state, args, H_hat)
+            or not 0. < self._V < 1.): return False
+        T, x, y = self._newton_unpack(self._newton_state)
+        self._x = x
+        self._y = y
+        self._T = self._thermal_condition.T = T
+        self._save_warm_start(None, None)
+        return True
+    
+    def _set_TH_newton(self, T, H):
+        # Newton iteration on log-pressure with successive substitution of 
+        # phase compositions; dK/dlnP = -K assuming constant fugacity coefficients.
+        # Single phase solutions are left to the bounded method.
+        bp = self._bubble_point
+        Psats = np.array([i(T) for i in bp.Psats])
+        x, y = self._newton_guess()
+        P = self._P or self._thermal_condition.P
+        H_hat = H / self._F_mass
+        state = np.concatenate([(np.log(P),), x, y])
+        args = (T, H_hat, Psats, self._newton_Hvaps(T))
+        if (not self._newton_iterate(self._TH_newton_iter, state, args, H_hat)
+            or not 0. < self._V < 1.): return False
+        logP, x, y = self._newton_unpack(self._newton_state)
+        self._x = x
+        self._y = y
+        self._P = self._thermal_condition.P = np.exp(logP)
+        self._thermal_condition.T = T
+        self._save_warm_start(None, None)
+        return True
     
     def _estimate_v(self, V, y_bubble):
         return (V*self._z + (1-V)*y_bubble) * V * self._F_mol_vle
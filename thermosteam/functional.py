@@ -18,6 +18,7 @@ Functional utilities for the calculation of thermodynamic properties.
 
 """
 from cmath import sqrt as csqrt
+from math import sqrt, acos, cos, copysign, pi
 from flexsolve import njitable
 from .base import functor
 from ._constants import R
@@ -32,6 +33,7 @@ __all__ = ('isobaric_expansion', 'isothermal_compressibility',
            'Vfs_to_zs', 'none_and_length_check', 'normalize', 'mixing_simple', 
            'mixing_logarithmic', 'Parachor', 'SG_to_API', 'API_to_SG', 'SG',
            'horner', 'allclose_variable', 'polylog2', 'horner',
+           'cubic_roots', 'cubic_roots_array',
 )
 
 @functor
@@ -1339,3 +1341,94 @@ def mixing_logarithmic(z, y):
     '''
     return np.exp((z*np.log(y)).sum())
 
+
+@njitable(cache=True)
+def polish_cubic_root(x, b, c, d):
+    # Newton step on x**3 + b*x**2 + c*x + d; large steps (e.g., near a 
+    # double root) are not taken
+    df = (3.*x + 2.*b)*x + c
+    if df:
+        dx = (((x + b)*x + c)*x + d)/df
+        if abs(dx) < 1e-6*abs(x): return x - dx
+    return x
+
+@njitable(cache=True)
+def cubic_roots(b, c, d):
+    r'''
+    Return the real roots of the monic cubic polynomial 
+    :math:`x^3 + bx^2 + cx + d` in ascending order using real arithmetic 
+    (i.e., trigonometric solution for three real roots and Cardano's 
+    formula for one real root), each polished with a Newton step. 
+    If only one root is real, it is returned three times.
+
+    Examples
+    --------
+    >>> [round(i, 12) for i in cubic_roots(-6., 11., -6.)]
+    [1.0, 2.0, 3.0]
+    >>> cubic_roots(0., 0., -8.)
+    (2.0, 2.0, 2.0)
+    
+    '''
+    b_3 = b / 3.
+    p = c - b * b_3
+    q = (2. * b_3 * b_3 - c) * b_3 + d
+    D = 0.25 * q * q + p * p * p / 27.
+    if D > 0.: # One real root
+        u = -0.5 * q - copysign(sqrt(D), q)
+        u = copysign(abs(u) ** (1. / 3.), u)
+        t = u - p / (3. * u) if u else 0.
+        x = polish_cubic_root(t - b_3, b, c, d)
+        return x, x, x
+    elif p == 0.: # Triple root
+        x = -b_3
+        return x, x, x
+    else: # Three real roots
+        r = 2. * sqrt(-p / 3.)
+        cos_3theta = 3. * q / (p * r)
+        if cos_3theta > 1.: cos_3theta = 1.
+        elif cos_3theta < -1.: cos_3theta = -1.
+        theta = acos(cos_3theta) / 3.
+        return (polish_cubic_root(r * cos(theta + 2. * pi / 3.) - b_3, b, c, d),
+                polish_cubic_root(r * cos(theta - 2. * pi / 3.) - b_3, b, c, d),
+                polish_cubic_root(r * cos(theta) - b_3, b, c, d))
+
+def cubic_roots_array(b, c, d):
+    r'''
+    Return a 3 x N array of the real roots of the monic cubic polynomials 
+    :math:`x^3 + bx^2 + cx + d` (in ascending order along the first axis) 
+    given arrays of coefficients. Rows are filled with the only real root
+    when the other two are complex. Same as `cubic_roots`, but vectorized 
+    with NumPy.
+
+    Examples
+    --------
+    >>> cubic_roots_array([-6., 0.], [11., 0.], [-6., -8.])
+    array([[1., 2.],
+           [2., 2.],
+           [3., 2.]])
+    
+    '''
+    b, c, d = np.broadcast_arrays(*[np.asarray(i, float) for i in (b, c, d)])
+    b_3 = b / 3.
+    p = c - b * b_3
+    q = (2. * b_3 * b_3 - c) * b_3 + d
+    D = 0.25 * q * q + p * p * p / 27.
+    one = D > 0.
+    three = ~one
+    roots = np.empty((3, *b.shape))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        q_one = q[one]
+        u = np.cbrt(-0.5 * q_one - np.copysign(np.sqrt(D[one]), q_one))
+        t = np.where(u == 0., 0., u - p[one] / (3. * u))
+        roots[:, one] = t - b_3[one]
+        p = p[three]
+        r = 2. * np.sqrt(-p / 3.)
+        theta = np.arccos(np.clip(np.where(r == 0., 0., 3. * q[three] / (p * r)), -1., 1.)) / 3.
+        roots[0, three] = r * np.cos(theta + 2. * pi / 3.)
+        roots[1, three] = r * np.cos(theta - 2. * pi / 3.)
+        roots[2, three] = r * np.cos(theta)
+        roots[:, three] -= b_3[three]
+        dx = (((roots + b)*roots + c)*roots + d) / ((3.*roots + 2.*b)*roots + c)
+    polish = np.abs(dx) < 1e-6*np.abs(roots)
+    roots[polish] -= dx[polish]
+    return roots
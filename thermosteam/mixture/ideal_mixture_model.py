@@ -8,9 +8,15 @@
 """
 """
 from ..base import display_asfunctor
+from .._settings import settings
+import numpy as np
 
 __all__ = ('IdealMixtureModel',)
 
+#: [int] Minimum number of points to evaluate chemical models in bulk
+#: (fewer points are evaluated one by one, which has less overhead).
+min_array_size = 8
+
 class IdealMixtureModel:
     """
     Create an IdealMixtureModel object that calculates mixture properties
@@ -22,6 +28,9 @@ class IdealMixtureModel:
         Chemical property functions of temperature and pressure.
     var : str
         Description of thermodynamic variable returned.
+    cache=None : MixturePropertyCache, optional
+        Stores recently computed results (only used when
+        `thermosteam.settings.cache_mixture_properties` is True).
     
     Notes
     -----
@@ -46,14 +55,87 @@ class IdealMixtureModel:
     84902.48775001227
     
     """
-    __slots__ = ('var', 'models',)
+    __slots__ = ('var', 'models', 'cache')
 
-    def __init__(self, models, var):
+    def __init__(self, models, var, cache=None):
         self.models = tuple(models)
         self.var = var
+        self.cache = cache
 
     def __call__(self, mol, T, P=None):
-        return sum([j * i(T, P) for i, j in zip(self.models, mol) if j])
+        cache = self.cache
+        if cache is None or not settings.cache_mixture_properties:
+            return self.evaluate(mol, T, P)
+        key = (self, T, P, mol.tobytes() if hasattr(mol, 'tobytes') else tuple(mol))
+        value = cache.get(key)
+        if value is None:
+            value = self.evaluate(mol, T, P)
+            cache.set(key, value)
+        return value
     
+    def evaluate(self, mol, T, P=None):
+        """Return mixture property without using the cache."""
+        return sum([j * i(T, P) for i, j in zip(self.models, mol) if j])
+
+    def evaluate_array(self, mol, T, P=None):
+        """
+        Return an array of mixture properties evaluated at each row of
+        `mol` (a 2d array) and the corresponding temperature in `T` (and
+        pressure in `P`). Each chemical model is evaluated in bulk
+        over the rows in which the chemical is present (unless there are
+        only a few rows).
+
+        Examples
+        --------
+        >>> from thermosteam.mixture import IdealMixtureModel
+        >>> from thermosteam import Chemicals
+        >>> chemicals = Chemicals(['Water', 'Ethanol'])
+        >>> models = [i.Psat for i in chemicals]
+        >>> mixture_model = IdealMixtureModel(models, 'Psat')
+        >>> mixture_model.evaluate_array([[0.2, 0.8], [1.0, 0.]], [350., 350.])
+        array([84902.488, 41619.817])
+
+        """
+        mol = np.asarray(mol, float)
+        N = mol.shape[0]
+        T = np.broadcast_to(np.asarray(T, float), (N,))
+        if P is not None: P = np.broadcast_to(np.asarray(P, float), (N,))
+        if N < min_array_size:
+            evaluate = self.evaluate
+            if P is None:
+                return np.array([evaluate(i, j) for i, j in zip(mol, T.tolist())], float)
+            else:
+                return np.array([evaluate(i, j, k) for i, j, k in zip(mol, T.tolist(), P.tolist())], float)
+        values = np.zeros(N)
+        for j, model in enumerate(self.models):
+            flows = mol[:, j]
+            rows = np.flatnonzero(flows)
+            if rows.size == 0: continue
+            if rows.size == N:
+                values += flows * evaluate_model_array(model, T, P)
+            else:
+                values[rows] += flows[rows] * evaluate_model_array(
+                    model, T[rows], None if P is None else P[rows]
+                )
+        return values
+
     def __repr__(self):
         return f"<{display_asfunctor(self)}>"
+
+
+def evaluate_model_array(model, T, P):
+    # Pure chemical models are evaluated only once when all
+    # temperatures and pressures are the same
+    T0 = T[0]
+    if (T == T0).all():
+        if P is None:
+            return np.full(T.size, model(float(T0), None))
+        P0 = P[0]
+        if (P == P0).all(): return np.full(T.size, model(float(T0), float(P0)))
+    evaluate_array = getattr(model, 'evaluate_array', None)
+    if evaluate_array and T.size >= min_array_size:
+        return evaluate_array(T, P)
+    elif P is None:
+        return np.array([model(i, None) for i in T.tolist()], float)
+    else:
+        return np.array([model(i, j) for i, j in zip(T.tolist(), P.tolist())], float)
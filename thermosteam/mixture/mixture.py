@@ -7,9 +7,12 @@
 # for license details.
 """
 """
+import numpy as np
 import flexsolve as flx
+from ..base import ThermoModelHandle
+from ..exceptions import DomainError
 
-__all__ = ('Mixture',)
+__all__ = ('Mixture', 'MixturePropertyCache')
 
 def iter_temperature(T, H, H_model, phase, mol, P, Cn):
     # Used to solve for ethalpy at given temperature
@@ -19,6 +22,104 @@ def xiter_temperature(T, H, H_model, phase_mol, P, Cn):
     # Used to solve for ethalpy at given temperature
     return T + (H - H_model(phase_mol, T, P)) / Cn
 
+def temperature_step(mixture, phase, mol, H, T, P):
+    # Newton step of temperature to match enthalpy (nan if properties cannot be evaluated)
+    try:
+        return (H - mixture.H(phase, mol, T, P)) / mixture.Cn(phase, mol, T)
+    except (DomainError, ArithmeticError, ValueError):
+        return np.nan
+
+def evaluate_rows(model, phase, mol, T, P=None):
+    # Evaluate phase mixture model at each row of a 2d array
+    evaluate_array = getattr(getattr(model, phase, None), 'evaluate_array', None)
+    if evaluate_array: return evaluate_array(mol, T, P)
+    N = len(mol)
+    T = np.broadcast_to(np.asarray(T, float), (N,))
+    if P is None:
+        return np.array([model(phase, i, j) for i, j in zip(mol, T)], float)
+    else:
+        P = np.broadcast_to(np.asarray(P, float), (N,))
+        return np.array([model(phase, i, j, k) for i, j, k in zip(mol, T, P)], float)
+
+# %% Property cache
+
+class MixturePropertyCache:
+    """
+    Create a MixturePropertyCache object that stores recently computed 
+    mixture properties keyed by the mixture model, temperature, pressure, 
+    and molar flow rates. The cache is only used when 
+    `thermosteam.settings.cache_mixture_properties` is True. The oldest 
+    entries are discarded when more than `size` entries are stored, and all 
+    entries are discarded whenever models of any chemical are modified 
+    (e.g., through `add_model`, `set_model_priority`, or `copy_models_from`).
+    
+    Parameters
+    ----------
+    size=1000 : int, optional
+        Maximum number of entries.
+    
+    Examples
+    --------
+    >>> import thermosteam as tmo
+    >>> tmo.settings.set_thermo(['Water', 'Ethanol'])
+    >>> tmo.settings.cache_mixture_properties = True
+    >>> s = tmo.Stream('s', Water=10, Ethanol=2, T=350)
+    >>> cache = s.mixture.cache
+    >>> cache.clear()
+    >>> round(s.H)
+    51936
+    >>> round(s.H)
+    51936
+    >>> cache
+    MixturePropertyCache(size=1000, hits=1, misses=1)
+    >>> s.chemicals.Water.Cn.l.set_model_priority(0) # Invalidates cache
+    >>> round(s.H)
+    51936
+    >>> cache
+    MixturePropertyCache(size=1000, hits=1, misses=2)
+    >>> s.chemicals.Water.copy_models_from(tmo.Chemical('Ethanol'), ['Cn']) # Invalidates cache
+    >>> round(s.H)
+    77215
+    >>> cache
+    MixturePropertyCache(size=1000, hits=1, misses=3)
+    >>> tmo.settings.cache_mixture_properties = False
+    
+    """
+    __slots__ = ('size', 'entries', 'hits', 'misses', '_revision')
+    
+    def __init__(self, size=1000):
+        self.size = size
+        self.entries = {}
+        self.hits = self.misses = 0
+        self._revision = ThermoModelHandle.revision
+    
+    def get(self, key):
+        """Return cached value or None if not available."""
+        if self._revision != ThermoModelHandle.revision:
+            self.entries.clear()
+            self._revision = ThermoModelHandle.revision
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+    
+    def set(self, key, value):
+        """Store value."""
+        entries = self.entries
+        entries[key] = value
+        if len(entries) > self.size: del entries[next(iter(entries))]
+    
+    def clear(self):
+        """Remove all entries and reset hit/miss counters."""
+        self.entries.clear()
+        self.hits = self.misses = 0
+        
+    def __repr__(self):
+        return f"{type(self).__name__}(size={self.size}, hits={self.hits}, misses={self.misses})"
+
+
 # %% Ideal mixture
 
 class Mixture:
@@ -54,6 +155,8 @@ class Mixture:
     include_excess_energies=False : bool
         Whether to include excess energies
         in enthalpy and entropy calculations.
+    cache=None : MixturePropertyCache, optional
+        Stores recently computed mixture properties.
     
     Notes
     -----
@@ -85,6 +188,8 @@ class Mixture:
         Mixture surface tension [N/m].
     epsilon(mol, T, P) : 
         Mixture relative permitivity [-].
+    cache : MixturePropertyCache or None
+        Stores recently computed mixture properties.
     
     
     """
@@ -93,13 +198,14 @@ class Mixture:
                  'include_excess_energies',
                  'Cn', 'mu', 'V', 'kappa',
                  'Hvap', 'sigma', 'epsilon',
-                 '_H', '_H_excess', '_S', '_S_excess',
+                 '_H', '_H_excess', '_S', '_S_excess', 'cache',
     )
     
     def __init__(self, rule, Cn, H, S, H_excess, S_excess,
                  mu, V, kappa, Hvap, sigma, epsilon,
-                 include_excess_energies=False):
+                 include_excess_energies=False, cache=None):
         self.rule = rule
+        self.cache = cache
         self.include_excess_energies = include_excess_energies
         self.Cn = Cn
         self.mu = mu
@@ -127,11 +233,80 @@ class Mixture:
             S += self._S_excess(phase, mol, T, P)
         return S
     
+    def H_array(self, phase, mol, T, P):
+        """Return enthalpy [J/mol] of each row of `mol` (a 2d array) at temperatures `T` and pressures `P`."""
+        H = evaluate_rows(self._H, phase, mol, T)
+        if self.include_excess_energies:
+            H += evaluate_rows(self._H_excess, phase, mol, T, P)
+        return H
+
+    def Cn_array(self, phase, mol, T):
+        """Return molar heat capacity [J/mol/K] of each row of `mol` (a 2d array) at temperatures `T`."""
+        return evaluate_rows(self.Cn, phase, mol, T)
+
+    def V_array(self, phase, mol, T, P):
+        """Return molar volume [m^3/mol] of each row of `mol` (a 2d array) at temperatures `T` and pressures `P`."""
+        return evaluate_rows(self.V, phase, mol, T, P)
+
     def solve_T(self, phase, mol, H, T_guess, P):
         """Solve for temperature in Kelvin."""
         args = (H, self.H, phase, mol, P, self.Cn(phase, mol, T_guess))
         return flx.aitken(iter_temperature, T_guess, 1e-6, args, 10, checkiter=False)
                 
+    def solve_T_array(self, phase, mol, H, T_guess, P, xtol=1e-6, maxiter=20):
+        """
+        Solve for the temperature [K] of each row of `mol` (a 2d array) given 
+        enthalpies `H` with a vectorized Newton method (using the heat 
+        capacity as the derivative). Return an array of temperatures and a 
+        boolean array of whether each row converged. Rows that do not 
+        converge within `maxiter` iterations, or in which properties 
+        cannot be evaluated (or the next estimate is not positive), are 
+        left at their initial temperature.
+        
+        Examples
+        --------
+        >>> import thermosteam as tmo
+        >>> tmo.settings.set_thermo(['Water', 'Ethanol'])
+        >>> mixture = tmo.settings.get_thermo().mixture
+        >>> mol = [[10, 2], [5, 5]]
+        >>> H = mixture.H_array('l', mol, [320., 340.], 101325.)
+        >>> T, converged = mixture.solve_T_array('l', mol, H, 298.15, 101325.)
+        >>> T.round(6), converged
+        (array([320., 340.]), array([ True,  True]))
+        >>> mixture.solve_T_array('l', mol, [H[0], 1e9], 298.15, 101325.)
+        (array([320.  , 298.15]), array([ True, False]))
+        
+        """
+        mol = np.asarray(mol, float)
+        N = mol.shape[0]
+        T_guess = np.broadcast_to(np.asarray(T_guess, float), (N,))
+        T = T_guess.copy()
+        P = np.broadcast_to(np.asarray(P, float), (N,))
+        H = np.broadcast_to(np.asarray(H, float), (N,))
+        converged = ~mol.any(1) # Empty rows have no enthalpy to match
+        active = np.flatnonzero(~converged)
+        for i in range(maxiter):
+            if not active.size: break
+            T_active = T[active]
+            mol_active = mol[active]
+            H_active = H[active]
+            P_active = P[active]
+            try:
+                dT = ((H_active - self.H_array(phase, mol_active, T_active, P_active))
+                      / self.Cn_array(phase, mol_active, T_active))
+            except (DomainError, ArithmeticError, ValueError):
+                dT = np.array([temperature_step(self, phase, *args) for args in 
+                               zip(mol_active, H_active.tolist(), T_active.tolist(), P_active.tolist())])
+            T_new = T_active + dT
+            feasible = np.isfinite(dT) & (T_new > 0.)
+            T[active[feasible]] = T_new[feasible]
+            done = feasible & (np.abs(dT) <= xtol)
+            converged[active[done]] = True
+            active = active[feasible & ~done]
+        unconverged = ~converged
+        T[unconverged] = T_guess[unconverged]
+        return T, converged
+                
     def xsolve_T(self, phase_mol, H, T_guess, P):
         """Solve for temperature in Kelvin."""
         args = (H, self.xH, tuple(phase_mol), P, self.xCn(phase_mol, T_guess))
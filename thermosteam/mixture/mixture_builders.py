@@ -11,7 +11,7 @@ All Mixture object builders.
 """
 from ..base import PhaseMixtureHandle
 from .ideal_mixture_model import IdealMixtureModel
-from .mixture import Mixture
+from .mixture import Mixture, MixturePropertyCache
 
 __all__ = ('ideal_mixture',)
 
@@ -33,13 +33,13 @@ def group_handles_by_phase(phase_handles):
             handles.append(prop)
     return handles_by_phase
     
-def build_ideal_PhaseMixtureHandle(chemicals, var):
+def build_ideal_PhaseMixtureHandle(chemicals, var, cache=None):
     setfield = object.__setattr__
     getfield = getattr
     phase_handles = [getfield(i, var) for i in chemicals]
     new = PhaseMixtureHandle.__new__(PhaseMixtureHandle)
     for phase, handles in group_handles_by_phase(phase_handles).items():
-        setfield(new, phase, IdealMixtureModel(handles, var))
+        setfield(new, phase, IdealMixtureModel(handles, var, cache))
     setfield(new, 'var', var)
     return new
 
@@ -75,16 +75,18 @@ def ideal_mixture(chemicals,
     """
     chemicals = tuple(chemicals)
     getfield = getattr
-    Cn =  build_ideal_PhaseMixtureHandle(chemicals, 'Cn')
-    H =  build_ideal_PhaseMixtureHandle(chemicals, 'H')
-    S = build_ideal_PhaseMixtureHandle(chemicals, 'S')
-    H_excess = build_ideal_PhaseMixtureHandle(chemicals, 'H_excess')
-    S_excess = build_ideal_PhaseMixtureHandle(chemicals, 'S_excess')
-    mu = build_ideal_PhaseMixtureHandle(chemicals, 'mu')
-    V = build_ideal_PhaseMixtureHandle(chemicals, 'V')
-    kappa = build_ideal_PhaseMixtureHandle(chemicals, 'kappa')
-    Hvap = IdealMixtureModel([getfield(i, 'Hvap') for i in chemicals], 'Hvap')
-    sigma = IdealMixtureModel([getfield(i, 'sigma') for i in chemicals], 'sigma')
-    epsilon = IdealMixtureModel([getfield(i, 'epsilon') for i in chemicals], 'epsilon')
+    cache = MixturePropertyCache()
+    Cn =  build_ideal_PhaseMixtureHandle(chemicals, 'Cn', cache)
+    H =  build_ideal_PhaseMixtureHandle(chemicals, 'H', cache)
+    S = build_ideal_PhaseMixtureHandle(chemicals, 'S', cache)
+    H_excess = build_ideal_PhaseMixtureHandle(chemicals, 'H_excess', cache)
+    S_excess = build_ideal_PhaseMixtureHandle(chemicals, 'S_excess', cache)
+    mu = build_ideal_PhaseMixtureHandle(chemicals, 'mu', cache)
+    V = build_ideal_PhaseMixtureHandle(chemicals, 'V', cache)
+    kappa = build_ideal_PhaseMixtureHandle(chemicals, 'kappa', cache)
+    Hvap = IdealMixtureModel([getfield(i, 'Hvap') for i in chemicals], 'Hvap', cache)
+    sigma = IdealMixtureModel([getfield(i, 'sigma') for i in chemicals], 'sigma', cache)
+    epsilon = IdealMixtureModel([getfield(i, 'epsilon') for i in chemicals], 'epsilon', cache)
     return Mixture('ideal mixing', Cn, H, S, H_excess, S_excess,
-                   mu, V, kappa, Hvap, sigma, epsilon, include_excess_energies)
\ No newline at end of file
+                   mu, V, kappa, Hvap, sigma, epsilon, include_excess_energies,
+                   cache)
\ No newline at end of file
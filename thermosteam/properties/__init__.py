@@ -40,6 +40,7 @@ from . import (acentric,
                volume,
                unifac,
 )
+from .data import preload
 
 __all__ = ('combustion', 
            'electrolyte_conductivity', 
@@ -64,4 +65,5 @@ __all__ = ('combustion',
            'acentric', 
            'dippr',
            'unifac',
+           'preload',
 )
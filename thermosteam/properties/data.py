@@ -18,10 +18,13 @@ All data and methods for the internal retrieval of data from CAS numbers.
 
 """
 from collections import namedtuple
-from .readers import CASDataReader, load_json, to_nums, get_from_data_sources
+from .readers import (CASDataReader, CASDataSource, LazyDataDict,
+                      load_json, to_nums, get_from_data_sources)
+from functools import partial, lru_cache
 import os
 
 __all__ = ('get_from_data_sources',
+           'preload',
            'critical_data_IUPAC',
            'critical_data_Matthews',
            'critical_data_CRC',
@@ -104,7 +107,7 @@ inorganic_data_CRC = read('Physical Constants of Inorganic Compounds.csv')
 organic_data_CRC = read('Physical Constants of Organic Compounds.csv')
 
 ### VDI Saturation
-VDI_saturation_dict = load_json(read.folder, 'VDI Saturation Compounds Data.json')
+VDI_saturation_dict = LazyDataDict(partial(load_json, read.folder, 'VDI Saturation Compounds Data.json'))
 #: Read in a dict of assorted chemical properties at saturation for 58
 #: industrially important chemicals, from:
 #: Gesellschaft, V. D. I., ed. VDI Heat Atlas. 2E. Berlin : Springer, 2010.
@@ -265,7 +268,7 @@ read = CASDataReader('Heat Capacity')
 Cn_data_Poling = read('PolingDatabank.tsv')
 Cn_data_TRC_gas = read('TRC Thermodynamics of Organic Compounds in the Gas State.tsv')
 Cn_data_CRC_standard = read('CRC Standard Thermodynamic Properties of Chemical Substances.tsv')
-Cn_data_PerryI = load_json(read.folder, 'Perrys Table 2-151.json')
+Cn_data_PerryI = LazyDataDict(partial(load_json, read.folder, 'Perrys Table 2-151.json'))
 # Read in a dict of heat capacities of irnorganic and elemental solids.
 # These are in section 2, table 151 in:
 # Green, Don, and Robert Perry. Perry's Chemical Engineers' Handbook,
@@ -275,17 +278,44 @@ Cn_data_PerryI = load_json(read.folder, 'Perrys Table 2-151.json')
 # Phases:
 # c, gls, l, g.
 
-zabransky_dict_sat_s = {}
-zabransky_dict_sat_p = {}
-zabransky_dict_const_s = {}
-zabransky_dict_const_p = {}
-zabransky_dict_iso_s = {}
-zabransky_dict_iso_p = {}
+@lru_cache(maxsize=None)
+def load_zabransky_dicts(folder=read.folder):
+    zabransky_dicts = {('C', True): {}, 
+                       ('C', False): {},
+                       ('sat', True): {},
+                       ('sat', False): {},
+                       ('p', True): {},
+                       ('p', False): {}}
+    with open(os.path.join(folder, 'Zabransky.tsv'), encoding='utf-8') as f:
+        next(f)
+        for line in f:
+            values = to_nums(line.strip('\n').split('\t'))
+            (CAS, name, Type, uncertainty, Tmin, Tmax, a1s, a2s, a3s, a4s, a1p, a2p, a3p, a4p, a5p, a6p, Tc) = values
+            spline = bool(a1s) # False if Quasypolynomial, True if spline
+            d = zabransky_dicts[(Type, spline)]
+            if spline:
+                if CAS not in d:
+                    d[CAS] = [(a1s, a2s, a3s, a4s, Tmin, Tmax)]
+                else:
+                    d[CAS].append((a1s, a2s, a3s, a4s, Tmin, Tmax))
+            else:
+                # No duplicates for quasipolynomials
+                d[CAS] = (Tc, a1p, a2p, a3p, a4p, a5p, a6p, Tmin, Tmax)
+    return zabransky_dicts
+
+def zabransky_dict(Type, spline):
+    return LazyDataDict(lambda: load_zabransky_dicts()[(Type, spline)])
 
 # C means average heat capacity values, from less rigorous experiments
 # sat means heat capacity along the saturation line
 # p means constant-pressure values, 
 # second argument is whether or not it has a spline
+zabransky_dict_sat_s = zabransky_dict('sat', True)
+zabransky_dict_sat_p = zabransky_dict('sat', False)
+zabransky_dict_const_s = zabransky_dict('C', True)
+zabransky_dict_const_p = zabransky_dict('C', False)
+zabransky_dict_iso_s = zabransky_dict('p', True)
+zabransky_dict_iso_p = zabransky_dict('p', False)
 type_to_zabransky_dict = {('C', True): zabransky_dict_const_s, 
                           ('C', False):   zabransky_dict_const_p,
                           ('sat', True):  zabransky_dict_sat_s,
@@ -293,22 +323,6 @@ type_to_zabransky_dict = {('C', True): zabransky_dict_const_s,
                           ('p', True):    zabransky_dict_iso_s,
                           ('p', False):   zabransky_dict_iso_p}
 
-with open(os.path.join(read.folder, 'Zabransky.tsv'), encoding='utf-8') as f:
-    next(f)
-    for line in f:
-        values = to_nums(line.strip('\n').split('\t'))
-        (CAS, name, Type, uncertainty, Tmin, Tmax, a1s, a2s, a3s, a4s, a1p, a2p, a3p, a4p, a5p, a6p, Tc) = values
-        spline = bool(a1s) # False if Quasypolynomial, True if spline
-        d = type_to_zabransky_dict[(Type, spline)]
-        if spline:
-            if CAS not in d:
-                d[CAS] = [(a1s, a2s, a3s, a4s, Tmin, Tmax)]
-            else:
-                d[CAS].append((a1s, a2s, a3s, a4s, Tmin, Tmax))
-        else:
-            # No duplicates for quasipolynomials
-            d[CAS] = (Tc, a1p, a2p, a3p, a4p, a5p, a6p, Tmin, Tmax)
-
 # %% Heat of formation
 
 read = CASDataReader("Reactions")
@@ -397,51 +411,64 @@ electrolyte_dissociation_reactions = read('Electrolyte dissociations.csv', sep=N
 McCleskey_parameters = namedtuple("McCleskey_parameters",
                                   ["Formula", 'lambda_coeffs', 'A_coeffs', 'B', 'multiplier'])
 
-McCleskey_conductivities = {}
-with open(os.path.join(read.folder, 'McCleskey Electrical Conductivity.csv')) as f:
-    next(f)
-    for line in f:
-        values = line.strip().split('\t')
-        formula, CASRN, lbt2, lbt, lbc, At2, At, Ac, B, multiplier = to_nums(values)
-        McCleskey_conductivities[CASRN] = McCleskey_parameters(formula, 
-            [lbt2, lbt, lbc], [At2, At, Ac], B, multiplier)
+def load_McCleskey_conductivities(folder=read.folder):
+    McCleskey_conductivities = {}
+    with open(os.path.join(folder, 'McCleskey Electrical Conductivity.csv')) as f:
+        next(f)
+        for line in f:
+            values = line.strip().split('\t')
+            formula, CASRN, lbt2, lbt, lbc, At2, At, Ac, B, multiplier = to_nums(values)
+            McCleskey_conductivities[CASRN] = McCleskey_parameters(formula, 
+                [lbt2, lbt, lbc], [At2, At, Ac], B, multiplier)
+    return McCleskey_conductivities
+
+McCleskey_conductivities = LazyDataDict(load_McCleskey_conductivities)
 
 Lange_cond_pure = read('Lange Pure Species Conductivity.tsv')
 
 # %% Electrolytes
 
 read = CASDataReader('Electrolytes')
-Laliberte_Density_ParametersDict = {}
-Laliberte_Viscosity_ParametersDict = {}
-Laliberte_Heat_Capacity_ParametersDict = {}
-
-# Do not re-implement with Pandas, as current methodology uses these dicts in each function
-with open(os.path.join(read.folder, 'Laliberte2009.tsv')) as f:
-    next(f)
-    for line in f:
-        values = to_nums(line.split('\t'))
-
-        _name, CASRN, _formula, _MW, c0, c1, c2, c3, c4, Tmin, Tmax, wMax, pts = values[0:13]
-        if c0:
-            Laliberte_Density_ParametersDict[CASRN] = {"Name":_name, "Formula":_formula,
-            "MW":_MW, "C0":c0, "C1":c1, "C2":c2, "C3":c3, "C4":c4, "Tmin":Tmin, "Tmax":Tmax, "wMax":wMax}
-
-        v1, v2, v3, v4, v5, v6, Tmin, Tmax, wMax, pts = values[13:23]
-        if v1:
-            Laliberte_Viscosity_ParametersDict[CASRN] = {"Name":_name, "Formula":_formula,
-            "MW":_MW, "V1":v1, "V2":v2, "V3":v3, "V4":v4, "V5":v5, "V6":v6, "Tmin":Tmin, "Tmax":Tmax, "wMax":wMax}
-
-        a1, a2, a3, a4, a5, a6, Tmin, Tmax, wMax, pts = values[23:34]
-        if a1:
-            Laliberte_Heat_Capacity_ParametersDict[CASRN] = {"Name":_name, "Formula":_formula,
-            "MW":_MW, "A1":a1, "A2":a2, "A3":a3, "A4":a4, "A5":a5, "A6":a6, "Tmin":Tmin, "Tmax":Tmax, "wMax":wMax}
+@lru_cache(maxsize=None)
+def load_Laliberte_dicts(folder=read.folder):
+    Laliberte_Density_ParametersDict = {}
+    Laliberte_Viscosity_ParametersDict = {}
+    Laliberte_Heat_Capacity_ParametersDict = {}
+    
+    # Do not re-implement with Pandas, as current methodology uses these dicts in each function
+    with open(os.path.join(folder, 'Laliberte2009.tsv')) as f:
+        next(f)
+        for line in f:
+            values = to_nums(line.split('\t'))
+    
+            _name, CASRN, _formula, _MW, c0, c1, c2, c3, c4, Tmin, Tmax, wMax, pts = values[0:13]
+            if c0:
+                Laliberte_Density_ParametersDict[CASRN] = {"Name":_name, "Formula":_formula,
+                "MW":_MW, "C0":c0, "C1":c1, "C2":c2, "C3":c3, "C4":c4, "Tmin":Tmin, "Tmax":Tmax, "wMax":wMax}
+    
+            v1, v2, v3, v4, v5, v6, Tmin, Tmax, wMax, pts = values[13:23]
+            if v1:
+                Laliberte_Viscosity_ParametersDict[CASRN] = {"Name":_name, "Formula":_formula,
+                "MW":_MW, "V1":v1, "V2":v2, "V3":v3, "V4":v4, "V5":v5, "V6":v6, "Tmin":Tmin, "Tmax":Tmax, "wMax":wMax}
+    
+            a1, a2, a3, a4, a5, a6, Tmin, Tmax, wMax, pts = values[23:34]
+            if a1:
+                Laliberte_Heat_Capacity_ParametersDict[CASRN] = {"Name":_name, "Formula":_formula,
+                "MW":_MW, "A1":a1, "A2":a2, "A3":a3, "A4":a4, "A5":a5, "A6":a6, "Tmin":Tmin, "Tmax":Tmax, "wMax":wMax}
+    return (Laliberte_Density_ParametersDict,
+            Laliberte_Viscosity_ParametersDict,
+            Laliberte_Heat_Capacity_ParametersDict)
+
+Laliberte_Density_ParametersDict = LazyDataDict(lambda: load_Laliberte_dicts()[0])
+Laliberte_Viscosity_ParametersDict = LazyDataDict(lambda: load_Laliberte_dicts()[1])
+Laliberte_Heat_Capacity_ParametersDict = LazyDataDict(lambda: load_Laliberte_dicts()[2])
 Laliberte_data = read('Laliberte2009.tsv'),
 
 
 # %% Mixtures
 
 read = CASDataReader('Identifiers')
-mixture_dict = load_json(read.folder, 'Mixtures Compositions.json')
+mixture_dict = LazyDataDict(partial(load_json, read.folder, 'Mixtures Compositions.json'))
 # Read in a dict of 90 or so mixutres, their components, and synonyms.
 # Small errors in mole fractions not adding to 1 are known.
 # Errors in adding mass fraction are less common, present at the 5th decimal.
@@ -481,4 +508,41 @@ def mixture_from_any(ID):
     for i in [ID, ID2, ID3]:
         if i in mixture_dict:
             return mixture_dict[i]
-    raise LookupError('Mixture name not recognized')
\ No newline at end of file
+    raise LookupError('Mixture name not recognized')
+
+# %% Preloading
+
+def preload(*names):
+    """
+    Load data sources that are otherwise loaded on first access (e.g. to
+    pay the cost up front in long running processes).
+    
+    Parameters
+    ----------
+    *names : str, optional
+        Names of data sources in this module or in the `unifac` module 
+        (e.g. 'critical_data_IUPAC', 'UFIP'). Defaults to all data sources.
+    
+    Examples
+    --------
+    >>> from thermosteam.properties import preload
+    >>> from thermosteam.properties.data import critical_data_IUPAC
+    >>> preload('critical_data_IUPAC')
+    >>> critical_data_IUPAC.loaded
+    True
+    
+    """
+    from . import unifac
+    dct = {**vars(unifac), **globals()}
+    if names:
+        sources = [dct[i] for i in names]
+    else:
+        sources = [i for i in dct.values() 
+                   if isinstance(i, (CASDataSource, LazyDataDict))]
+    for source in sources:
+        if isinstance(source, dict):
+            for i in source.values(): i.load()
+        elif isinstance(source, tuple):
+            for i in source: i.load()
+        else:
+            source.load()
@@ -143,6 +143,11 @@ def DIPPR_EQ101(T, a, b, c, d, e):
     """
     return exp(a + b/T + c*log(T) + d*T**e)
 
+@functor
+def DIPPR_EQ101_derivative_by_T(T, a, b, c, d, e):
+    """T-Derivative of DPPR Equation #101."""
+    return exp(a + b/T + c*log(T) + d*T**e) * (-b/(T*T) + c/T + d*e*T**(e - 1.))
+
 @functor
 def DIPPR_EQ102(T, a, b, c, d):
     r"""
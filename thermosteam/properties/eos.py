@@ -26,9 +26,137 @@ from scipy.optimize import newton
 from ..functional import (Cp_minus_Cv, isobaric_expansion,
                           isothermal_compressibility,
                           phase_identification_parameter,
-                          horner)
+                          horner, cubic_roots, cubic_roots_array)
 from .._constants import R
 from math import log, exp, sqrt, copysign
+from flexsolve import njitable
+from ..base.functor import array_function
+from ..exceptions import DomainError
+import numpy as np
+
+#: dict[str|None, int] Phase selection codes used by `cubic_departures`.
+departure_phase_codes = {None: 0, 'l': 1, 'g': 2}
+
+# %% Volume roots and departures
+
+@njitable(cache=True)
+def compressibility_cubic_coefficients(T, P, b, delta, epsilon, a_alpha):
+    # Coefficients of the cubic EOS in terms of the compressibility factor,
+    # Z**3 + c2*Z**2 + c1*Z + c0 = 0, and the molar volume of an ideal gas
+    RT = R*T
+    V_ideal = RT/P
+    B = b/V_ideal
+    A = a_alpha/(RT*V_ideal)
+    D = delta/V_ideal
+    E = epsilon/(V_ideal*V_ideal)
+    return D - B - 1., E - B*D - D + A, -E*(B + 1.) - A*B, V_ideal
+
+@njitable(cache=True)
+def volume_roots(T, P, b, delta, epsilon, a_alpha):
+    # Real volume roots of the cubic EOS in ascending order (see `cubic_roots`)
+    c2, c1, c0, V_ideal = compressibility_cubic_coefficients(T, P, b, delta, epsilon, a_alpha)
+    Z0, Z1, Z2 = cubic_roots(c2, c1, c0)
+    return Z0*V_ideal, Z1*V_ideal, Z2*V_ideal
+
+def volume_roots_array(T, P, b, delta, epsilon, a_alpha):
+    # Vectorized version of `volume_roots` returning a 3 x N array
+    c2, c1, c0, V_ideal = compressibility_cubic_coefficients(T, P, b, delta, epsilon, a_alpha)
+    return cubic_roots_array(c2, c1, c0) * V_ideal
+
+@njitable(cache=True)
+def departures_at_volume(T, P, V, b, delta, epsilon, a_alpha, da_alpha_dT):
+    # Real part of the departures given by `GCEOS.main_derivatives_and_departures`;
+    # the limit as delta^2 - 4*epsilon -> 0 is taken for the VDW EOS.
+    x0 = 2.*V + delta
+    x1 = delta*delta - 4.*epsilon
+    if x1 == 0.:
+        x2 = 2./x0
+    else:
+        x3 = sqrt(x1)
+        x4 = x0/x3
+        x2 = log(abs((1. + x4)/(1. - x4)))/x3
+    H_dep = P*V - R*T + x2*(T*da_alpha_dT - a_alpha)
+    S_dep = R*log(abs(P*(V - b)/(R*T))) + da_alpha_dT*x2
+    return H_dep, S_dep
+
+@njitable(cache=True)
+def is_liquid_volume(T, V, b, delta, epsilon, a_alpha, da_alpha_dT):
+    # Phase identification parameter (PIP) > 1 for liquids
+    x0 = V - b
+    x1 = V*V + V*delta + epsilon
+    x2 = R*T/(x0*x0)
+    x3 = 2.*V + delta
+    x4 = 1./(x1*x1)
+    x5 = a_alpha*x4
+    dP_dT = R/x0 - da_alpha_dT/x1
+    dP_dV = x3*x5 - x2
+    d2P_dV2 = 2.*(x5 - a_alpha*x3*x3*x4/x1 + x2/x0)
+    d2P_dTdV = da_alpha_dT*x3*x4 - R/(x0*x0)
+    return V*(d2P_dTdV/dP_dT - d2P_dV2/dP_dV) > 1.
+
+@njitable(cache=True)
+def cubic_departures(T, P, b, delta, epsilon, a_alpha, da_alpha_dT, phase):
+    # Phase codes are given by `departure_phase_codes`
+    V_l, V, V_g = volume_roots(T, P, b, delta, epsilon, a_alpha)
+    if not V_g >= 0.:
+        return np.nan, np.nan, False
+    if V_l < 0.: # Only positive roots are physical
+        V_l = V if V >= 0. else V_g
+    if V_l == V_g:
+        liquid = is_liquid_volume(T, V_l, b, delta, epsilon, a_alpha, da_alpha_dT)
+        if (phase == 1 and not liquid) or (phase == 2 and liquid):
+            # No volume root of the requested phase
+            return np.nan, np.nan, liquid
+        H_dep, S_dep = departures_at_volume(T, P, V_l, b, delta, epsilon, a_alpha, da_alpha_dT)
+        return H_dep, S_dep, liquid
+    elif phase == 1:
+        H_dep, S_dep = departures_at_volume(T, P, V_l, b, delta, epsilon, a_alpha, da_alpha_dT)
+        return H_dep, S_dep, True
+    elif phase == 2:
+        H_dep, S_dep = departures_at_volume(T, P, V_g, b, delta, epsilon, a_alpha, da_alpha_dT)
+        return H_dep, S_dep, False
+    else:
+        H_dep_l, S_dep_l = departures_at_volume(T, P, V_l, b, delta, epsilon, a_alpha, da_alpha_dT)
+        H_dep_g, S_dep_g = departures_at_volume(T, P, V_g, b, delta, epsilon, a_alpha, da_alpha_dT)
+        if H_dep_l - T*S_dep_l < H_dep_g - T*S_dep_g:
+            return H_dep_l, S_dep_l, True
+        else:
+            return H_dep_g, S_dep_g, False
+
+def cubic_departures_array(T, P, b, delta, epsilon, a_alpha, da_alpha_dT, phase):
+    # Vectorized version of `cubic_departures`
+    V = volume_roots_array(T, P, b, delta, epsilon, a_alpha)
+    real = V >= 0.
+    V_l = np.where(real, V, np.inf).min(0)
+    V_g = np.where(real, V, -np.inf).max(0)
+    V_l[np.isinf(V_l)] = V_g[np.isinf(V_g)] = np.nan
+    single = V_l == V_g
+    f = array_function(departures_at_volume)
+    if phase == 1:
+        H_dep, S_dep = f(T, P, V_l, b, delta, epsilon, a_alpha, da_alpha_dT)
+        liquid = ~single
+    elif phase == 2:
+        H_dep, S_dep = f(T, P, V_g, b, delta, epsilon, a_alpha, da_alpha_dT)
+        liquid = np.zeros(T.shape, bool)
+    else:
+        H_dep_l, S_dep_l = f(T, P, V_l, b, delta, epsilon, a_alpha, da_alpha_dT)
+        H_dep, S_dep = f(T, P, V_g, b, delta, epsilon, a_alpha, da_alpha_dT)
+        liquid = ~single & (H_dep_l - T*S_dep_l < H_dep - T*S_dep)
+        H_dep[liquid] = H_dep_l[liquid]
+        S_dep[liquid] = S_dep_l[liquid]
+    liquid[single] = is_liquid_volume(T[single], V_l[single], b, delta, epsilon,
+                                      a_alpha[single], da_alpha_dT[single])
+    if phase:
+        # No volume root of the requested phase
+        missing = single & (liquid if phase == 2 else ~liquid)
+        H_dep[missing] = S_dep[missing] = np.nan
+    return H_dep, S_dep, liquid
+
+def no_volume_root(eos, phase, T, P):
+    return DomainError(f"{type(eos).__name__} has no {'liquid' if phase == 'l' else 'gas'} "
+                       f"volume root at T={T} K and P={P} Pa", T=T, P=P)
+
+# %% Equations of state
 
 
 class GCEOS:
@@ -127,9 +255,9 @@ class GCEOS:
         Parameters
         ----------
         Vs : list[float]
-            Three possible molar volumes, [m^3/mol]
+            Possible molar volumes, [m^3/mol]
         '''
-        # All roots will have some imaginary component; ignore them if > 1E-9
+        # Ignore roots with an imaginary component > 1E-9 or negative volumes
         good_roots = []
         bad_roots = []
         for i in Vs:
@@ -139,7 +267,7 @@ class GCEOS:
             else:
                 good_roots.append(j)
                 
-        if len(bad_roots) == 2: 
+        if len(good_roots) == 1: 
             V = good_roots[0]
             self.phase = self.set_properties_from_solution(self.T, self.P, V, self.b, self.delta, self.epsilon, self.a_alpha, self.da_alpha_dT, self.d2a_alpha_dT2)
             if self.phase == 'l':
@@ -483,7 +611,8 @@ class GCEOS:
     def volume_solutions(T, P, b, delta, epsilon, a_alpha, quick=True):
         r'''
         Solution of this form of the cubic EOS in terms of volumes. Returns
-        three values, all with some complex part.  
+        the real roots (one or three, in ascending order) if `quick` is True, 
+        and three values, all with some complex part, otherwise.
         
         Parameters
         ----------
@@ -500,19 +629,22 @@ class GCEOS:
         a_alpha : float
             Coefficient calculated by EOS-specific method, [J^2/mol^2/Pa]
         quick : bool, optional
-            Whether to use a SymPy cse-derived expression (3x faster) or 
-            individual formulas
+            Whether to solve the cubic in terms of the compressibility factor
+            with real arithmetic (see `cubic_roots`) or use the closed form
+            solution with complex arithmetic
         
         Returns
         -------
         Vs : list[float]
-            Three possible molar volumes, [m^3/mol]
+            Possible molar volumes, [m^3/mol]
             
         Notes
         -----
-        Using explicit formulas, as can be derived in the following example,
-        is faster than most numeric root finding techniques, and
-        finds all values explicitly. It takes several seconds.
+        The trigonometric solution (three real roots) and Cardano's formula 
+        (one real root) avoid complex arithmetic, which is slow and loses 
+        precision near the critical point. The explicit formulas derived in 
+        the following example (simplified with SymPy's `cse` function) are 
+        used when `quick` is False.
         
         >>> from sympy import *
         >>> P, T, V, R, b, a, delta, epsilon, alpha = symbols('P, T, V, R, b, a, delta, epsilon, alpha')
@@ -521,6 +653,9 @@ class GCEOS:
         >>> #solve(CUBIC, V)
         '''
         if quick:
+            V0, V1, V2 = volume_roots(T, P, b, delta, epsilon, a_alpha)
+            return [V0] if V0 == V2 else [V0, V1, V2]
+        else:
             x0 = 1./P
             x1 = P*b
             x2 = R*T
@@ -549,10 +684,6 @@ class GCEOS:
             return [(x0*x20/x19 - x19 + x5)/3.,
                     (x19*x24 + x22 - x25/x24)/6.,
                     (x19*x26 + x22 - x25/x26)/6.]
-        else:
-            return [-(-3*(-P*b*delta + P*epsilon - R*T*delta + a_alpha)/P + (-P*b + P*delta - R*T)**2/P**2)/(3*(sqrt(-4*(-3*(-P*b*delta + P*epsilon - R*T*delta + a_alpha)/P + (-P*b + P*delta - R*T)**2/P**2)**3 + (27*(-P*b*epsilon - R*T*epsilon - a_alpha*b)/P - 9*(-P*b + P*delta - R*T)*(-P*b*delta + P*epsilon - R*T*delta + a_alpha)/P**2 + 2*(-P*b + P*delta - R*T)**3/P**3)**2)/2 + 27*(-P*b*epsilon - R*T*epsilon - a_alpha*b)/(2*P) - 9*(-P*b + P*delta - R*T)*(-P*b*delta + P*epsilon - R*T*delta + a_alpha)/(2*P**2) + (-P*b + P*delta - R*T)**3/P**3)**(1/3)) - (sqrt(-4*(-3*(-P*b*delta + P*epsilon - R*T*delta + a_alpha)/P + (-P*b + P*delta - R*T)**2/P**2)**3 + (27*(-P*b*epsilon - R*T*epsilon - a_alpha*b)/P - 9*(-P*b + P*delta - R*T)*(-P*b*delta + P*epsilon - R*T*delta + a_alpha)/P**2 + 2*(-P*b + P*delta - R*T)**3/P**3)**2)/2 + 27*(-P*b*epsilon - R*T*epsilon - a_alpha*b)/(2*P) - 9*(-P*b + P*delta - R*T)*(-P*b*delta + P*epsilon - R*T*delta + a_alpha)/(2*P**2) + (-P*b + P*delta - R*T)**3/P**3)**(1/3)/3 - (-P*b + P*delta - R*T)/(3*P),
-                     -(-3*(-P*b*delta + P*epsilon - R*T*delta + a_alpha)/P + (-P*b + P*delta - R*T)**2/P**2)/(3*(-1/2 - sqrt(3)*1j/2)*(sqrt(-4*(-3*(-P*b*delta + P*epsilon - R*T*delta + a_alpha)/P + (-P*b + P*delta - R*T)**2/P**2)**3 + (27*(-P*b*epsilon - R*T*epsilon - a_alpha*b)/P - 9*(-P*b + P*delta - R*T)*(-P*b*delta + P*epsilon - R*T*delta + a_alpha)/P**2 + 2*(-P*b + P*delta - R*T)**3/P**3)**2)/2 + 27*(-P*b*epsilon - R*T*epsilon - a_alpha*b)/(2*P) - 9*(-P*b + P*delta - R*T)*(-P*b*delta + P*epsilon - R*T*delta + a_alpha)/(2*P**2) + (-P*b + P*delta - R*T)**3/P**3)**(1/3)) - (-1/2 - sqrt(3)*1j/2)*(sqrt(-4*(-3*(-P*b*delta + P*epsilon - R*T*delta + a_alpha)/P + (-P*b + P*delta - R*T)**2/P**2)**3 + (27*(-P*b*epsilon - R*T*epsilon - a_alpha*b)/P - 9*(-P*b + P*delta - R*T)*(-P*b*delta + P*epsilon - R*T*delta + a_alpha)/P**2 + 2*(-P*b + P*delta - R*T)**3/P**3)**2)/2 + 27*(-P*b*epsilon - R*T*epsilon - a_alpha*b)/(2*P) - 9*(-P*b + P*delta - R*T)*(-P*b*delta + P*epsilon - R*T*delta + a_alpha)/(2*P**2) + (-P*b + P*delta - R*T)**3/P**3)**(1/3)/3 - (-P*b + P*delta - R*T)/(3*P),
-                     -(-3*(-P*b*delta + P*epsilon - R*T*delta + a_alpha)/P + (-P*b + P*delta - R*T)**2/P**2)/(3*(-1/2 + sqrt(3)*1j/2)*(sqrt(-4*(-3*(-P*b*delta + P*epsilon - R*T*delta + a_alpha)/P + (-P*b + P*delta - R*T)**2/P**2)**3 + (27*(-P*b*epsilon - R*T*epsilon - a_alpha*b)/P - 9*(-P*b + P*delta - R*T)*(-P*b*delta + P*epsilon - R*T*delta + a_alpha)/P**2 + 2*(-P*b + P*delta - R*T)**3/P**3)**2)/2 + 27*(-P*b*epsilon - R*T*epsilon - a_alpha*b)/(2*P) - 9*(-P*b + P*delta - R*T)*(-P*b*delta + P*epsilon - R*T*delta + a_alpha)/(2*P**2) + (-P*b + P*delta - R*T)**3/P**3)**(1/3)) - (-1/2 + sqrt(3)*1j/2)*(sqrt(-4*(-3*(-P*b*delta + P*epsilon - R*T*delta + a_alpha)/P + (-P*b + P*delta - R*T)**2/P**2)**3 + (27*(-P*b*epsilon - R*T*epsilon - a_alpha*b)/P - 9*(-P*b + P*delta - R*T)*(-P*b*delta + P*epsilon - R*T*delta + a_alpha)/P**2 + 2*(-P*b + P*delta - R*T)**3/P**3)**2)/2 + 27*(-P*b*epsilon - R*T*epsilon - a_alpha*b)/(2*P) - 9*(-P*b + P*delta - R*T)*(-P*b*delta + P*epsilon - R*T*delta + a_alpha)/(2*P**2) + (-P*b + P*delta - R*T)**3/P**3)**(1/3)/3 - (-P*b + P*delta - R*T)/(3*P)]
     
     def derivatives_and_departures(self, T, P, V, b, delta, epsilon, a_alpha, da_alpha_dT, d2a_alpha_dT2, quick=True):
         
@@ -838,6 +969,88 @@ class GCEOS:
         
     
 
+    def departures(self, T, P, phase=None):
+        r'''Return the enthalpy and entropy departures at given temperature 
+        and pressure without creating a new EOS object (as `to_TP` does).
+        Only the volume roots, `a_alpha`, and its first temperature 
+        derivative are computed. Arrays of temperatures and pressures are
+        also accepted.
+        
+        Parameters
+        ----------
+        T : float or ndarray
+            Temperature, [K]
+        P : float or ndarray
+            Pressure, [Pa]
+        phase : str, optional
+            Phase of the volume root to use when both liquid and gas roots 
+            exist ('l' for the smallest and 'g' for the largest). Defaults to 
+            the root with the lowest Gibbs free energy departure. When only 
+            one real root exists and it is not of the given phase, a 
+            DomainError is raised (as the departures of that phase are 
+            undefined).
+        
+        Returns
+        -------
+        H_dep : float or ndarray
+            Enthalpy departure, [J/mol]
+        S_dep : float or ndarray
+            Entropy departure, [J/mol/K]
+        phase : str or ndarray[str]
+            Phase of the volume root used; either 'l' or 'g'.
+        
+        Examples
+        --------
+        >>> from thermosteam.properties.eos import PR
+        >>> eos = PR(Tc=507.6, Pc=3025000, omega=0.2975, T=299., P=1E6)
+        >>> H_dep, S_dep, phase = eos.departures(299., 1E6)
+        >>> phase, round(H_dep, 4), round(S_dep, 6)
+        ('l', -31134.7403, -72.475595)
+        >>> round(eos.H_dep_l, 4), round(eos.S_dep_l, 6)
+        (-31134.7403, -72.475595)
+        >>> H_dep, S_dep, phase = eos.departures([400., 500.], [1E6, 1E6], 'g')
+        >>> H_dep.round(2), phase
+        (array([-3549.3 , -1924.73]), array(['g', 'g'], dtype='<U1'))
+        
+        Departures of a phase without a volume root are undefined:
+        
+        >>> eos.departures(299., 1E6, 'g')
+        Traceback (most recent call last):
+        thermosteam.exceptions.DomainError: PR has no gas volume root at T=299.0 K and P=1000000.0 Pa
+        
+        '''
+        code = departure_phase_codes[phase]
+        if isinstance(T, float) and isinstance(P, float):
+            a_alpha, da_alpha_dT, _ = self.a_alpha_and_derivatives(T)
+            H_dep, S_dep, liquid = cubic_departures(
+                T, P, self.b, self.delta, self.epsilon, a_alpha, da_alpha_dT, code
+            )
+            if phase and H_dep != H_dep: raise no_volume_root(self, phase, T, P)
+            return H_dep, S_dep, 'l' if liquid else 'g'
+        T, P = np.broadcast_arrays(np.asarray(T, float), np.asarray(P, float))
+        shape = T.shape
+        if not shape:
+            H_dep, S_dep, phase = self.departures(float(T), float(P), phase)
+            return H_dep, S_dep, phase
+        T = T.ravel()
+        P = P.ravel()
+        try:
+            a_alpha, da_alpha_dT, _ = self.a_alpha_and_derivatives(T)
+            a_alpha = np.array(np.broadcast_to(a_alpha, T.shape), float)
+            da_alpha_dT = np.array(np.broadcast_to(da_alpha_dT, T.shape), float)
+        except (TypeError, ValueError): # Scalar only alpha functions
+            a_alpha, da_alpha_dT = np.array(
+                [self.a_alpha_and_derivatives(i)[:2] for i in T.tolist()], float
+            ).T
+        H_dep, S_dep, liquid = cubic_departures_array(
+            T, P, self.b, self.delta, self.epsilon, a_alpha, da_alpha_dT, code
+        )
+        if phase:
+            missing = np.isnan(H_dep)
+            if missing.any(): raise no_volume_root(self, phase, T[missing], P[missing])
+        return (H_dep.reshape(shape), S_dep.reshape(shape), 
+                np.where(liquid, 'l', 'g').reshape(shape))
+
     def to_TP(self, T, P):
         if T != self.T or P != self.P:
             return self.__class__(T=T, P=P, Tc=self.Tc, Pc=self.Pc, omega=self.omega, **self.kwargs)
@@ -852,6 +1065,14 @@ class GCEOS_DUMMY(GCEOS):
     def __init__(self, T=None, P=None, **kwargs):
         self.T = T
         self.P = P
+    
+    def departures(self, T, P, phase=None):
+        '''Return zero enthalpy and entropy departures (ideal gas).'''
+        if isinstance(T, float) and isinstance(P, float):
+            return 0., 0., phase or 'g'
+        T, P = np.broadcast_arrays(np.asarray(T, float), np.asarray(P, float))
+        zeros = np.zeros(T.shape)
+        return zeros, zeros.copy(), np.full(T.shape, phase or 'g')
 
 # No named parameters
 class ALPHA_FUNCTIONS(GCEOS):
@@ -1510,33 +1731,33 @@ class PR(GCEOS):
     
     >>> eos = PR(Tc=507.6, Pc=3025000, omega=0.2975, T=400., P=1E6)
     >>> eos.V_l, eos.V_g
-    (0.00015607313188529268, 0.0021418760907613724)
+    (0.00015607313188529254, 0.0021418760907613724)
     >>> eos.phase
     'l/g'
     >>> eos.H_dep_l, eos.H_dep_g
-    (-26111.868721160878, -3549.2993749373945)
+    (-26111.868721160892, -3549.2993749373945)
     >>> eos.S_dep_l, eos.S_dep_g
-    (-58.09842815106099, -6.439449710478305)
+    (-58.09842815106104, -6.439449710478305)
     >>> eos.U_dep_l, eos.U_dep_g
-    (-22942.157933046172, -2365.391545698767)
+    (-22942.157933046186, -2365.391545698767)
     >>> eos.G_dep_l, eos.G_dep_g
-    (-2872.497460736482, -973.5194907460723)
+    (-2872.4974607364747, -973.5194907460723)
     >>> eos.A_dep_l, eos.A_dep_g
-    (297.21332737822377, 210.38833849255525)
+    (297.21332737823104, 210.38833849255525)
     >>> eos.beta_l, eos.beta_g
-    (0.0026933709177837514, 0.01012322391117497)
+    (0.0026933709177837345, 0.01012322391117497)
     >>> eos.kappa_l, eos.kappa_g
-    (9.33572154382935e-09, 1.9710669809793307e-06)
+    (9.33572154382927e-09, 1.9710669809793307e-06)
     >>> eos.Cp_minus_Cv_l, eos.Cp_minus_Cv_g
-    (48.510145807408, 44.54414603000346)
+    (48.51014580740775, 44.54414603000346)
     >>> eos.Cv_dep_l, eos.Cp_dep_l
-    (18.89210627002112, 59.08779227742912)
+    (18.892106270021134, 59.08779227742888)
 
     P-T initialization, liquid phase, and round robin trip:
     
     >>> eos = PR(Tc=507.6, Pc=3025000, omega=0.2975, T=299., P=1E6)
     >>> eos.phase, eos.V_l, eos.H_dep_l, eos.S_dep_l
-    ('l', 0.00013022208100139945, -31134.740290463425, -72.47559475426019)
+    ('l', 0.00013022208100140005, -31134.740290463324, -72.47559475425984)
     
     T-V initialization, liquid phase:
     
@@ -1785,7 +2006,7 @@ class PR78(PR):
     
     >>> eos = PR78(Tc=632, Pc=5350000, omega=0.734, T=299., P=1E6)
     >>> eos.phase, eos.V_l, eos.H_dep_l, eos.S_dep_l
-    ('l', 8.351960066075009e-05, -63764.649480508735, -130.73710891262687)
+    ('l', 8.351960066075113e-05, -63764.64948050813, -130.73710891262485)
     
     Notes
     -----
@@ -1868,7 +2089,7 @@ class PRSV(PR):
     
     >>> eos = PRSV(Tc=507.6, Pc=3025000, omega=0.2975, T=299., P=1E6, kappa1=0.05104)
     >>> eos.phase, eos.V_l, eos.H_dep_l, eos.S_dep_l
-    ('l', 0.000130126869448406, -31698.916002476693, -74.16749024350415)
+    ('l', 0.00013012686944840652, -31698.916002476606, -74.16749024350386)
     
     Notes
     -----
@@ -2085,7 +2306,7 @@ class PRSV2(PR):
     
     >>> eos = PRSV2(Tc=507.6, Pc=3025000, omega=0.2975, T=299., P=1E6, kappa1=0.05104, kappa2=0.8634, kappa3=0.460)
     >>> eos.phase, eos.V_l, eos.H_dep_l, eos.S_dep_l
-    ('l', 0.00013018821346475235, -31496.173493225797, -73.61525801151421)
+    ('l', 0.0001301882134647532, -31496.17349322564, -73.61525801151373)
     
     Notes
     -----
@@ -2277,7 +2498,7 @@ class VDW(GCEOS):
     --------    
     >>> eos = VDW(Tc=507.6, Pc=3025000, T=299., P=1E6)
     >>> eos.phase, eos.V_l, eos.H_dep_l, eos.S_dep_l
-    ('l', 0.00022332978038490077, -13385.722837649315, -32.65922018109096)
+    ('l', 0.00022332978038490115, -13385.722837649297, -32.65922018109089)
 
     Notes
     -----
@@ -2439,7 +2660,7 @@ class RK(GCEOS):
     --------    
     >>> eos = RK(Tc=507.6, Pc=3025000, T=299., P=1E6)
     >>> eos.phase, eos.V_l, eos.H_dep_l, eos.S_dep_l
-    ('l', 0.00015189341729751862, -26160.833620674086, -63.01311649400544)
+    ('l', 0.0001518934172975189, -26160.83362067405, -63.013116494005324)
     
     Notes
     -----
@@ -2594,7 +2815,7 @@ class SRK(GCEOS):
     --------    
     >>> eos = SRK(Tc=507.6, Pc=3025000, omega=0.2975, T=299., P=1E6)
     >>> eos.phase, eos.V_l, eos.H_dep_l, eos.S_dep_l
-    ('l', 0.00014682102759032003, -31754.65309653571, -74.3732468359525)
+    ('l', 0.00014682102759032038, -31754.65309653565, -74.37324683595232)
 
     References
     ----------
@@ -2784,7 +3005,7 @@ class APISRK(SRK):
     --------    
     >>> eos = APISRK(Tc=514.0, Pc=6137000.0, S1=1.678665, S2=-0.216396, P=1E6, T=299)
     >>> eos.phase, eos.V_l, eos.H_dep_l, eos.S_dep_l
-    ('l', 7.045692682173235e-05, -42826.271630638774, -103.62694391379836)
+    ('l', 7.045692682173288e-05, -42826.27163063854, -103.62694391379759)
 
     References
     ----------
@@ -2962,7 +3183,7 @@ class TWUPR(PR):
     --------
     >>> eos = TWUPR(Tc=507.6, Pc=3025000, omega=0.2975, T=299., P=1E6)
     >>> eos.V_l, eos.H_dep_l, eos.S_dep_l
-    (0.0001301754975832378, -31652.72639160809, -74.11282530917981)
+    (0.0001301754975832384, -31652.726391607986, -74.11282530917947)
     
     Notes
     -----
@@ -3169,7 +3390,7 @@ class TWUSRK(SRK):
     --------    
     >>> eos = TWUSRK(Tc=507.6, Pc=3025000, omega=0.2975, T=299., P=1E6)
     >>> eos.phase, eos.V_l, eos.H_dep_l, eos.S_dep_l
-    ('l', 0.00014689217317770398, -31612.591872087483, -74.02294100343829)
+    ('l', 0.0001468921731777046, -31612.591872087392, -74.02294100343799)
     
     Notes
     -----
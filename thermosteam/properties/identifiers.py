@@ -22,6 +22,11 @@ __all__ = ('checkCAS', 'chemical_metadata_from_any', 'PubChem', 'MW',
            'name', 'synonyms', 'pubchem_db')
 import re
 import os
+import mmap
+import hashlib
+import numpy as np
+from .readers import get_data_cache_folder, load_cached_arrays, save_cached_arrays, CAS2int
+from ..utils.profiling import profiler
 from .elements import periodic_table, homonuclear_elemental_gases, charge_from_formula, serialize_formula
 
 folder = os.path.join('Data', 'Identifiers')
@@ -34,34 +39,6 @@ def spaceout_words(ID):
 def to_searchable_format(ID):    
     return spaceout_words(ID).replace('_', ' ')
 
-def CAS2int(i):
-    r"""Converts CAS number of a compounds from a string to an int. This is
-    helpful when storing large amounts of CAS numbers, as their strings take up
-    more memory than their numerical representational. All CAS numbers fit into
-    64 bit ints.
-
-    Parameters
-    ----------
-    CASRN : string
-        CASRN [-]
-
-    Returns
-    -------
-    CASRN : int
-        CASRN [-]
-
-    Notes
-    -----
-    Accomplishes conversion by removing dashes only, and then converting to an
-    int. An incorrect CAS number will change without exception.
-
-    Examples
-    --------
-    >>> CAS2int('7704-34-9')
-    7704349
-    """
-    return int(i.replace('-', ''))
-
 def int2CAS(i):
     r"""Converts CAS number of a compounds from an int to an string. This is
     helpful when dealing with int CAS numbers.
@@ -203,7 +180,169 @@ class ChemicalMetadata:
         return f"<{type(self).__name__}: {self.CASs}>"
         
 
+# %% Compiled identifier indices
+
+#: [str] Version of the binary format of identifier indices.
+identifier_index_version = '1'
+
+def hash_keys(keys):
+    """Return an array of 64-bit hashes of strings (the same across sessions)."""
+    blake2b = hashlib.blake2b
+    return np.frombuffer(b''.join([blake2b(i.encode(), digest_size=8).digest() for i in keys]), '<u8')
+
+
+class IdentifierIndex:
+    """
+    Create an IdentifierIndex object, a compiled index of a chemical 
+    identifiers file (with the PubChem CID, CAS number, formula, MW, SMILES, 
+    InChI, InChI key, IUPAC name, common name, and other names of a chemical
+    by line). Keys (integers for CAS numbers and PubChem CIDs, 64-bit hashes 
+    otherwise) are sorted along with their row numbers for binary search. 
+    The index is saved in the binary cache of data tables and memory mapped 
+    on load; records are only parsed from the (memory mapped) file when found.
+    
+    Parameters
+    ----------
+    file : str
+        Chemical identifiers file.
+    cache_folder : str, optional
+        Folder of the binary cache. Defaults to get_data_cache_folder(). If 
+        caching is disabled, the index is compiled in memory.
+    
+    Examples
+    --------
+    >>> index = IdentifierIndex(os.path.join(folder, 'chemical identifiers example user db.tsv'))
+    >>> rows = index.find('name', 'trans-1,4-diethylcyclohexane')
+    >>> rows
+    [2]
+    >>> index.metadata(rows[0])
+    <ChemicalMetadata: 13990-93-7>
+    
+    """
+    __slots__ = ('file', 'arrays', '_buffer')
+    
+    #: tuple[str] Kinds of keys.
+    kinds = ('CAS', 'pubchem', 'name', 'smiles', 'InChI', 'InChI_key', 'formula')
+    
+    #: dict[str, int] Column of keys by kind (all columns from the 8th are names).
+    columns = {'pubchem': 0, 'CAS': 1, 'formula': 2, 'smiles': 4, 
+               'InChI': 5, 'InChI_key': 6}
+    
+    def __init__(self, file, cache_folder=None):
+        self.file = file
+        with open(file, 'rb') as f:
+            try: self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError: self._buffer = b'' # Empty file
+        if cache_folder is None: cache_folder = get_data_cache_folder()
+        if cache_folder:
+            path_hash = hashlib.sha256(os.path.abspath(file).encode()).hexdigest()[:12]
+            folder = os.path.join(cache_folder, 'Identifiers', 
+                                  f"{os.path.basename(file)}.{path_hash}")
+            cached = load_cached_arrays(folder, file, identifier_index_version)
+            if cached: # Plain array views of the memory map are faster to search
+                self.arrays = {i: np.asarray(j) for i, j in cached[0].items()}
+                return
+        self.arrays = arrays = self.compile(self._buffer)
+        if cache_folder:
+            try: save_cached_arrays(folder, file, identifier_index_version, arrays)
+            except OSError: pass # Read only file system
+    
+    @classmethod
+    def compile(cls, buffer):
+        """Return a dictionary of index arrays from the contents of a chemical identifiers file."""
+        lines = bytes(buffer).split(b'\n')
+        if lines and not lines[-1]: lines.pop()
+        N = len(lines)
+        offsets = np.zeros(N + 1, np.int64)
+        np.cumsum([len(i) + 1 for i in lines], out=offsets[1:])
+        keys = {i: [] for i in cls.kinds}
+        name_rows = []
+        columns = cls.columns
+        for row, line in enumerate(lines):
+            values = line.decode().split('\t')
+            keys['pubchem'].append(int(values[0]))
+            keys['CAS'].append(CAS2int(values[1]))
+            for kind in ('formula', 'smiles', 'InChI', 'InChI_key'):
+                keys[kind].append(values[columns[kind]])
+            names = {i.lower() for i in values[7:]}
+            keys['name'].extend(names)
+            name_rows.extend([row] * len(names))
+        rows = np.arange(N)
+        arrays = {'offsets': offsets, 'CAS': np.array(keys['CAS'], np.int64)}
+        for kind in cls.kinds:
+            if kind in ('CAS', 'pubchem'):
+                kind_keys = np.array(keys[kind], np.int64)
+            else:
+                kind_keys = hash_keys(keys[kind])
+            kind_rows = np.array(name_rows, np.int64) if kind == 'name' else rows
+            order = np.argsort(kind_keys, kind='stable')
+            arrays[kind + '_keys'] = kind_keys[order]
+            arrays[kind + '_rows'] = kind_rows[order]
+        return arrays
+    
+    def values(self, row):
+        """Return the values of a record."""
+        offsets = self.arrays['offsets']
+        line = self._buffer[offsets[row]:offsets[row + 1]]
+        return line.decode().rstrip('\n').split('\t')
+    
+    def CAS(self, row):
+        """Return the CAS number (as an integer) of a record."""
+        return int(self.arrays['CAS'][row])
+    
+    def metadata(self, row):
+        """Return the ChemicalMetadata object of a record."""
+        values = self.values(row)
+        (pubchemid, CAS, formula, MW, smiles, InChI, InChI_key, iupac_name, common_name) = values[0:9]
+        metadata = ChemicalMetadata(int(pubchemid), CAS2int(CAS), formula, float(MW), smiles,
+                                    InChI, InChI_key, iupac_name, common_name)
+        metadata.all_names = values[7:]
+        return metadata
+    
+    @staticmethod
+    def query(kind, key):
+        """Return the sorted key to search for."""
+        return key if kind in ('CAS', 'pubchem') else hash_keys([key])[0]
+    
+    def find(self, kind, key, query=None):
+        """Return the rows (in order) of records with the key."""
+        arrays = self.arrays
+        keys = arrays[kind + '_keys']
+        if query is None: query = self.query(kind, key)
+        hashed = kind not in ('CAS', 'pubchem')
+        start = keys.searchsorted(query, 'left')
+        stop = keys.searchsorted(query, 'right')
+        rows = arrays[kind + '_rows'][start:stop].tolist()
+        if hashed and rows: # Rule out hash collisions
+            values = self.values
+            if kind == 'name':
+                rows = [i for i in rows if key in [j.lower() for j in values(i)[7:]]]
+            else:
+                column = self.columns[kind]
+                rows = [i for i in rows if values(i)[column] == key]
+        return rows
+    
+    def __repr__(self):
+        return f"{type(self).__name__}({self.file!r})"
+
+
 class ChemicalMetadataDB:
+    """
+    Create a ChemicalMetadataDB object for searching chemical metadata by
+    name, CAS number, formula, PubChem CID, SMILES, InChI, or InChI key. 
+    Elements are indexed in dictionaries; chemical identifiers files are 
+    compiled into memory mapped IdentifierIndex objects when needed (in 
+    reverse order). Metadata of a CAS number is taken from the first record 
+    with the CAS number. Names and CAS numbers are matched with the 
+    first record, while other identifiers are matched with the last record
+    (which defines its CAS number).
+    
+    Parameters
+    ----------
+    files : list[str], optional
+        Chemical identifiers files.
+    
+    """
     __slots__ = ('pubchem_index',
                  'smiles_index',
                  'InChI_index',
@@ -211,8 +350,14 @@ class ChemicalMetadataDB:
                  'name_index',
                  'CAS_index',
                  'formula_index',
+                 'indices',
+                 'metadata',
                  'unloaded_files',
     )
+    
+    #: tuple[str] Kinds of identifiers matched with the first record.
+    first_match_kinds = ('name', 'CAS')
+    
     def __init__(self, 
                  files=[os.path.join(folder, 'Anion db.tsv'),
                         os.path.join(folder, 'Cation db.tsv'),
@@ -226,7 +371,9 @@ class ChemicalMetadataDB:
         self.name_index = {}
         self.CAS_index = {}
         self.formula_index = {}
-        self.unloaded_files = files
+        self.indices = []
+        self.metadata = {}
+        self.unloaded_files = list(files)
         self.load_elements()
         
     def load_elements(self):
@@ -257,67 +404,90 @@ class ChemicalMetadataDB:
                 name_index[name] = obj    
 
     def load(self, file_name):
-        CAS_index = self.CAS_index
-        name_index = self.name_index
-        pubchem_index = self.pubchem_index
-        smiles_index = self.smiles_index
-        InChI_index = self.InChI_index
-        InChI_key_index = self.InChI_key_index
-        formula_index = self.formula_index
-        f = open(file_name)
-        for line in f:
-            # This is effectively the documentation for the file format of the file
-            values = line.rstrip('\n').split('\t')
-            (pubchemid, CAS, formula, MW, smiles, InChI, InChI_key, iupac_name, common_name) = values[0:9]
-            CAS = int(CAS.replace('-', '')) # Store as int for easier lookup
-            all_names = values[7:]
-            pubchemid = int(pubchemid)
-            if CAS in CAS_index:
-                obj = CAS_index[CAS]
-            else:
-                obj = ChemicalMetadata(pubchemid, CAS, formula, float(MW), smiles,
-                                       InChI, InChI_key, iupac_name, common_name)
-                CAS_index[CAS] = obj
-                pubchem_index[pubchemid] = obj
-                smiles_index[smiles] = obj
-                InChI_index[InChI] = obj
-                InChI_key_index[InChI_key] = obj
-                formula_index[formula] = obj
-            for name in all_names: 
-                name = name.lower()
-                if name not in name_index: name_index[name] = obj
-        f.close()
-    
-    def search_index(self, index, key):
-        try: return index[key]
-        except: 
-            files = self.unloaded_files
-            if files:
+        """Add the (compiled) index of a chemical identifiers file."""
+        with profiler.measure('identifiers ' + os.path.basename(file_name)):
+            self.indices.append(IdentifierIndex(file_name))
+    
+    def load_all(self):
+        """Add the indices of all unloaded files."""
+        files = self.unloaded_files
+        while files: self.load(files.pop())
+    
+    def iter_indices(self):
+        """Iterate over indices, loading files only as needed."""
+        indices = self.indices
+        files = self.unloaded_files
+        i = 0
+        while True:
+            if i < len(indices):
+                yield indices[i]
+                i += 1
+            elif files:
                 self.load(files.pop())
-                self.search_index(index, key)
+            else:
+                break
+    
+    def locate_CAS(self, CAS):
+        """Return the index and row of the first record of a CAS number 
+        (as an integer). The index is None for elements."""
+        if CAS in self.CAS_index: return None, None
+        for index in self.iter_indices():
+            rows = index.find('CAS', CAS)
+            if rows: return index, rows[0]
+        raise LookupError(CAS)
+    
+    def get_metadata(self, CAS):
+        """Return the ChemicalMetadata object of a CAS number (as an integer), 
+        or None if not in the database."""
+        try: return self.CAS_index[CAS]
+        except KeyError: pass
+        metadata = self.metadata
+        try: return metadata[CAS]
+        except KeyError: pass
+        try: index, row = self.locate_CAS(CAS)
+        except LookupError: return None
+        metadata[CAS] = obj = index.metadata(row)
+        return obj
+    
+    def search_index(self, kind, key):
+        if kind in self.first_match_kinds:
+            dct = getattr(self, kind + '_index')
+            if key in dct: return dct[key]
+            query = IdentifierIndex.query(kind, key)
+            for index in self.iter_indices():
+                rows = index.find(kind, key, query)
+                if rows: return self.get_metadata(index.CAS(rows[0]))
+        else:
+            self.load_all()
+            query = IdentifierIndex.query(kind, key)
+            for index in reversed(self.indices):
+                for row in reversed(index.find(kind, key, query)):
+                    if self.locate_CAS(index.CAS(row)) == (index, row):
+                        return self.get_metadata(index.CAS(row))
+            return getattr(self, kind + '_index').get(key)
     
     def search_pubchem(self, pubchem):
         pubchem = int(pubchem)
-        return self.search_index(self.pubchem_index, pubchem)
+        return self.search_index('pubchem', pubchem)
         
     def search_CAS(self, CAS):
         CAS = CAS2int(CAS)
-        return self.search_index(self.CAS_index, CAS)
+        return self.search_index('CAS', CAS)
 
     def search_smiles(self, smiles):
-        return self.search_index(self.smiles_index, smiles)
+        return self.search_index('smiles', smiles)
 
     def search_InChI(self, InChI):
-        return self.search_index(self.InChI_index, InChI)
+        return self.search_index('InChI', InChI)
 
     def search_InChI_key(self, InChI_key):
-        return self.search_index(self.InChI_key_index, InChI_key)
+        return self.search_index('InChI_key', InChI_key)
 
     def search_name(self, name):
-        return self.search_index(self.name_index, name)
+        return self.search_index('name', name)
     
     def search_formula(self, formula):
-        return self.search_index(self.formula_index, formula)
+        return self.search_index('formula', formula)
 
 
 pubchem_db = ChemicalMetadataDB()
@@ -31,15 +31,11 @@ __all__ = ['MagalhaesLJ_data', 'Stockmayer_methods', 'Stockmayer',
 'Neufeld_collision', 'collision_integral_Neufeld_Janzen_Aziz', 'As_collision',
 'Bs_collision', 'Cs_collision', 'collision_integral_Kim_Monroe', 'Tstar']
 
-import os
-import pandas as pd
 from math import exp, log, sin
 from .._constants import k
+from .readers import CASDataReader
 
-folder = os.path.join(os.path.dirname(__file__), 'Data/Viscosity')
-
-MagalhaesLJ_data = pd.read_csv(os.path.join(folder,
-                        'MagalhaesLJ.tsv'), sep='\t', index_col=0)
+MagalhaesLJ_data = CASDataReader('Viscosity')('MagalhaesLJ.tsv')
 
 
 FLYNN = 'Flynn (1960)'
@@ -127,7 +123,7 @@ def Stockmayer(Tm=None, Tb=None, Tc=None, Zc=None, omega=None,
     '''
     def list_methods():
         methods = []
-        if CASRN in MagalhaesLJ_data.index:
+        if CASRN in MagalhaesLJ_data:
             methods.append(MAGALHAES)
         if Tc and omega:
             methods.append(TEEGOTOSTEWARD2)
@@ -259,7 +255,7 @@ def molecular_diameter(Tc=None, Pc=None, Vc=None, Zc=None, omega=None,
     '''
     def list_methods():
         methods = []
-        if CASRN in MagalhaesLJ_data.index:
+        if CASRN in MagalhaesLJ_data:
             methods.append(MAGALHAES)
         if Tc and Pc and omega:
             methods.append(TEEGOTOSTEWARD4)
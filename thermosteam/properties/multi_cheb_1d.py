@@ -14,6 +14,8 @@
 # 2. The MIT open-source license. See
 # https://github.com/CalebBell/thermo/blob/master/LICENSE.txt for details.
 from bisect import bisect_left
+from numpy.polynomial import chebyshev
+import numpy as np
 
 __all__ = ('MultiCheb1D',)
 
@@ -21,16 +23,153 @@ class MultiCheb1D(object):
     """
     Simple class to store set of coefficients for multiple chebyshev 
     approximations and perform calculations from them.
+    
+    Parameters
+    ----------
+    points : 1d array
+        Breakpoints of all pieces, from the lower to the upper bound.
+    coeffs : list[1d array]
+        Chebyshev coefficients of each piece (with respect to the piece 
+        mapped to [-1, 1]).
+    max_relative_error=None : float, optional
+        Maximum relative error of the fit.
+    
+    Examples
+    --------
+    >>> import numpy as np
+    >>> f = MultiCheb1D.fit(np.exp, 0., 2., rtol=1e-9)
+    >>> f.max_relative_error < 1e-9
+    True
+    >>> round(f(1.), 9), round(f.derivative()(1.), 6)
+    (2.718281828, 2.718282)
+    >>> round(f.integrate(0., 2.), 9)
+    6.389056099
+    
     """
-    def __init__(self, points, coeffs):
-        self.points = points
-        self.coeffs = coeffs
+    __slots__ = ('points', 'coeffs', 'N', 'max_relative_error',
+                 '_inner_points', '_pieces', '_power_coeffs')
+    
+    def __init__(self, points, coeffs, max_relative_error=None):
+        self.points = points = np.asarray(points, dtype=float)
+        self.coeffs = coeffs = [np.asarray(i, dtype=float) for i in coeffs]
         self.N = len(points)-1
+        self.max_relative_error = max_relative_error
+        # Python floats and power series coefficients (highest degree first) 
+        # for fast scalar evaluation
+        points = points.tolist()
+        self._inner_points = points[1:-1]
+        self._pieces = [(points[i] + points[i + 1], 
+                         1. / (points[i + 1] - points[i]),
+                         chebyshev.cheb2poly(c).tolist()[::-1])
+                        for i, c in enumerate(coeffs)]
+        sizes = set([i.size for i in coeffs])
+        self._power_coeffs = (np.array([i[2] for i in self._pieces]) 
+                              if len(sizes) == 1 else None)
         
+    def __reduce__(self):
+        return MultiCheb1D, (self.points, self.coeffs, self.max_relative_error)
+    
+    @classmethod
+    def fit(cls, f, a, b, rtol=1e-6, degree=8, max_pieces=128):
+        """
+        Return a MultiCheb1D object fitted to `f` from `a` to `b`. Intervals 
+        are bisected until the relative error at points between nodes is 
+        less than `rtol` or `max_pieces` is reached.
+        
+        Parameters
+        ----------
+        f : function(x: 1d array) -> 1d array
+            Vectorized function to fit.
+        a, b : float
+            Lower and upper bound.
+        rtol=1e-6 : float, optional
+            Relative tolerance.
+        degree=8 : int, optional
+            Degree of polynomial of each piece.
+        max_pieces=128 : int, optional
+            Maximum number of pieces.
+            
+        """
+        nodes = np.cos(np.pi * (np.arange(degree + 1) + 0.5) / (degree + 1))
+        tests = np.linspace(-1., 1., 4 * degree + 3)[1:-1]
+        def fit_piece(a, b):
+            half = 0.5 * (b - a)
+            mid = 0.5 * (b + a)
+            c = chebyshev.chebfit(nodes, f(half * nodes + mid), degree)
+            y = f(half * tests + mid)
+            if not np.isfinite(y).all():
+                raise ValueError('function is not finite within interval')
+            error = np.abs(chebyshev.chebval(tests, c) - y)
+            scale = np.abs(y)
+            scale[scale < 1e-9 * scale.max()] = scale.max()
+            return c, (error / scale).max()
+        pieces = [(a, b, *fit_piece(a, b))]
+        while len(pieces) < max_pieces:
+            index = max(range(len(pieces)), key=lambda i: pieces[i][3])
+            a, b, c, error = pieces[index]
+            if error <= rtol: break
+            mid = 0.5 * (a + b)
+            pieces[index:index + 1] = [(a, mid, *fit_piece(a, mid)),
+                                       (mid, b, *fit_piece(mid, b))]
+        points = [pieces[0][0], *[i[1] for i in pieces]]
+        coeffs = [i[2] for i in pieces]
+        return cls(points, coeffs, max([i[3] for i in pieces]))
+    
     def __call__(self, x):
-        coeffs = self.coeffs[bisect_left(self.points, x)]
-        return coeffs(x)
-#        return self.chebval(x, coeffs)
+        ab, inverse_width, c = self._pieces[bisect_left(self._inner_points, x)]
+        x = (2. * x - ab) * inverse_width
+        y = 0.
+        for i in c: y = y * x + i
+        return y
+    
+    def evaluate_array(self, x):
+        """Return an array of values evaluated at each point in `x`."""
+        x = np.asarray(x, dtype=float)
+        points = self.points
+        index = np.searchsorted(points, x, 'left') - 1
+        index = index.clip(0, self.N - 1)
+        a = points[index]
+        b = points[index + 1]
+        t = (2. * x - a - b) / (b - a)
+        power_coeffs = self._power_coeffs
+        if power_coeffs is None:
+            y = np.empty_like(x)
+            for i in np.unique(index):
+                mask = index == i
+                y[mask] = chebyshev.chebval(t[mask], self.coeffs[i])
+        else:
+            c = power_coeffs[index]
+            y = c[..., 0]
+            for i in range(1, power_coeffs.shape[1]): y = y * t + c[..., i]
+        return y
+    
+    def derivative(self):
+        """Return a MultiCheb1D object of the derivative."""
+        points = self.points
+        coeffs = []
+        for i, c in enumerate(self.coeffs):
+            dc = chebyshev.chebder(c) * 2. / (points[i + 1] - points[i])
+            if dc.size < 2: dc = np.append(dc, 0.)
+            coeffs.append(dc)
+        return MultiCheb1D(points, coeffs)
+    
+    def antiderivative(self):
+        """Return a MultiCheb1D object of the antiderivative (zero at the 
+        lower bound)."""
+        points = self.points
+        coeffs = []
+        offset = 0.
+        for i, c in enumerate(self.coeffs):
+            ic = chebyshev.chebint(c, lbnd=-1.) * 0.5 * (points[i + 1] - points[i])
+            ic[0] += offset
+            offset = chebyshev.chebval(1., ic)
+            coeffs.append(ic)
+        return MultiCheb1D(points, coeffs)
+    
+    def integrate(self, a, b):
+        """Return the integral from `a` to `b`."""
+        F = self.antiderivative()
+        return F(b) - F(a)
                 
     @staticmethod
     def chebval(x, c):
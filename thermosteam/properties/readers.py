@@ -8,41 +8,517 @@ import os
 import numpy as np
 from collections.abc import Iterable
 from ..exceptions import InvalidMethod
+from ..utils.profiling import profiler
 from typing import Dict
 import pandas as pd
+from functools import partial
+import hashlib
+import shutil
 import json
 
 __all__ = ('load_json',
+           'CASDataReader',
            'CASDataSource', 
+           'LazyDataDict',
+           'get_user_cache_folder',
+           'get_data_cache_folder',
+           'clear_data_cache',
+           'CAS2int',
+           'CAS_key',
            'get_from_retrievers',
            'get_from_data_sources',
            'to_nums',
 )
 
+# %% Binary cache of data tables
+
+#: [str] Version of the binary format of cached data tables.
+data_cache_version = '1'
+
+def get_user_cache_folder():
+    """
+    Return the thermosteam folder in the user cache directory (i.e. 
+    $XDG_CACHE_HOME/thermosteam, defaulting to ~/.cache/thermosteam).
+    
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'thermosteam')
+
+def get_data_cache_folder():
+    """
+    Return the folder of the binary cache of data tables, or None if 
+    caching is disabled. Defaults to the "data" folder in the user cache 
+    directory (see get_user_cache_folder), so that read-only installs 
+    are also cached. The THERMOSTEAM_DATA_CACHE environment variable 
+    may be set to a custom folder, or to an empty string to disable caching.
+    
+    """
+    folder = os.environ.get('THERMOSTEAM_DATA_CACHE')
+    if folder is None: 
+        return os.path.join(get_user_cache_folder(), 'data')
+    else:
+        return folder or None
+
+def clear_data_cache():
+    """Remove the binary cache of data tables."""
+    folder = get_data_cache_folder()
+    if folder and os.path.isdir(folder): shutil.rmtree(folder, ignore_errors=True)
+
+def CAS2int(i):
+    r"""Converts CAS number of a compounds from a string to an int. This is
+    helpful when storing large amounts of CAS numbers, as their strings take up
+    more memory than their numerical representational. All CAS numbers fit into
+    64 bit ints.
+
+    Parameters
+    ----------
+    CASRN : string
+        CASRN [-]
+
+    Returns
+    -------
+    CASRN : int
+        CASRN [-]
+
+    Notes
+    -----
+    Accomplishes conversion by removing dashes only, and then converting to an
+    int. An incorrect CAS number will change without exception.
+
+    Examples
+    --------
+    >>> CAS2int('7704-34-9')
+    7704349
+    """
+    return int(i.replace('-', ''))
+
+def CAS_key(CAS):
+    """
+    Return the CAS number as an integer (see CAS2int) if it is a valid 
+    CAS number, or as is otherwise. Valid CAS numbers always end with two 
+    and one digit groups, so integer keys are unique.
+    
+    Examples
+    --------
+    >>> CAS_key('7732-18-5')
+    7732185
+    >>> CAS_key('Water')
+    'Water'
+    
+    """
+    try:
+        if CAS[-2] == CAS[-5] == '-': return CAS2int(CAS)
+    except: pass
+    return CAS
+
+def file_hash(path):
+    with open(path, 'rb') as f: return hashlib.sha256(f.read()).hexdigest()
+
+def write_json(path, data):
+    file = f"{path}.{os.getpid()}.tmp"
+    with open(file, 'w') as f: json.dump(data, f)
+    os.replace(file, path)
+
+def save_arrays(file, arrays):
+    """
+    Save arrays contiguously (with 8 byte alignment) in a binary file and 
+    return a dictionary of the data type, shape, and offset of each array.
+    
+    """
+    specs = {}
+    offset = 0
+    with open(file, 'wb') as f:
+        for name, array in arrays.items():
+            array = np.ascontiguousarray(array)
+            padding = -offset % 8
+            f.write(bytes(padding))
+            offset += padding
+            specs[name] = (array.dtype.str, array.shape, offset)
+            f.write(array.tobytes())
+            offset += array.nbytes
+    return specs
+
+def load_arrays(file, specs):
+    """Return a dictionary of read-only arrays memory mapped from a binary 
+    file saved with `save_arrays`."""
+    if not os.path.getsize(file): return {} # Nothing to memory map
+    buffer = np.memmap(file, np.uint8, 'r')
+    arrays = {}
+    for name, (dtype, shape, offset) in specs.items():
+        dtype = np.dtype(dtype)
+        size = dtype.itemsize * int(np.prod(shape))
+        arrays[name] = buffer[offset:offset + size].view(dtype).reshape(shape)
+    return arrays
+
+def load_cached_arrays(folder, source, key):
+    """
+    Return a tuple of a dictionary of arrays (memory mapped) and the 
+    metadata saved in the binary cache in `folder`, or None if the cache 
+    does not exist or is outdated. The cache is valid as long as the hash 
+    of the `source` file and the `key` are the same.
+    
+    """
+    meta_file = os.path.join(folder, 'meta.json')
+    try:
+        with open(meta_file) as f: meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if meta['version'] != data_cache_version or meta['key'] != key: return None
+    stat = os.stat(source)
+    if [stat.st_size, stat.st_mtime_ns] != meta['stat']:
+        if file_hash(source) != meta['hash']: return None
+        meta['stat'] = [stat.st_size, stat.st_mtime_ns]
+        try: write_json(meta_file, meta)
+        except OSError: pass
+    arrays = load_arrays(os.path.join(folder, 'arrays.bin'), meta['arrays'])
+    return arrays, meta
+
+def save_cached_arrays(folder, source, key, arrays, **meta):
+    """
+    Save a dictionary of arrays and metadata in the binary cache in 
+    `folder`, keyed by the hash of the `source` file and the `key`.
+    
+    """
+    stat = os.stat(source)
+    meta.update(version=data_cache_version,
+                key=key,
+                hash=file_hash(source),
+                stat=[stat.st_size, stat.st_mtime_ns])
+    # Write to a temporary folder and rename to avoid partially written 
+    # caches when several processes build the cache at the same time
+    parent, name = os.path.split(folder)
+    os.makedirs(parent, exist_ok=True)
+    temporary_folder = os.path.join(parent, f".{name}.{os.getpid()}.tmp")
+    shutil.rmtree(temporary_folder, ignore_errors=True)
+    os.makedirs(temporary_folder)
+    try:
+        meta['arrays'] = save_arrays(os.path.join(temporary_folder, 'arrays.bin'), arrays)
+        write_json(os.path.join(temporary_folder, 'meta.json'), meta)
+        shutil.rmtree(folder, ignore_errors=True)
+        os.rename(temporary_folder, folder)
+    finally:
+        shutil.rmtree(temporary_folder, ignore_errors=True)
+
+class TableColumns(dict):
+    """
+    Create a TableColumns object, a dictionary of column arrays by name 
+    of a cached table. String columns (saved as fixed width unicode 
+    arrays) are converted to object arrays (with NaN for missing values) 
+    only on first access.
+    
+    """
+    __slots__ = ('strings',)
+    
+    def __init__(self, columns, strings):
+        super().__init__(columns)
+        self.strings = strings #: dict[str, tuple(ndarray, ndarray)] Unconverted strings and null masks by name.
+    
+    def __missing__(self, name):
+        values, null = self.strings.pop(name)
+        self[name] = column = values.astype(object)
+        column[null] = np.nan
+        return column
+
+
+class CASTable:
+    """
+    Create a CASTable object that holds the columns of a data table as 
+    loaded from the binary cache (numerical columns are memory mapped). 
+    Rows are indexed by CAS key (see CAS_key) and a DataFrame object is 
+    only created on request.
+    
+    """
+    __slots__ = ('arrays', 'meta', 'rows', 'columns')
+    
+    def __init__(self, arrays, meta):
+        self.arrays = arrays
+        self.meta = meta
+        names = arrays['index']
+        CASs = arrays['CAS']
+        positions = arrays['CAS_positions']
+        # Fill in reverse so that the first of duplicate rows is kept
+        other = np.ones(names.size, bool)
+        other[positions] = False
+        rows = {str(names[i]): i for i in np.flatnonzero(other)[::-1].tolist()}
+        rows.update(zip(CASs[::-1].tolist(), positions[::-1].tolist()))
+        self.rows = rows
+        objects = arrays.get('object')
+        nulls = arrays.get('null')
+        columns = {}
+        strings = {}
+        for name, (kind, index) in zip(meta['columns'], meta['kinds']):
+            if kind == 'object':
+                strings[name] = (objects[:, index], nulls[:, index])
+            elif kind == 'float':
+                columns[name] = arrays[kind][:, index]
+            else:
+                columns[name] = arrays[kind][:, index].astype(float)
+        self.columns = TableColumns(columns, strings)
+    
+    @property
+    def index(self):
+        """[pandas.Index] CAS numbers."""
+        return pd.Index(self.arrays['index'].astype(object), name=self.meta['index_name'])
+    
+    def to_df(self):
+        """Return a DataFrame object of the table (with the original data types)."""
+        arrays = self.arrays
+        columns = self.columns
+        data = {}
+        for name, (kind, index) in zip(self.meta['columns'], self.meta['kinds']):
+            data[name] = columns[name] if kind == 'object' else arrays[kind][:, index]
+        return pd.DataFrame(data, index=self.index)
+
+
+def load_cached_table(folder, source, key):
+    """
+    Return a CASTable object loaded from the binary cache in `folder`, 
+    or None if the cache does not exist or is outdated. The cache is valid 
+    as long as the hash of the `source` file and the read `key` are the same.
+    
+    """
+    cached = load_cached_arrays(folder, source, key)
+    if cached is None: return None
+    return CASTable(*cached)
+
+def save_cached_table(folder, source, key, df):
+    """
+    Save the DataFrame object as a binary column store in `folder` (one 
+    2-d array by data type, string columns as fixed width unicode arrays, 
+    and a sorted integer CAS index, all in one memory mappable file). Return whether the table was cached; 
+    tables with index or column values that are not strings, numbers, or 
+    NaN are not cached.
+    
+    """
+    isa = isinstance
+    index = df.index
+    if index.dtype != object or not all([isa(i, str) for i in index]): return False
+    kinds = []
+    kind_columns = {}
+    for name in df.columns:
+        column = df[name]
+        dtype = column.dtype
+        if dtype == object:
+            values = column.values
+            null = pd.isnull(values)
+            if not all([isa(i, str) for i in values[~null]]): return False
+            kind = 'object'
+            values = np.where(null, '', values).astype(str)
+        elif dtype.kind in 'fib':
+            kind = {'f': 'float', 'i': 'int', 'b': 'bool'}[dtype.kind]
+            values = column.values
+        else:
+            return False
+        if kind in kind_columns:
+            kind_columns[kind].append(values)
+        else:
+            kind_columns[kind] = [values]
+        kinds.append((kind, len(kind_columns[kind]) - 1))
+    arrays = {i: np.array(j).transpose() for i, j in kind_columns.items()}
+    if 'object' in arrays: 
+        arrays['null'] = np.array([pd.isnull(df[name].values) for name, (kind, _) 
+                                   in zip(df.columns, kinds) if kind == 'object']).transpose()
+    CASs = [CAS_key(i) for i in index]
+    CASs = np.array([i if isinstance(i, int) else -1 for i in CASs], dtype=np.int64)
+    positions = np.flatnonzero(CASs >= 0)
+    order = positions[np.argsort(CASs[positions], kind='stable')]
+    arrays['index'] = np.array(index, dtype=str)
+    arrays['CAS'] = CASs[order]
+    arrays['CAS_positions'] = order
+    save_cached_arrays(folder, source, key, arrays,
+                       index_name=index.name,
+                       columns=[str(i) for i in df.columns],
+                       kinds=kinds)
+    return True
+
+
 # %% Readers
 
+def describe_loader(loader):
+    """Return a short description of a data loader (for profiling)."""
+    if isinstance(loader, partial):
+        func = loader.func
+        args = loader.args
+        if isinstance(getattr(func, '__self__', None), CASDataReader):
+            return f"{os.path.basename(func.__self__.folder)}/{args[0]}"
+        elif func is load_json:
+            return f"{os.path.basename(args[0])}/{args[1]}"
+        else:
+            loader = func
+    else:
+        closure = getattr(loader, '__closure__', None)
+        args = [i.cell_contents for i in closure] if closure else ()
+    name = getattr(loader, '__qualname__', None)
+    if name is None: return repr(loader)
+    args = [(i.__name__ if isinstance(i, type) else str(i)) for i in args
+            if isinstance(i, (str, int, float, type))]
+    if args: name += f"({', '.join(args)})"
+    return name
+
+float_dtype = np.dtype(float)
+
 class CASDataReader:
-    __slots__ = ('folder',)
-    def __init__(self, folder, data_folder=os.path.join(os.path.dirname(__file__), 'Data')):
+    """
+    Create a CASDataReader object that reads data tables in a data folder 
+    as CASDataSource objects. Tables are only parsed on first access. 
+    Tables are cached in a binary column store (memory mapped on load) on 
+    the first read, which is invalidated when the hash of the source file 
+    changes.
+    
+    Parameters
+    ----------
+    folder : str
+        Name of folder within the data folder.
+    data_folder : str, optional
+        Defaults to the data folder of thermosteam.
+    cache_folder : str, optional
+        Folder of the binary cache. Defaults to get_data_cache_folder().
+    
+    """
+    __slots__ = ('folder', 'cache_folder')
+    def __init__(self, folder, data_folder=os.path.join(os.path.dirname(__file__), 'Data'),
+                 cache_folder=None):
         self.folder = os.path.join(data_folder, folder)
+        if cache_folder is None: cache_folder = get_data_cache_folder()
+        self.cache_folder = cache_folder and os.path.join(cache_folder, folder)
         
     def __call__(self, file, sep='\t', index_col=0,  **kwargs):
+        return CASDataSource(loader=partial(self.load, file, sep, index_col, **kwargs))
+        
+    def load(self, file, sep='\t', index_col=0,  **kwargs):
+        """Return a CASTable object of the data table if it is cached, or
+        a DataFrame object otherwise."""
         path = os.path.join(self.folder, file)
+        cache_folder = self.cache_folder
+        if cache_folder:
+            folder = os.path.join(cache_folder, file)
+            key = repr((sep, index_col, sorted(kwargs.items())))
+            table = load_cached_table(folder, path, key)
+            if table is not None: return table
         df = pd.read_csv(path,
                          sep=sep, index_col=index_col,
                          engine='python', **kwargs)
-        return CASDataSource(df)
+        if cache_folder:
+            try: save_cached_table(folder, path, key, df)
+            except OSError: pass # Read only file system
+        return df
+    
+    def read(self, file, sep='\t', index_col=0,  **kwargs):
+        """Return a DataFrame object of the data table."""
+        data = self.load(file, sep, index_col, **kwargs)
+        return data.to_df() if isinstance(data, CASTable) else data
 
 class CASDataSource:
-    __slots__ = ('df', 'index', 'values')
+    """
+    Create a CASDataSource object for retrieving data by CAS number. If 
+    a `loader` is given instead of a DataFrame object, the data is loaded 
+    on first access. Lookups use a hash index of integer CAS numbers to 
+    rows and typed columns (float for numerical data) rather than 
+    the DataFrame object. Tables loaded from the binary cache are used 
+    as is (memory mapped) and the DataFrame object is only created if 
+    requested.
+    
+    Parameters
+    ----------
+    df : pandas.DataFrame, optional
+        Data indexed by CAS number.
+    loader : function() -> pandas.DataFrame or CASTable, optional
+        Loads data on first access.
+    
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> df = pd.DataFrame({'Tb': [373.124, 351.39], 'Name': ['water', 'ethanol']}, 
+    ...                   index=['7732-18-5', '64-17-5'])
+    >>> source = CASDataSource(df)
+    >>> '64-17-5' in source
+    True
+    >>> source.retrieve_value('64-17-5', 'Tb')
+    351.39
+    >>> source.retrieve('7732-18-5', ['Tb', 'Name'])
+    [373.124, 'water']
+    >>> source.at['64-17-5', 'Name']
+    'ethanol'
+    >>> source.retrieve_many(['64-17-5', '50-00-0', '7732-18-5'], ['Tb'])
+    array([[351.39 ],
+           [    nan],
+           [373.124]])
+    
+    """
+    __slots__ = ('_df', '_table', '_rows', '_columns', '_values', '_loader')
+    
+    def __init__(self, df=None, loader=None):
+        self._loader = loader
+        self._df = self._table = self._rows = self._columns = self._values = None
+        if df is not None: self._load_df(df)
+    
+    def _load_table(self, table):
+        self._rows = table.rows
+        self._columns = table.columns
+        self._table = table
+    
+    def _load_df(self, df):
+        rows = {}
+        for row, CAS in reversed([*enumerate(df.index)]): rows[CAS_key(CAS)] = row
+        columns = {}
+        for name in df.columns:
+            column = df[name].values
+            if column.dtype.kind in 'biuf': 
+                column = column.astype(float, copy=False)
+            else:
+                column = column.astype(object, copy=False)
+            columns[name] = column
+        self._rows = rows
+        self._columns = columns
+        self._df = df
     
-    def __init__(self, df):
-        self.df = df
-        self.index = df.index
-        self.values = df.values
+    @property
+    def loaded(self):
+        """[bool] Whether data is loaded."""
+        return self._rows is not None
+    
+    def load(self):
+        """Load data if not yet loaded."""
+        if self._rows is None: 
+            with profiler.measure('table ' + describe_loader(self._loader)):
+                data = self._loader()
+                if isinstance(data, CASTable):
+                    self._load_table(data)
+                else:
+                    self._load_df(data)
+    
+    @property
+    def df(self):
+        """[pandas.DataFrame] All data."""
+        if self._rows is None: self.load()
+        df = self._df
+        if df is None: self._df = df = self._table.to_df()
+        return df
+    @property
+    def index(self):
+        """[pandas.Index] CAS numbers."""
+        if self._rows is None: self.load()
+        df = self._df
+        return self._table.index if df is None else df.index
+    @property
+    def values(self):
+        """[numpy.ndarray] All data values."""
+        values = self._values
+        if values is None: self._values = values = self.df.values
+        return values
+    @property
+    def rows(self):
+        """[dict] Row numbers by CAS number key (see CAS_key)."""
+        if self._rows is None: self.load()
+        return self._rows
+    @property
+    def columns(self):
+        """[dict] Typed column arrays by name."""
+        if self._rows is None: self.load()
+        return self._columns
     
     def retriever(self, key):
-        return CASDataRetriever(self.df, key)
+        return CASDataRetriever(self, key)
     
     def retrieve(self, CASRN, key):
         if isinstance(key, str):
@@ -53,40 +529,156 @@ class CASDataSource:
             raise ValueError('key must be a string or an iterable of strings')
     
     def retrieve_value(self, CASRN, key):
-        df = self.df
-        if CASRN in df.index:
-            value = df.at[CASRN, key]
+        if self._rows is None: self.load()
+        row = self._rows.get(CAS_key(CASRN))
+        if row is None: return None
+        column = self._columns[key]
+        value = column[row]
+        if column.dtype is float_dtype:
+            return None if value != value else float(value)
+        else:
             try: return None if np.isnan(value) else float(value)
             except: return value
-        else:
-            return None    
+    
+    def retrieve_many(self, CASRNs, keys):
+        """
+        Return a 2-d array of values with a row for each CAS number and 
+        a column for each key. Missing values are NaN (or None for 
+        columns that are not numerical).
+        
+        """
+        if self._rows is None: self.load()
+        if isinstance(keys, str): keys = (keys,)
+        get = self._rows.get
+        rows = np.array([get(CAS_key(i), -1) for i in CASRNs], dtype=int)
+        found = rows >= 0
+        rows = rows[found]
+        columns = [self._columns[i] for i in keys]
+        numerical = all([i.dtype is float_dtype for i in columns])
+        values = np.full([found.size, len(columns)], np.nan, 
+                         dtype=float if numerical else object)
+        for j, column in enumerate(columns): values[found, j] = column[rows]
+        if not numerical: values[pd.isnull(values)] = None
+        return values
     
     @property
     def at(self):
-        return self.df.at
+        return CASDataIndexer(self)
     
     def __getitem__(self, CAS):
-        return self.values[self.index.get_loc(CAS)]
+        if self._rows is None: self.load()
+        try:
+            row = self._rows[CAS_key(CAS)]
+        except KeyError:
+            raise KeyError(CAS) from None
+        return self.values[row]
     
     def __contains__(self, CAS):
-        return CAS in self.index
+        if self._rows is None: self.load()
+        return CAS_key(CAS) in self._rows
+    
+
+class CASDataIndexer:
+    """Get values of a CASDataSource object by CAS number and key like `pandas.DataFrame.at`."""
+    __slots__ = ('source',)
     
+    def __init__(self, source):
+        self.source = source
+        
+    def __getitem__(self, CAS_key_pair):
+        source = self.source
+        CAS, key = CAS_key_pair
+        try:
+            row = source.rows[CAS_key(CAS)]
+        except KeyError:
+            raise KeyError(CAS) from None
+        return source.columns[key][row]
+
 
 class CASDataRetriever:
-    __slots__ = ('df', 'key')
+    __slots__ = ('source', 'key')
     
-    def __init__(self, df, key):
-        self.df = df
+    def __init__(self, source, key):
+        self.source = source
         self.key = key
         
     def __call__(self, CASRN):
-        df = self.df
-        if CASRN in df.index:
-            value = df.at[CASRN, self.key]
-            try: return None if np.isnan(value) else float(value)
-            except: return value
+        return self.source.retrieve_value(CASRN, self.key)
+
+class LazyDataDict:
+    """
+    Create a LazyDataDict object, a read-only dictionary that is loaded 
+    on first access.
+    
+    Parameters
+    ----------
+    loader : function() -> dict
+        Loads data on first access.
+    
+    Examples
+    --------
+    >>> data = LazyDataDict(lambda: {'7732-18-5': 'Water'})
+    >>> data.loaded
+    False
+    >>> data['7732-18-5']
+    'Water'
+    >>> data.loaded
+    True
+    
+    """
+    __slots__ = ('_data', '_loader')
+    
+    def __init__(self, loader):
+        self._loader = loader
+        self._data = None
+    
+    @property
+    def loaded(self):
+        """[bool] Whether data is loaded."""
+        return self._data is not None
+    
+    def load(self):
+        """Load data if not yet loaded."""
+        if self._data is None: 
+            with profiler.measure('data ' + describe_loader(self._loader)):
+                self._data = self._loader()
+    
+    @property
+    def data(self):
+        """[dict] All data."""
+        if self._data is None: self.load()
+        return self._data
+    
+    def __getitem__(self, key):
+        return self.data[key]
+    
+    def __contains__(self, key):
+        return key in self.data
+    
+    def __iter__(self):
+        return iter(self.data)
+    
+    def __len__(self):
+        return len(self.data)
+    
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+    
+    def keys(self):
+        return self.data.keys()
+    
+    def values(self):
+        return self.data.values()
+    
+    def items(self):
+        return self.data.items()
+    
+    def __repr__(self):
+        if self._data is None:
+            return f"<{type(self).__name__} (not loaded)>"
         else:
-            return None
+            return f"<{type(self).__name__} ({len(self._data)} items)>"
+
 
 CASDataSources = Dict[str, CASDataSource]
 CASDataRetrievers = Dict[str, CASDataRetriever]
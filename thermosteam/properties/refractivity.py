@@ -16,18 +16,14 @@
 """
 All data and methods for estimating a chemical's refractivity.
 """
-import os
-import pandas as pd
+from .readers import CASDataReader
 from .._constants import N_A, pi
 
 __all__ = ['CRC_RI_organic', 'RI_methods', 'refractive_index', 
            'polarizability_from_RI', 'molar_refractivity_from_RI', 
            'RI_from_molar_refractivity']
 
-folder = os.path.join(os.path.dirname(__file__), 'Data/Misc')
-
-CRC_RI_organic = pd.read_csv(os.path.join(folder, 'CRC Handbook Organic RI.csv'),
-                             sep='\t', index_col=0)
+CRC_RI_organic = CASDataReader('Misc')('CRC Handbook Organic RI.csv')
 
 CRC = 'CRC'
 NONE = 'NONE'
@@ -87,7 +83,7 @@ def refractive_index(CASRN, T=None, AvailableMethods=False, Method=None,
     '''
     def list_methods():
         methods = []
-        if CASRN in CRC_RI_organic.index:
+        if CASRN in CRC_RI_organic:
             methods.append(CRC)
         methods.append(NONE)
         return methods
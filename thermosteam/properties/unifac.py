@@ -24,7 +24,9 @@ __all__ = ('DDBST_UNIFAC_assignments',
            'DortmundGroupCounts',
            'PSRKGroupCounts')
 import os
+from functools import partial
 from .data import load_json
+from .readers import LazyDataDict
 
 # %% Data
 
@@ -833,11 +835,10 @@ def keys2int(x):
 
 folder = os.path.join(os.path.dirname(__file__), 'Data')
 folder = os.path.join(folder, 'UNIFAC')
-UFIP = load_json(folder, 'UNIFAC original interaction parameters.json', keys2int)
-DOUFIP2016 = load_json(folder, 'UNIFAC modified Dortmund interaction parameters.json', keys2int)
-NISTUFIP = load_json(folder, 'UNIFAC modified NIST 2015 interaction parameters.json', keys2int)
-PSRKIP = load_json(folder, 'PSRK interaction parameters.json', keys2int)
-del keys2int
+UFIP = LazyDataDict(partial(load_json, folder, 'UNIFAC original interaction parameters.json', keys2int))
+DOUFIP2016 = LazyDataDict(partial(load_json, folder, 'UNIFAC modified Dortmund interaction parameters.json', keys2int))
+NISTUFIP = LazyDataDict(partial(load_json, folder, 'UNIFAC modified NIST 2015 interaction parameters.json', keys2int))
+PSRKIP = LazyDataDict(partial(load_json, folder, 'PSRK interaction parameters.json', keys2int))
 
 
 # %% Assignments
@@ -906,11 +907,17 @@ class GroupAssigner:
     def __setitem__(self, key, count):
         self.group_counts[key] = count
 
-data = load_json(folder, 'DDBST UNIFAC-original assignments.json')
-DDBST_UNIFAC_assignments = {i: UNIFACGroupCounts.from_dict(j) for i,j in data.items()}
-data = load_json(folder, 'DDBST UNIFAC-Dortmund assignments.json')
-DDBST_MODIFIED_UNIFAC_assignments = {i: DortmundGroupCounts.from_dict(j) for i,j in data.items()}
-data = load_json(folder, 'DDBST UNIFAC-original assignments.json')
-DDBST_PSRK_assignments = {i: PSRKGroupCounts.from_dict(j) for i,j in data.items()}
-del data
+def load_assignments(file, GroupCounts):
+    data = load_json(folder, file)
+    return {i: GroupCounts.from_dict(j) for i,j in data.items()}
+
+DDBST_UNIFAC_assignments = LazyDataDict(
+    partial(load_assignments, 'DDBST UNIFAC-original assignments.json', UNIFACGroupCounts)
+)
+DDBST_MODIFIED_UNIFAC_assignments = LazyDataDict(
+    partial(load_assignments, 'DDBST UNIFAC-Dortmund assignments.json', DortmundGroupCounts)
+)
+DDBST_PSRK_assignments = LazyDataDict(
+    partial(load_assignments, 'DDBST UNIFAC-original assignments.json', PSRKGroupCounts)
+)
 
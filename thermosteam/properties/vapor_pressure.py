@@ -49,7 +49,7 @@ References
 
 """
 from ..base import functor, TDependentHandleBuilder
-from .dippr import DIPPR_EQ101
+from .dippr import DIPPR_EQ101, DIPPR_EQ101_derivative_by_T
 from math import log, exp
 import numpy as np
 from .data import (Psat_data_WagnerMcGarry,
@@ -119,6 +119,12 @@ def Antoine(T, a, b, c):
     """
     return 10.0**(a - b / (T + c))
 
+@functor
+def Antoine_derivative_by_T(T, a, b, c):
+    """T-Derivative of the Antoine equation."""
+    Tc = T + c
+    return 2.302585092994046 * b / (Tc * Tc) * 10.0**(a - b / Tc)
+
 @functor(var='Psat')
 def TRC_Extended_Antoine(T, Tc, to, a, b, c, n, e, f):
     r"""
@@ -221,6 +227,15 @@ def Wagner_McGraw(T, Tc, Pc, a, b, c, d):
     tau = 1.0 - Tr
     return Pc * exp((a * tau + b * tau**1.5 + c * tau**3 + d * tau**6) / Tr)
 
+@functor
+def Wagner_McGraw_derivative_by_T(T, Tc, Pc, a, b, c, d):
+    """T-Derivative of the Wagner-McGraw equation."""
+    Tr = T / Tc
+    tau = 1.0 - Tr
+    f = (a * tau + b * tau**1.5 + c * tau**3 + d * tau**6)
+    df = a + 1.5 * b * tau**0.5 + 3. * c * tau**2 + 6. * d * tau**5
+    return -Pc * exp(f / Tr) * (df * Tr + f) / (Tc * Tr * Tr)
+
 @functor(var='Psat')
 def Wagner(T, Tc, Pc, a, b, c, d):
     r"""
@@ -271,6 +286,15 @@ def Wagner(T, Tc, Pc, a, b, c, d):
     τ = 1.0 - Tr
     return Pc * exp((a*τ + b*τ**1.5 + c*τ**2.5 + d*τ**5) / Tr)
 
+@functor
+def Wagner_derivative_by_T(T, Tc, Pc, a, b, c, d):
+    """T-Derivative of the Wagner equation."""
+    Tr = T / Tc
+    τ = 1.0 - Tr
+    f = a*τ + b*τ**1.5 + c*τ**2.5 + d*τ**5
+    df = a + 1.5*b*τ**0.5 + 2.5*c*τ**1.5 + 5.*d*τ**4
+    return -Pc * exp(f / Tr) * (df * Tr + f) / (Tc * Tr * Tr)
+
 @functor(var='Psat')
 def Boiling_Critical_Relation(T, Tb, Tc, Pc):
     r"""
@@ -310,6 +334,12 @@ def Boiling_Critical_Relation(T, Tb, Tc, Pc):
     h, Tbr = calculate_Boiling_Critical_Relation_term(Tb, Tc, Pc)
     return exp(h * (1 - Tc / T)) * Pc
 
+@functor
+def Boiling_Critical_Relation_derivative_by_T(T, Tb, Tc, Pc):
+    """T-Derivative of the boiling-critical relation."""
+    h, Tbr = calculate_Boiling_Critical_Relation_term(Tb, Tc, Pc)
+    return exp(h * (1 - Tc / T)) * Pc * h * Tc / (T * T)
+
 def calculate_Boiling_Critical_Relation_term(Tb, Tc, Pc):
     Tbr = Tb / Tc
     h = Tbr * log(Pc / 101325.0) / (1 - Tbr)
@@ -523,6 +553,19 @@ def Edalat(T, Tc, Pc, ω):
     lnPr = (a * τ + b * τ**1.5 + c * τ**3.0 + d * τ**6.0) / (1.0 - τ)
     return exp(lnPr) * Pc
 
+derivatives_by_T = {
+    Antoine: Antoine_derivative_by_T,
+    Wagner_McGraw: Wagner_McGraw_derivative_by_T,
+    Wagner: Wagner_derivative_by_T,
+    Boiling_Critical_Relation: Boiling_Critical_Relation_derivative_by_T,
+    DIPPR_EQ101: DIPPR_EQ101_derivative_by_T,
+}
+
+def Psat_functors(F, data):
+    f = F.from_args(data)
+    return {'evaluate': f,
+            'derivative_by_T': derivatives_by_T[F].from_other(f)}
+
 @TDependentHandleBuilder('Psat')
 def vapor_pressure_handle(handle, CAS, Tb, Tc, Pc, omega):
     add_model = handle.add_model
@@ -530,13 +573,13 @@ def vapor_pressure_handle(handle, CAS, Tb, Tc, Pc, omega):
         _, a, b, c, d, Pc, Tc, Tmin = Psat_data_WagnerMcGarry[CAS]
         Tmax = Tc
         data = (Tc, Pc, a, b, c, d)
-        add_model(Wagner_McGraw.from_args(data), Tmin, Tmax)
+        add_model(**Psat_functors(Wagner_McGraw, data), Tmin=Tmin, Tmax=Tmax)
     elif CAS in Psat_data_Wagner:
         _, a, b, c, d, Tc, Pc, Tmin, Tmax = Psat_data_Wagner[CAS]
         # Some Tmin values are missing; Arbitrary choice of 0.1 lower limit
         if np.isnan(Tmin): Tmin = Tmax * 0.1
         data = (Tc, Pc, a, b, c, d)
-        add_model(Wagner_McGraw.from_args(data), Tmin, Tmax)
+        add_model(**Psat_functors(Wagner_McGraw, data), Tmin=Tmin, Tmax=Tmax)
     if CAS in Psat_data_AntoineExtended:
         _, a, b, c, Tc, to, n, e, f, Tmin, Tmax = Psat_data_AntoineExtended[CAS]
         data = (Tc, to, a, b, c, n, e, f)
@@ -544,18 +587,18 @@ def vapor_pressure_handle(handle, CAS, Tb, Tc, Pc, omega):
     if CAS in Psat_data_Antoine:
         _, a, b, c, Tmin, Tmax = Psat_data_Antoine[CAS]
         data = (a, b, c)
-        add_model(Antoine.from_args(data), Tmin, Tmax)
+        add_model(**Psat_functors(Antoine, data), Tmin=Tmin, Tmax=Tmax)
     if CAS in Psat_data_Perrys2_8:
         _, C1, C2, C3, C4, C5, Tmin, Tmax = Psat_data_Perrys2_8[CAS]
         data = (C1, C2, C3, C4, C5)
-        add_model(DIPPR_EQ101.from_args(data), Tmin, Tmax)
+        add_model(**Psat_functors(DIPPR_EQ101, data), Tmin=Tmin, Tmax=Tmax)
     if CAS in Psat_data_VDI_PPDS_3:
         _, Tm, Tc, Pc, a, b, c, d = Psat_data_VDI_PPDS_3[CAS]
         data = (Tc, Pc, a, b, c, d)
-        add_model(Wagner.from_args(data), 0., Tc,)
+        add_model(**Psat_functors(Wagner, data), Tmin=0., Tmax=Tc)
     data = (Tb, Tc, Pc)
     if all(data):
-        add_model(Boiling_Critical_Relation.from_args(data), 0., Tc)
+        add_model(**Psat_functors(Boiling_Critical_Relation, data), Tmin=0., Tmax=Tc)
     data = (Tc, Pc, omega)
     if all(data):
         for f in (Lee_Kesler, Ambrose_Walton, Sanjari, Edalat):
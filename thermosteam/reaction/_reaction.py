@@ -25,8 +25,28 @@ def react_stream_adiabatically(stream, reaction):
     reaction(stream)
     stream.H = Hnet - stream.Hf
 
+def react_streams_adiabatically(reaction, material, T, P, phases, X):
+    isa = isinstance
+    if isa(material, tmo.StreamArray):
+        streams = material
+    elif isa(material, np.ndarray):
+        streams = tmo.StreamArray(material, phases, T, P)
+    else:
+        raise ValueError('batch reaction material must be either a 2d array or a StreamArray object')
+    Hnet = streams.Hnet
+    reaction.react_batch(streams, X)
+    converged = streams.solve_T(Hnet - streams.Hf)
+    if streams is not material: material[:] = streams.mol
+    return streams.T, converged
+
 def check_material_feasibility(material: np.ndarray):
-    if (material < 0.).any(): raise InfeasibleRegion('not enough reactants; reaction conversion')
+    infeasible = material < 0.
+    if infeasible.any():
+        if material.ndim == 2:
+            rows = np.flatnonzero(infeasible.any(1))
+            raise InfeasibleRegion(f'not enough reactants in {rows.size} row(s) '
+                                   f'(first at index {rows[0]}); reaction conversion')
+        raise InfeasibleRegion('not enough reactants; reaction conversion')
 
 def set_reaction_basis(rxn, basis):
     if basis != rxn._basis:
@@ -56,6 +76,31 @@ def as_material_array(material, basis, chemicals):
     else:
         raise ValueError('reaction material must be either an array or a stream')
 
+def react_material_matrix(reaction, material, X, check):
+    # React each row of a 2d material array (or the streams of a StreamArray object)
+    isa = isinstance
+    if isa(material, tmo.StreamArray):
+        assert material.chemicals is reaction._chemicals, "reaction and stream chemicals do not match"
+        basis = reaction._basis
+        if basis == 'mol':
+            material_array = material.mol
+            reaction._reaction_batch(material_array, X)
+        elif basis == 'wt':
+            MW = reaction._chemicals.MW
+            material_array = material.mol * MW
+            reaction._reaction_batch(material_array, X)
+            material.mol[:] = material_array / MW
+        else:
+            raise ValueError("basis must be either 'mol' or 'wt'")
+    elif isa(material, np.ndarray):
+        if material.ndim != 2:
+            raise ValueError('batch reaction material must be a 2d array')
+        material_array = material
+        reaction._reaction_batch(material_array, X)
+    else:
+        raise ValueError('batch reaction material must be either a 2d array or a StreamArray object')
+    if check: check_material_feasibility(material_array)
+
 @chemicals_user
 class Reaction:
     """
@@ -289,6 +334,40 @@ class Reaction:
                                            self._chemicals)
         self._reaction(material_array)
     
+    def react_batch(self, material, X=None):
+        """
+        React each row of a 2d material array (N streams by chemicals) or 
+        each stream of a StreamArray object in place.
+        
+        Parameters
+        ----------
+        material : 2d array or StreamArray
+            Material to react (by weight if the basis is 'wt').
+        X : float or 1d array, optional
+            Conversion of all rows or of each row. Defaults to the 
+            reaction conversion.
+        
+        Examples
+        --------
+        >>> import numpy as np
+        >>> import thermosteam as tmo
+        >>> import thermosteam.reaction as rxn
+        >>> tmo.settings.set_thermo(['H2', 'O2', 'H2O'])
+        >>> reaction = rxn.Reaction('2H2 + O2 -> 2H2O', reactant='H2', X=0.7)
+        >>> material = np.array([[10., 20., 1000.],
+        ...                      [5., 5., 0.]])
+        >>> reaction.react_batch(material)
+        >>> material
+        array([[   3.  ,   16.5 , 1007.  ],
+               [   1.5 ,    3.25,    3.5 ]])
+        >>> reaction.react_batch(material, X=[0., 1.])
+        >>> material
+        array([[   3. ,   16.5, 1007. ],
+               [   0. ,    2.5,    5. ]])
+        
+        """
+        react_material_matrix(self, material, X, tmo.reaction.CHECK_FEASIBILITY)
+    
     def product_yield(self, product, basis=None):
         """Return yield of product per reactant."""
         product_index = self._chemicals.index(product)
@@ -356,9 +435,62 @@ class Reaction:
         """
         react_stream_adiabatically(stream, self)
     
+    def adiabatic_reaction_batch(self, material, T=298.15, P=101325., phases='l', X=None):
+        """
+        React many streams adiabatically, accounting for the change in 
+        enthalpy due to the heat of reaction. Outlet temperatures of all 
+        streams are solved at once with a vectorized Newton method.
+        
+        Parameters
+        ----------
+        material : StreamArray or 2d array
+            Streams or molar flow rates of each stream [kmol/hr] to react in place.
+        T : float or 1d array, optional
+            Temperature of all streams or of each stream [K] (only used with 
+            a 2d array). Defaults to 298.15.
+        P : float or 1d array, optional
+            Pressure of all streams or of each stream [Pa] (only used with 
+            a 2d array). Defaults to 101325.
+        phases : str or Iterable[str], optional
+            Phase of all streams or of each stream (only used with a 2d 
+            array). Defaults to 'l'.
+        X : float or array, optional
+            Conversion of all streams or of each stream. Defaults to the 
+            reaction conversion.
+        
+        Returns
+        -------
+        T : 1d array
+            Temperature of each stream after reaction [K].
+        converged : 1d array[bool]
+            Whether the temperature of each stream converged (streams that 
+            do not converge are left at their initial temperature).
+        
+        Examples
+        --------
+        >>> import thermosteam as tmo
+        >>> import thermosteam.reaction as rxn
+        >>> tmo.settings.set_thermo(['H2', 'O2', 'H2O'])
+        >>> reaction = rxn.Reaction('2H2 + O2 -> 2H2O', reactant='H2', X=0.7)
+        >>> streams = tmo.StreamArray([[10, 20, 1000], [20, 20, 1000]])
+        >>> T, converged = reaction.adiabatic_reaction_batch(streams)
+        >>> T.round(2), converged
+        (array([324.11, 349.76]), array([ True,  True]))
+        >>> streams.mol
+        array([[   3. ,   16.5, 1007. ],
+               [   6. ,   13. , 1014. ]])
+        
+        """
+        return react_streams_adiabatically(self, material, T, P, phases, X)
+    
     def _reaction(self, material_array):
         material_array += material_array[self._X_index] * self.X * self._stoichiometry
     
+    def _reaction_batch(self, material_array, X):
+        if X is None: X = self.X
+        reacted = material_array[:, self._X_index] * np.asarray(X, float)
+        material_array += reacted[:, np.newaxis] * self._stoichiometry
+    
     @property
     def dH(self):
         """
@@ -580,6 +712,8 @@ class ReactionSet:
                  '_chemicals')
 
     copy = Reaction.copy
+    react_batch = Reaction.react_batch
+    adiabatic_reaction_batch = Reaction.adiabatic_reaction_batch
     _get_stoichiometry_by_mol = Reaction._get_stoichiometry_by_mol
     _get_stoichiometry_by_wt = Reaction._get_stoichiometry_by_wt
     
@@ -756,6 +890,10 @@ class ParallelReaction(ReactionSet):
 
     def _reaction(self, material_array):
         material_array += material_array[self._X_index] * self.X @ self._stoichiometry
+    
+    def _reaction_batch(self, material_array, X):
+        if X is None: X = self._X
+        material_array += material_array[:, self._X_index] * X @ self._stoichiometry
 
     def reduce(self):
         """
@@ -858,7 +996,7 @@ class SeriesReaction(ReactionSet):
         >>> reaction.adiabatic_reaction(s2)
         >>> s2.show() # After adiabatic reaction
         Stream: s2
-         phase: 'l', T: 326.12 K, P: 101325 Pa
+         phase: 'l', T: 326.15 K, P: 101325 Pa
          flow (kmol/hr): CH4  1.5
                          CO   3.15
                          O2   94.6
@@ -874,6 +1012,11 @@ class SeriesReaction(ReactionSet):
     def _reaction(self, material_array):
         for i, j, k in zip(self._X_index, self.X, self._stoichiometry):
             material_array += material_array[i] * j * k
+    
+    def _reaction_batch(self, material_array, X):
+        X = self._X if X is None else np.asarray(X, float)
+        for n, (i, k) in enumerate(zip(self._X_index, self._stoichiometry)):
+            material_array += (material_array[:, i] * X[..., n])[:, np.newaxis] * k
 
     @property
     def X_net(self):
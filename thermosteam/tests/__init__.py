@@ -19,6 +19,10 @@ __all__ = ('test_chemical',
            'test_multi_stream',
            'test_reaction',
            'test_equilibrium',
+           'test_stream_array',
+           'test_chemical_cache',
+           'test_mixture',
+           'test_profiling',
            'test_thermosteam',
 )
 
@@ -50,7 +54,24 @@ def test_equilibrium():
     testmod(tmo.equilibrium.bubble_point)
     testmod(tmo.equilibrium.dew_point)
     testmod(tmo.equilibrium.vle)
+    testmod(tmo.equilibrium.batch_vle)
     testmod(tmo.equilibrium.lle)
+
+def test_stream_array():
+    from thermosteam import _stream_array
+    testmod(_stream_array)
+
+def test_chemical_cache():
+    from thermosteam import _chemical_cache
+    testmod(_chemical_cache)
+
+def test_mixture():
+    from thermosteam.mixture import mixture
+    testmod(mixture)
+
+def test_profiling():
+    from thermosteam.utils import profiling
+    testmod(profiling)
     
 def test_thermosteam():
     test_chemical()
@@ -60,4 +81,8 @@ def test_thermosteam():
     test_stream()
     test_multi_stream()
     test_reaction()
-    test_equilibrium()
\ No newline at end of file
+    test_equilibrium()
+    test_stream_array()
+    test_chemical_cache()
+    test_mixture()
+    test_profiling()
\ No newline at end of file
@@ -17,6 +17,7 @@ from . import model_variables
 from . import registry
 from . import colors
 from . import plots
+from . import profiling
 
 __all__ = (*pickle.__all__,
            *representation.__all__,
@@ -28,6 +29,7 @@ __all__ = (*pickle.__all__,
            *registry.__all__,
            *colors.__all__,
            *plots.__all__,
+           *profiling.__all__,
 )
 
 from .pickle import *
@@ -39,4 +41,5 @@ from .assertions import *
 from .model_variables import *
 from .registry import *
 from .colors import *
-from .plots import *
\ No newline at end of file
+from .plots import *
+from .profiling import *
\ No newline at end of file
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020, Yoel Cortes-Pena <yoelcortes@gmail.com>
+#
+# This module is under the UIUC open-source license. See
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+import os
+import json
+import atexit
+import tracemalloc
+from time import perf_counter
+from functools import wraps
+from contextlib import contextmanager
+
+__all__ = ('Profiler', 'profiler', 'profiled')
+
+class Profiler:
+    """
+    Create a Profiler object that records the wall time and net memory
+    allocated (through tracemalloc) of named operations, such as data table
+    loads and Chemical construction phases. Times are inclusive of nested
+    operations. The global `profiler` is enabled through `settings.profile`
+    or the THERMOSTEAM_PROFILE environment variable (set to 1, or to a JSON
+    file to dump records to at exit).
+
+    Parameters
+    ----------
+    enabled : bool, optional
+        Whether to record operations. Defaults to False.
+    memory : bool, optional
+        Whether to record memory allocated. Defaults to True.
+
+    Examples
+    --------
+    >>> from thermosteam.utils import Profiler
+    >>> profiler = Profiler(enabled=True, memory=False)
+    >>> with profiler.measure('sum'): total = sum(range(100))
+    >>> profiler.records['sum']['count']
+    1
+    >>> print(profiler.report()) # doctest: +SKIP
+    Profile                     count   time [ms]    max [ms]  memory [MB]
+    sum                             1       0.003       0.003            -
+
+    """
+    __slots__ = ('_enabled', '_memory', 'records')
+
+    def __init__(self, enabled=False, memory=True):
+        self._enabled = self._memory = False
+        self.records = {}
+        if enabled: self.enable(memory)
+
+    @property
+    def enabled(self):
+        """[bool] Whether operations are recorded."""
+        return self._enabled
+
+    @property
+    def memory(self):
+        """[bool] Whether memory allocated is recorded."""
+        return self._memory
+
+    def enable(self, memory=True):
+        """Start recording operations (and memory allocated, which starts tracemalloc)."""
+        if memory and not tracemalloc.is_tracing(): tracemalloc.start()
+        self._memory = bool(memory)
+        self._enabled = True
+
+    def disable(self):
+        """Stop recording operations."""
+        if self._memory and tracemalloc.is_tracing(): tracemalloc.stop()
+        self._enabled = self._memory = False
+
+    def reset(self):
+        """Remove all records."""
+        self.records.clear()
+
+    def record(self, name, time, memory=None):
+        """Add a measurement of an operation."""
+        records = self.records
+        if name in records:
+            record = records[name]
+            record['count'] += 1
+            record['time'] += time
+            if time > record['max_time']: record['max_time'] = time
+            if memory is not None: record['memory'] = (record['memory'] or 0.) + memory
+        else:
+            records[name] = {'count': 1, 'time': time, 'max_time': time, 'memory': memory}
+
+    @contextmanager
+    def measure(self, name):
+        """Return a context manager that records the operation within (if enabled)."""
+        if not self._enabled:
+            yield
+            return
+        memory = self._memory and tracemalloc.is_tracing()
+        if memory: start_memory = tracemalloc.get_traced_memory()[0]
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            time = perf_counter() - start
+            self.record(name, time, (tracemalloc.get_traced_memory()[0] - start_memory) / 1e6
+                                    if memory else None)
+
+    def sorted_records(self):
+        """Return a list of name-record pairs sorted by total time (descending)."""
+        return sorted(self.records.items(), key=lambda i: i[1]['time'], reverse=True)
+
+    def report(self, N=None):
+        """Return a report of the `N` (all by default) most time consuming operations."""
+        records = self.sorted_records()
+        if N is not None: records = records[:N]
+        width = max([27, *[len(i) for i, _ in records]])
+        lines = [f"{'Profile':{width}} {'count':>5} {'time [ms]':>11} {'max [ms]':>11} {'memory [MB]':>12}"]
+        for name, record in records:
+            memory = record['memory']
+            memory = '-' if memory is None else f"{memory:.3f}"
+            lines.append(f"{name:{width}} {record['count']:>5} {1e3 * record['time']:>11.3f} "
+                         f"{1e3 * record['max_time']:>11.3f} {memory:>12}")
+        return '\n'.join(lines)
+
+    def show(self, N=None):
+        """Print a report of the `N` (all by default) most time consuming operations."""
+        print(self.report(N))
+
+    def to_json(self, file=None):
+        """Return records (sorted by total time; in seconds and MB) as a JSON string, or dump them to a file."""
+        records = dict(self.sorted_records())
+        if file is None: return json.dumps(records, indent=1)
+        with open(file, 'w') as f: json.dump(records, f, indent=1)
+
+    def __repr__(self):
+        return f"<{type(self).__name__}: {'enabled' if self._enabled else 'disabled'}>"
+
+
+def profiled(name):
+    """Decorate a function to be recorded by the global profiler under a given name."""
+    def decorator(f):
+        @wraps(f)
+        def profiled_function(*args, **kwargs):
+            if profiler._enabled:
+                with profiler.measure(name): return f(*args, **kwargs)
+            else:
+                return f(*args, **kwargs)
+        return profiled_function
+    return decorator
+
+#: [Profiler] Global profiler of data table loads and chemical construction.
+profiler = Profiler()
+
+def enable_from_environment():
+    value = os.environ.get('THERMOSTEAM_PROFILE', '')
+    if value.lower() in ('', '0', 'false'): return
+    profiler.enable()
+    if value.lower().endswith('.json'): atexit.register(profiler.to_json, value)
+
+enable_from_environment()